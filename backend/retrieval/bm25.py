@@ -0,0 +1,506 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import uuid
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from rag_system.backend.settings import (
+    RAG_BM25_INDEX_PATH,
+    RAG_BM25_K1,
+    RAG_BM25_B,
+    RAG_BM25_MATRIX_CACHE_SIZE,
+)
+
+log = logging.getLogger(__name__)
+
+
+def tokenize(text: str) -> list[str]:
+    # Same whitespace tokenization as langchain's BM25Retriever default
+    return text.split()
+
+
+def get_ids_checksum(ids: list[str]) -> int:
+    """
+    Order-independent 64-bit checksum of a set of document ids.
+
+    The XOR of per-id hashes, so adding or removing an id updates it in
+    place and two collections with the same size but different chunks
+    still disagree.
+    """
+    checksum = 0
+    for doc_id in ids:
+        checksum ^= int.from_bytes(
+            hashlib.blake2b(
+                doc_id.encode("utf-8", "surrogatepass"), digest_size=8
+            ).digest(),
+            "big",
+            signed=True,
+        )
+    return checksum
+
+
+class BM25Matrix:
+    """
+    Term-document matrix of a collection with BM25 weights baked in.
+
+    Row t of the CSR matrix is the posting list of term t, already holding
+    idf(t) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl)), so a
+    batch of queries is scored with a single sparse product that only
+    touches the rows of the query terms.
+    """
+
+    def __init__(self, ids: list[str], vocabulary: dict[str, int], weights: csr_matrix):
+        self.ids = ids
+        self.vocabulary = vocabulary
+        self.weights = weights
+
+    def search(
+        self, queries: list[str], limit: int
+    ) -> list[list[tuple[str, float]]]:
+        rows, cols = [], []
+        for row, query in enumerate(queries):
+            for term in tokenize(query):
+                col = self.vocabulary.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+
+        # Repeated query terms are summed, as in rank_bm25
+        query_matrix = csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(queries), len(self.vocabulary)),
+        )
+        scores = (query_matrix @ self.weights).tocsr()
+
+        results = []
+        for row in range(len(queries)):
+            start, end = scores.indptr[row], scores.indptr[row + 1]
+            doc_indices = scores.indices[start:end]
+            doc_scores = scores.data[start:end]
+
+            if len(doc_scores) > limit:
+                top = np.argpartition(-doc_scores, limit - 1)[:limit]
+                doc_indices, doc_scores = doc_indices[top], doc_scores[top]
+            order = np.argsort(-doc_scores, kind="stable")
+
+            results.append(
+                [
+                    (self.ids[doc_indices[idx]], float(doc_scores[idx]))
+                    for idx in order
+                    if doc_scores[idx] > 0
+                ]
+            )
+        return results
+
+
+class BM25Index:
+    """
+    Persistent, incrementally updated BM25 inverted index.
+
+    Every collection keeps its own posting lists in a single SQLite file so
+    that hybrid search never re-tokenizes the whole collection per query.
+    Scoring runs on a BM25Matrix loaded from those postings, cached in
+    memory under the collection's version, which every write replaces, so
+    writes from other processes sharing the file invalidate it too.
+    """
+
+    # Columns added to bm25_collection after its first release
+    _COLLECTION_COLUMNS = {
+        "ids_checksum": "INTEGER NOT NULL DEFAULT 0",
+        "version": "TEXT NOT NULL DEFAULT ''",
+    }
+
+    def __init__(
+        self,
+        path: str,
+        k1: float = 1.5,
+        b: float = 0.75,
+        matrix_cache_size: int = 32,
+    ):
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.matrix_cache_size = matrix_cache_size
+        self._lock = threading.RLock()
+        self._matrices: OrderedDict[str, tuple[str, BM25Matrix]] = OrderedDict()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS bm25_collection (
+                name TEXT PRIMARY KEY,
+                enriched INTEGER NOT NULL DEFAULT 0,
+                doc_count INTEGER NOT NULL DEFAULT 0,
+                total_length INTEGER NOT NULL DEFAULT 0,
+                ids_checksum INTEGER NOT NULL DEFAULT 0,
+                version TEXT NOT NULL DEFAULT ''
+            );
+            CREATE TABLE IF NOT EXISTS bm25_document (
+                collection TEXT NOT NULL,
+                id TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                metadata TEXT,
+                PRIMARY KEY (collection, id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS bm25_posting (
+                collection TEXT NOT NULL,
+                term TEXT NOT NULL,
+                id TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (collection, term, id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS bm25_posting_doc_idx
+                ON bm25_posting (collection, id);
+            """
+        )
+        # Indexes written by older versions lack the newer columns; their
+        # default values never match a collection, so they are rebuilt
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(bm25_collection)")
+        }
+        for column, definition in self._COLLECTION_COLUMNS.items():
+            if column not in columns:
+                self._conn.execute(
+                    f"ALTER TABLE bm25_collection ADD COLUMN {column} {definition}"
+                )
+        self._conn.commit()
+
+    def get_stats(self, collection_name: str) -> Optional[dict]:
+        """Return the stored document count and enrichment flag of a collection."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT enriched, doc_count, total_length, ids_checksum "
+                "FROM bm25_collection WHERE name = ?",
+                (collection_name,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "enriched": bool(row[0]),
+            "doc_count": row[1],
+            "total_length": row[2],
+            "ids_checksum": row[3],
+        }
+
+    def is_current(
+        self, collection_name: str, ids: list[str], enriched: bool = False
+    ) -> bool:
+        """Check whether the stored index holds exactly the given documents."""
+        stats = self.get_stats(collection_name)
+        return (
+            stats is not None
+            and stats["doc_count"] == len(ids)
+            and stats["enriched"] == enriched
+            and stats["ids_checksum"] == get_ids_checksum(ids)
+        )
+
+    def _add(
+        self,
+        collection_name: str,
+        ids: list[str],
+        texts: list[str],
+        metadatas: Optional[list[dict]],
+    ) -> None:
+        documents = []
+        postings = []
+        total_length = 0
+        for idx, (doc_id, text) in enumerate(zip(ids, texts)):
+            tokens = tokenize(text or "")
+            total_length += len(tokens)
+            metadata = metadatas[idx] if metadatas else None
+            documents.append(
+                (
+                    collection_name,
+                    doc_id,
+                    len(tokens),
+                    json.dumps(metadata, default=str) if metadata else None,
+                )
+            )
+            postings.extend(
+                (collection_name, term, doc_id, tf)
+                for term, tf in Counter(tokens).items()
+            )
+
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO bm25_document VALUES (?, ?, ?, ?)", documents
+        )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO bm25_posting VALUES (?, ?, ?, ?)", postings
+        )
+        self._update_counts(
+            collection_name, len(documents), total_length, get_ids_checksum(ids)
+        )
+
+    def _update_counts(
+        self, collection_name: str, doc_count: int, total_length: int, checksum: int
+    ) -> None:
+        # Negative counts remove documents; SQLite has no XOR operator, so
+        # the id checksum is toggled with (a | b) & ~(a & b). A fresh version
+        # invalidates the matrices cached by every process.
+        self._conn.execute(
+            "UPDATE bm25_collection SET doc_count = doc_count + ?, "
+            "total_length = total_length + ?, "
+            "ids_checksum = (ids_checksum | ?) & ~(ids_checksum & ?), "
+            "version = ? WHERE name = ?",
+            (
+                doc_count,
+                total_length,
+                checksum,
+                checksum,
+                uuid.uuid4().hex,
+                collection_name,
+            ),
+        )
+
+    def add(
+        self,
+        collection_name: str,
+        ids: list[str],
+        texts: list[str],
+        metadatas: Optional[list[dict]] = None,
+        enriched: bool = False,
+    ) -> None:
+        """Add documents to the index of a collection, creating it if needed."""
+        with self._lock:
+            self._matrices.pop(collection_name, None)
+            try:
+                stats = self.get_stats(collection_name)
+                if stats is not None and stats["enriched"] != enriched:
+                    # Mixed tokenization would skew scores, rebuild lazily instead
+                    self._delete_collection(collection_name)
+                    self._conn.commit()
+                    return
+
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO bm25_collection (name, enriched) VALUES (?, ?)",
+                    (collection_name, int(enriched)),
+                )
+                self._delete_ids(collection_name, ids)
+                self._add(collection_name, ids, texts, metadatas)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def build(
+        self,
+        collection_name: str,
+        ids: list[str],
+        texts: list[str],
+        metadatas: Optional[list[dict]] = None,
+        enriched: bool = False,
+    ) -> None:
+        """Replace the index of a collection with the given documents."""
+        with self._lock:
+            self._matrices.pop(collection_name, None)
+            try:
+                self._delete_collection(collection_name)
+                self._conn.execute(
+                    "INSERT INTO bm25_collection (name, enriched) VALUES (?, ?)",
+                    (collection_name, int(enriched)),
+                )
+                self._add(collection_name, ids, texts, metadatas)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        log.info(f"bm25:build {collection_name} with {len(ids)} documents")
+
+    def _delete_ids(self, collection_name: str, ids: list[str]) -> None:
+        if not ids:
+            return
+
+        rows = []
+        for i in range(0, len(ids), 500):
+            batch = ids[i : i + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                self._conn.execute(
+                    f"SELECT id, length FROM bm25_document WHERE collection = ? "
+                    f"AND id IN ({placeholders})",
+                    (collection_name, *batch),
+                ).fetchall()
+            )
+        if not rows:
+            return
+
+        self._conn.executemany(
+            "DELETE FROM bm25_posting WHERE collection = ? AND id = ?",
+            [(collection_name, doc_id) for doc_id, _ in rows],
+        )
+        self._conn.executemany(
+            "DELETE FROM bm25_document WHERE collection = ? AND id = ?",
+            [(collection_name, doc_id) for doc_id, _ in rows],
+        )
+        self._update_counts(
+            collection_name,
+            -len(rows),
+            -sum(length for _, length in rows),
+            get_ids_checksum([doc_id for doc_id, _ in rows]),
+        )
+
+    def delete(
+        self,
+        collection_name: str,
+        ids: Optional[list[str]] = None,
+        filter: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Delete documents from a collection index by ids or metadata filter."""
+        with self._lock:
+            self._matrices.pop(collection_name, None)
+            try:
+                if ids:
+                    self._delete_ids(collection_name, ids)
+                elif filter:
+                    matched_ids = []
+                    for doc_id, metadata in self._conn.execute(
+                        "SELECT id, metadata FROM bm25_document WHERE collection = ?",
+                        (collection_name,),
+                    ):
+                        metadata = json.loads(metadata) if metadata else {}
+                        if all(
+                            str(metadata.get(key)) == str(value)
+                            for key, value in filter.items()
+                        ):
+                            matched_ids.append(doc_id)
+                    self._delete_ids(collection_name, matched_ids)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def _delete_collection(self, collection_name: str) -> None:
+        self._conn.execute(
+            "DELETE FROM bm25_posting WHERE collection = ?", (collection_name,)
+        )
+        self._conn.execute(
+            "DELETE FROM bm25_document WHERE collection = ?", (collection_name,)
+        )
+        self._conn.execute(
+            "DELETE FROM bm25_collection WHERE name = ?", (collection_name,)
+        )
+
+    def delete_collection(self, collection_name: str) -> None:
+        """Drop the whole index of a collection."""
+        with self._lock:
+            self._matrices.pop(collection_name, None)
+            self._delete_collection(collection_name)
+            self._conn.commit()
+
+    def reset(self) -> None:
+        """Drop every collection index."""
+        with self._lock:
+            self._matrices.clear()
+            self._conn.execute("DELETE FROM bm25_posting")
+            self._conn.execute("DELETE FROM bm25_document")
+            self._conn.execute("DELETE FROM bm25_collection")
+            self._conn.commit()
+
+    def _get_version(self, collection_name: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT version FROM bm25_collection WHERE name = ?", (collection_name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _load_matrix(
+        self, collection_name: str
+    ) -> tuple[Optional[str], Optional[BM25Matrix]]:
+        # One read transaction, so the version matches the postings read
+        self._conn.execute("BEGIN")
+        try:
+            version = self._get_version(collection_name)
+            documents = self._conn.execute(
+                "SELECT id, length FROM bm25_document WHERE collection = ?",
+                (collection_name,),
+            ).fetchall()
+            postings = self._conn.execute(
+                "SELECT term, id, tf FROM bm25_posting WHERE collection = ?",
+                (collection_name,),
+            ).fetchall()
+        finally:
+            self._conn.commit()
+        if version is None or not documents:
+            return version, None
+
+        ids = [doc_id for doc_id, _ in documents]
+        positions = {doc_id: idx for idx, doc_id in enumerate(ids)}
+        lengths = np.fromiter(
+            (length for _, length in documents), dtype=np.float32, count=len(ids)
+        )
+
+        vocabulary: dict[str, int] = {}
+        rows, cols, tfs = [], [], []
+        for term, doc_id, tf in postings:
+            rows.append(vocabulary.setdefault(term, len(vocabulary)))
+            cols.append(positions[doc_id])
+            tfs.append(tf)
+
+        rows = np.asarray(rows, dtype=np.int32)
+        cols = np.asarray(cols, dtype=np.int32)
+        tfs = np.asarray(tfs, dtype=np.float32)
+
+        doc_count = len(ids)
+        avgdl = float(lengths.mean()) or 1.0
+        df = np.bincount(rows, minlength=len(vocabulary)).astype(np.float32)
+        # Non-negative (Lucene) idf so very common terms never lower a score
+        idf = np.log1p((doc_count - df + 0.5) / (df + 0.5))
+        norms = self.k1 * (1 - self.b + self.b * lengths / avgdl)
+        data = idf[rows] * tfs * (self.k1 + 1) / (tfs + norms[cols])
+
+        weights = csr_matrix(
+            (data.astype(np.float32), (rows, cols)),
+            shape=(len(vocabulary), doc_count),
+        )
+        return version, BM25Matrix(ids, vocabulary, weights)
+
+    def get_matrix(self, collection_name: str) -> Optional[BM25Matrix]:
+        """Return the scoring matrix of a collection, loading it if needed."""
+        with self._lock:
+            entry = self._matrices.get(collection_name)
+            if entry is not None and entry[0] == self._get_version(collection_name):
+                self._matrices.move_to_end(collection_name)
+                return entry[1]
+
+            self._matrices.pop(collection_name, None)
+            version, matrix = self._load_matrix(collection_name)
+            if matrix is not None and self.matrix_cache_size > 0:
+                self._matrices[collection_name] = (version, matrix)
+                while len(self._matrices) > self.matrix_cache_size:
+                    self._matrices.popitem(last=False)
+            return matrix
+
+    def search_many(
+        self, collection_name: str, queries: list[str], limit: int
+    ) -> list[list[tuple[str, float]]]:
+        """Score a batch of queries against a collection in one sparse product."""
+        if not queries or limit <= 0:
+            return [[] for _ in queries]
+
+        matrix = self.get_matrix(collection_name)
+        if matrix is None:
+            return [[] for _ in queries]
+        return matrix.search(queries, limit)
+
+    def search(
+        self, collection_name: str, query: str, limit: int
+    ) -> list[tuple[str, float]]:
+        """Score the documents of a collection against a single query."""
+        return self.search_many(collection_name, [query], limit)[0]
+
+
+BM25_INDEX = BM25Index(
+    RAG_BM25_INDEX_PATH,
+    k1=RAG_BM25_K1,
+    b=RAG_BM25_B,
+    matrix_cache_size=RAG_BM25_MATRIX_CACHE_SIZE,
+)
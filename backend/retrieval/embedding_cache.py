@@ -0,0 +1,361 @@
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Hashable, Optional, Sequence
+
+import numpy as np
+
+from rag_system.backend.retrieval.rerank_cache import hash_text
+from rag_system.backend.settings import (
+    RAG_CHUNK_EMBEDDING_CACHE_PATH,
+    RAG_CHUNK_EMBEDDING_CACHE_SIZE_MB,
+    RAG_QUERY_EMBEDDING_CACHE_SIZE,
+    RAG_QUERY_EMBEDDING_CACHE_TTL,
+)
+
+log = logging.getLogger(__name__)
+
+# SQLite's default bound parameter limit is 999
+_LOOKUP_BATCH = 500
+
+# Bumped whenever the stored vector encoding changes (1: float32)
+_CHUNK_EMBEDDING_FORMAT = 1
+
+
+def wrap_embedding_function(
+    cache,
+    get_key: Callable[[Optional[str], str], Hashable],
+    embedding_function: Callable[..., Awaitable],
+) -> Callable[..., Awaitable]:
+    """
+    Put an embedding cache in front of an async embedding function.
+
+    cache provides enabled, get_many(keys) (None for misses) and
+    set_many(keys, embeddings); get_key maps (prefix, text) to a cache key.
+    """
+
+    async def cached_embedding_function(query, prefix=None, user=None):
+        if not cache.enabled or not query:
+            return await embedding_function(query, prefix=prefix, user=user)
+
+        texts = [query] if isinstance(query, str) else list(query)
+        keys = [get_key(prefix, text) for text in texts]
+        embeddings = cache.get_many(keys)
+
+        # Embed each distinct uncached text once
+        missing = {}
+        for idx, (key, embedding) in enumerate(zip(keys, embeddings)):
+            if embedding is None:
+                missing.setdefault(key, idx)
+
+        if missing:
+            if isinstance(query, str):
+                new_embeddings = [
+                    await embedding_function(query, prefix=prefix, user=user)
+                ]
+            else:
+                new_embeddings = await embedding_function(
+                    [texts[idx] for idx in missing.values()],
+                    prefix=prefix,
+                    user=user,
+                )
+
+            if (
+                not isinstance(new_embeddings, list)
+                or len(new_embeddings) != len(missing)
+                or any(embedding is None for embedding in new_embeddings)
+            ):
+                # Embedding failed, pass the backend's answer through
+                # uncached when nothing else was served from the cache
+                if len(missing) == len(texts):
+                    return (
+                        new_embeddings[0]
+                        if isinstance(query, str) and new_embeddings
+                        else new_embeddings
+                    )
+                return None
+
+            cache.set_many(list(missing), new_embeddings)
+            embedded = dict(zip(missing, new_embeddings))
+            embeddings = [
+                embedded[key] if embedding is None else embedding
+                for key, embedding in zip(keys, embeddings)
+            ]
+
+        log.debug(
+            f"{type(cache).__name__}: {len(texts) - len(missing)} cached, "
+            f"{len(missing)} embedded"
+        )
+        return embeddings[0] if isinstance(query, str) else embeddings
+
+    return cached_embedding_function
+
+
+class QueryEmbeddingCache:
+    """
+    Bounded LRU/TTL cache of text embeddings.
+
+    Embeddings are keyed by (engine, model, prefix, text hash), so re-asked
+    questions and re-scored chunks are not sent to the embedding backend
+    again. Texts are hashed verbatim: the cached vector is always the one
+    the backend returned for exactly that input.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[list[float], float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get_many(self, keys: Sequence[tuple]) -> list[Optional[list[float]]]:
+        now = self._clock()
+        embeddings = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and (not self.ttl or now - entry[1] < self.ttl):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    embeddings.append(entry[0])
+                    continue
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                embeddings.append(None)
+        return embeddings
+
+    def set_many(
+        self, keys: Sequence[tuple], embeddings: Sequence[list[float]]
+    ) -> None:
+        now = self._clock()
+        with self._lock:
+            for key, embedding in zip(keys, embeddings):
+                self._entries[key] = (embedding, now)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def wrap(
+        self,
+        engine: str,
+        model: str,
+        embedding_function: Callable[..., Awaitable],
+    ) -> Callable[..., Awaitable]:
+        """
+        Wrap an async embedding function so only uncached texts are embedded.
+
+        The wrapper keeps the (query, prefix=None, user=None) signature and
+        accepts a single text or a list of texts, like the function it wraps.
+        """
+        return wrap_embedding_function(
+            self,
+            lambda prefix, text: (engine, model, prefix, hash_text(text)),
+            embedding_function,
+        )
+
+
+class ChunkEmbeddingStore:
+    """
+    Persistent content-addressed store of chunk embeddings.
+
+    Vectors are stored as float32 blobs in SQLite under the sha256 of
+    (engine, model, prefix, text), so re-uploads, reindexing and rebuilt
+    web-search collections only send new chunks to the embedding provider.
+    float32 is what the vector DBs keep, so a reused vector is stored
+    exactly as a freshly embedded one would be. Once the stored vectors
+    exceed max_bytes, the least recently used are evicted.
+    """
+
+    def __init__(
+        self, path: str, max_bytes: int, clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # Opened on first use, so a disabled store never touches the disk
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chunk_embedding (
+                    key TEXT PRIMARY KEY,
+                    used_at REAL NOT NULL,
+                    vector BLOB NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS chunk_embedding_used_idx "
+                "ON chunk_embedding (used_at)"
+            )
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _CHUNK_EMBEDDING_FORMAT:
+                # Vectors of an older encoding cannot be decoded anymore
+                conn.execute("DELETE FROM chunk_embedding")
+                conn.execute(f"PRAGMA user_version = {_CHUNK_EMBEDDING_FORMAT}")
+            conn.commit()
+            self._bytes = conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM chunk_embedding"
+            ).fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def get_key(engine: str, model: str, prefix: Optional[str], text: str) -> str:
+        return hashlib.sha256(
+            "\0".join([engine, model, prefix or "", text]).encode(
+                "utf-8", "surrogatepass"
+            )
+        ).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> list[Optional[list[float]]]:
+        distinct = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            conn = self._get_conn()
+            for start in range(0, len(distinct), _LOOKUP_BATCH):
+                batch = distinct[start : start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                found.update(
+                    conn.execute(
+                        "SELECT key, vector FROM chunk_embedding "
+                        f"WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                )
+                conn.execute(
+                    f"UPDATE chunk_embedding SET used_at = ? WHERE key IN ({placeholders})",
+                    [self._clock(), *batch],
+                )
+            conn.commit()
+
+            self.hits += sum(key in found for key in keys)
+            self.misses += sum(key not in found for key in keys)
+
+        vectors = {
+            key: np.frombuffer(blob, dtype=np.float32).tolist()
+            for key, blob in found.items()
+        }
+        return [vectors.get(key) for key in keys]
+
+    def set_many(self, keys: Sequence[str], embeddings: Sequence[list[float]]) -> None:
+        now = self._clock()
+        rows = [
+            (key, now, np.asarray(embedding, dtype=np.float32).tobytes())
+            for key, embedding in zip(keys, embeddings)
+        ]
+        with self._lock:
+            conn = self._get_conn()
+            for key, _, blob in rows:
+                previous = conn.execute(
+                    "SELECT LENGTH(vector) FROM chunk_embedding WHERE key = ?", (key,)
+                ).fetchone()
+                self._bytes += len(blob) - (previous[0] if previous else 0)
+            conn.executemany(
+                "INSERT OR REPLACE INTO chunk_embedding VALUES (?, ?, ?)", rows
+            )
+            if self._bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        # Drop least recently used vectors down to 90% of the budget
+        target = self.max_bytes * 0.9
+        evicted = []
+        for key, size in conn.execute(
+            "SELECT key, LENGTH(vector) FROM chunk_embedding ORDER BY used_at"
+        ):
+            if self._bytes <= target:
+                break
+            evicted.append((key,))
+            self._bytes -= size
+        conn.executemany("DELETE FROM chunk_embedding WHERE key = ?", evicted)
+        log.debug(f"ChunkEmbeddingStore: evicted {len(evicted)} vectors")
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("DELETE FROM chunk_embedding")
+            conn.commit()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        if not self.enabled:
+            return {"enabled": False}
+        with self._lock:
+            conn = self._get_conn()
+            count = conn.execute("SELECT COUNT(*) FROM chunk_embedding").fetchone()
+            return {
+                "enabled": True,
+                "vectors": count[0],
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def wrap(
+        self,
+        engine: str,
+        model: str,
+        embedding_function: Callable[..., Awaitable],
+    ) -> Callable[..., Awaitable]:
+        """Persistent counterpart of QueryEmbeddingCache.wrap for ingestion."""
+        return wrap_embedding_function(
+            self,
+            lambda prefix, text: self.get_key(engine, model, prefix, text),
+            embedding_function,
+        )
+
+
+QUERY_EMBEDDING_CACHE = QueryEmbeddingCache(
+    max_entries=RAG_QUERY_EMBEDDING_CACHE_SIZE, ttl=RAG_QUERY_EMBEDDING_CACHE_TTL
+)
+
+CHUNK_EMBEDDING_STORE = ChunkEmbeddingStore(
+    RAG_CHUNK_EMBEDDING_CACHE_PATH,
+    max_bytes=RAG_CHUNK_EMBEDDING_CACHE_SIZE_MB * 1024 * 1024,
+)
@@ -0,0 +1,136 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from rag_system.backend.retrieval.vector.main import GetResult, SearchResult
+
+# Rank offset used by EnsembleRetriever (Cormack et al. RRF paper default)
+RRF_C = 60
+
+
+def weighted_rrf(
+    rankings: Sequence[Sequence[str]],
+    weights: Sequence[float],
+    c: int = RRF_C,
+) -> tuple[list[str], list[float], list[tuple[int, int]]]:
+    """
+    Fuse ranked id lists with weighted reciprocal rank fusion.
+
+    Each id scores sum(weight / (rank + c)) over the rankings it appears in.
+    Ties keep first-seen order, as EnsembleRetriever does. Alongside the
+    fused ids and scores, the (ranking, position) where each id was first
+    seen is returned so callers can pick its payload without a lookup table.
+    """
+    scores: dict[str, float] = {}
+    origins: dict[str, tuple[int, int]] = {}
+    for ranking_idx, (ranking, weight) in enumerate(zip(rankings, weights)):
+        if weight <= 0:
+            continue
+        for position, doc_id in enumerate(ranking):
+            score = weight / (position + 1 + c)
+            if doc_id in scores:
+                scores[doc_id] += score
+            else:
+                scores[doc_id] = score
+                origins[doc_id] = (ranking_idx, position)
+
+    fused_ids = sorted(scores, key=scores.__getitem__, reverse=True)
+    return (
+        fused_ids,
+        [scores[doc_id] for doc_id in fused_ids],
+        [origins[doc_id] for doc_id in fused_ids],
+    )
+
+
+def fuse_results(
+    results: Sequence[Optional[GetResult]],
+    weights: Sequence[float],
+    limit: Optional[int] = None,
+    c: int = RRF_C,
+) -> SearchResult:
+    """
+    Fuse id-aligned candidate lists into a single SearchResult.
+
+    Every input is a GetResult/SearchResult holding one candidate list
+    (ids[0], documents[0], metadatas[0]) ranked best first. The output
+    columns are ordered by fused score, which is reported in distances.
+    Stored vectors are carried over when any input has them, with None
+    for candidates that came from an input without vectors.
+    """
+    rankings = [
+        result.ids[0] if result is not None and result.ids else [] for result in results
+    ]
+    fused_ids, fused_scores, origins = weighted_rrf(rankings, weights, c=c)
+
+    if limit is not None:
+        fused_ids, fused_scores, origins = (
+            fused_ids[:limit],
+            fused_scores[:limit],
+            origins[:limit],
+        )
+
+    vectors = None
+    if any(result is not None and result.vectors for result in results):
+        vectors = [
+            [
+                (
+                    results[source].vectors[0][position]
+                    if results[source].vectors
+                    else None
+                )
+                for source, position in origins
+            ]
+        ]
+
+    return SearchResult(
+        ids=[fused_ids],
+        documents=[
+            [results[source].documents[0][position] for source, position in origins]
+        ],
+        metadatas=[
+            [results[source].metadatas[0][position] for source, position in origins]
+        ],
+        distances=[fused_scores],
+        vectors=vectors,
+    )
+
+
+def get_adaptive_depth(
+    scores: Sequence[float],
+    min_depth: int,
+    max_depth: int = 0,
+    gap: float = 0.25,
+) -> int:
+    """
+    Pick how many fused candidates to rerank from their score distribution.
+
+    Scores (best first) within max_depth (0 means all) are rescaled so the
+    median maps to 0 and the best score to 1. A peaked distribution, e.g. a
+    few hits both retrievers agree on ahead of a flat tail, has a low
+    normalized entropy and stays close to min_depth; a flat one goes
+    towards max_depth. The depth is further cut at the first drop of at
+    least `gap` (as a fraction of the score range) past min_depth.
+    """
+    max_depth = min(max_depth or len(scores), len(scores))
+    min_depth = min(max(min_depth, 1), max_depth)
+    if max_depth <= min_depth:
+        return max_depth
+
+    top = np.asarray(scores[:max_depth], dtype=np.float64)
+    floor = np.median(top)
+    if top[0] <= floor:
+        # No signal to tell candidates apart, rerank them all
+        return max_depth
+    scaled = np.clip((top - floor) / (top[0] - floor), 0.0, None)
+
+    # Squaring keeps the near-median tail from flattening the distribution
+    p = scaled**2 / (scaled**2).sum()
+    nonzero = p[p > 0]
+    entropy = float(-(nonzero * np.log(nonzero)).sum() / np.log(len(p)))
+    depth = min_depth + int(round((max_depth - min_depth) * entropy))
+
+    drops = scaled[min_depth - 1 : depth - 1] - scaled[min_depth:depth]
+    cut = np.flatnonzero(drops >= gap)
+    if len(cut):
+        depth = min_depth + int(cut[0])
+    return depth
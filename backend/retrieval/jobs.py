@@ -0,0 +1,334 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from rag_system.backend.settings import RAG_JOBS_DB_PATH
+
+log = logging.getLogger(__name__)
+
+# Item and job states; pending and running items are (re)processed on resume
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobStore:
+    """
+    Persistent checkpoints of long-running background jobs.
+
+    A job is an ordered list of items (e.g. files to process) whose state is
+    committed as soon as it changes, so a job interrupted by a restart can
+    resume with exactly the items that had not completed yet.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS job (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                params TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                updated_at REAL NOT NULL,
+                finished_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS job_kind_idx ON job (kind, created_at);
+            CREATE TABLE IF NOT EXISTS job_item (
+                job_id TEXT NOT NULL,
+                item_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                payload TEXT,
+                error TEXT,
+                started_at REAL,
+                finished_at REAL,
+                PRIMARY KEY (job_id, item_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+
+    def create_job(
+        self,
+        kind: str,
+        items: list[tuple[str, dict]],
+        params: Optional[dict] = None,
+    ) -> str:
+        """Create a pending job from (item_id, payload) pairs, in processing order."""
+        job_id = str(uuid.uuid4())
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO job (id, kind, status, params, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, PENDING, json.dumps(params or {}), now, now),
+            )
+            self._conn.executemany(
+                "INSERT INTO job_item (job_id, item_id, position, status, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (job_id, item_id, position, PENDING, json.dumps(payload))
+                    for position, (item_id, payload) in enumerate(items)
+                ],
+            )
+            self._conn.commit()
+        return job_id
+
+    def set_job_status(
+        self,
+        job_id: str,
+        status: str,
+        error: Optional[str] = None,
+        only_from: Optional[str] = None,
+    ) -> bool:
+        """
+        Set a job's status; with only_from, only if the job is still in that
+        status. Returns whether the job was updated.
+        """
+        now = self._clock()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE job SET status = ?, error = ?, updated_at = ?, "
+                "started_at = CASE WHEN ? = ? THEN COALESCE(started_at, ?) ELSE started_at END, "
+                "finished_at = CASE WHEN ? IN (?, ?, ?) THEN ? ELSE NULL END "
+                "WHERE id = ? AND (? IS NULL OR status = ?)",
+                (
+                    status,
+                    error,
+                    now,
+                    status,
+                    RUNNING,
+                    now,
+                    status,
+                    *FINISHED_STATES,
+                    now,
+                    job_id,
+                    only_from,
+                    only_from,
+                ),
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def set_item_status(
+        self, job_id: str, item_id: str, status: str, error: Optional[str] = None
+    ) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job_item SET status = ?, error = ?, "
+                "started_at = CASE WHEN ? = ? THEN ? ELSE started_at END, "
+                "finished_at = CASE WHEN ? IN (?, ?, ?) THEN ? ELSE NULL END "
+                "WHERE job_id = ? AND item_id = ?",
+                (
+                    status,
+                    error,
+                    status,
+                    RUNNING,
+                    now,
+                    status,
+                    *FINISHED_STATES,
+                    now,
+                    job_id,
+                    item_id,
+                ),
+            )
+            self._conn.execute(
+                "UPDATE job SET updated_at = ? WHERE id = ?", (now, job_id)
+            )
+            self._conn.commit()
+
+    def claim_job(self, kind: str, stale_after: float = 0) -> Optional[dict[str, Any]]:
+        """
+        Atomically move the oldest pending job of a kind to running.
+
+        Running jobs without a heartbeat for stale_after seconds (their
+        worker died) are claimed again. Safe across processes sharing the
+        store, so several server processes can serve one queue.
+        """
+        now = self._clock()
+        with self._lock:
+            # The write lock is taken up front so two processes never claim
+            # the same job
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id FROM job WHERE kind = ? AND (status = ? OR "
+                    "(status = ? AND ? > 0 AND updated_at < ?)) "
+                    "ORDER BY created_at LIMIT 1",
+                    (kind, PENDING, RUNNING, stale_after, now - stale_after),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE job SET status = ?, updated_at = ?, "
+                        "started_at = COALESCE(started_at, ?) WHERE id = ?",
+                        (RUNNING, now, now, row[0]),
+                    )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return self.get_job(row[0]) if row else None
+
+    def heartbeat(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job SET updated_at = ? WHERE id = ?", (self._clock(), job_id)
+            )
+            self._conn.commit()
+
+    def cancel_job(self, job_id: str) -> Optional[str]:
+        """Cancel a job that has not finished; returns the status it had."""
+        now = self._clock()
+        with self._lock:
+            # Read and write in one transaction, so a worker finishing or
+            # claiming the job concurrently sees either state but not a mix
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT status FROM job WHERE id = ?", (job_id,)
+                ).fetchone()
+                if row is not None and row[0] not in FINISHED_STATES:
+                    self._conn.execute(
+                        "UPDATE job SET status = ?, updated_at = ?, finished_at = ? "
+                        "WHERE id = ?",
+                        (CANCELLED, now, now, job_id),
+                    )
+                    self._conn.execute(
+                        "UPDATE job_item SET status = ?, finished_at = ? "
+                        "WHERE job_id = ? AND status = ?",
+                        (CANCELLED, now, job_id, PENDING),
+                    )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return row[0] if row else None
+
+    def get_items(
+        self, job_id: str, statuses: Optional[tuple[str, ...]] = None
+    ) -> list[dict[str, Any]]:
+        query = (
+            "SELECT item_id, status, payload, error, started_at, finished_at "
+            "FROM job_item WHERE job_id = ?"
+        )
+        params: list[Any] = [job_id]
+        if statuses:
+            query += f" AND status IN ({','.join('?' * len(statuses))})"
+            params.extend(statuses)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY position", params).fetchall()
+        return [
+            {
+                "item_id": item_id,
+                "status": status,
+                "payload": json.loads(payload) if payload else {},
+                "error": error,
+                "started_at": started_at,
+                "finished_at": finished_at,
+            }
+            for item_id, status, payload, error, started_at, finished_at in rows
+        ]
+
+    def get_job(self, job_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, kind, status, params, error, created_at, started_at, "
+                "updated_at, finished_at FROM job WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            counts = dict(
+                self._conn.execute(
+                    "SELECT status, COUNT(*) FROM job_item WHERE job_id = ? GROUP BY status",
+                    (job_id,),
+                ).fetchall()
+            )
+
+        (
+            job_id,
+            kind,
+            status,
+            params,
+            error,
+            created_at,
+            started_at,
+            updated_at,
+            finished_at,
+        ) = row
+        return {
+            "id": job_id,
+            "kind": kind,
+            "status": status,
+            "params": json.loads(params) if params else {},
+            "error": error,
+            "created_at": created_at,
+            "started_at": started_at,
+            "updated_at": updated_at,
+            "finished_at": finished_at,
+            "total": sum(counts.values()),
+            "counts": {
+                state: counts.get(state, 0)
+                for state in (PENDING, RUNNING, COMPLETED, FAILED, CANCELLED)
+            },
+        }
+
+    def get_latest_job(self, kind: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM job WHERE kind = ? ORDER BY created_at DESC LIMIT 1",
+                (kind,),
+            ).fetchone()
+        return self.get_job(row[0]) if row else None
+
+    def get_unfinished_jobs(self, kind: str) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM job WHERE kind = ? AND status IN (?, ?) "
+                "ORDER BY created_at",
+                (kind, PENDING, RUNNING),
+            ).fetchall()
+        return [job for (job_id,) in rows if (job := self.get_job(job_id))]
+
+    def get_throughput(self, job_id: str, since: float) -> dict[str, Optional[float]]:
+        """Items finished per second since a given time, and the resulting ETA."""
+        job = self.get_job(job_id)
+        if job is None:
+            return {"items_per_second": None, "eta_seconds": None}
+
+        with self._lock:
+            finished = self._conn.execute(
+                "SELECT COUNT(*) FROM job_item WHERE job_id = ? AND finished_at >= ?",
+                (job_id, since),
+            ).fetchone()[0]
+        elapsed = self._clock() - since
+        rate = finished / elapsed if finished and elapsed > 0 else None
+        remaining = job["counts"][PENDING] + job["counts"][RUNNING]
+        return {
+            "items_per_second": rate,
+            "eta_seconds": remaining / rate if rate else None,
+        }
+
+
+JOB_STORE = JobStore(RAG_JOBS_DB_PATH)
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List, Optional, Tuple
+
+from rag_system.backend.retrieval.models.base_reranker import BaseReranker
+
+log = logging.getLogger(__name__)
+
+
+class BatchingReranker(BaseReranker):
+    """
+    Micro-batching front for an in-process reranker (e.g. a CrossEncoder).
+
+    Concurrent predict/apredict calls are queued and a single worker thread
+    scores them together: it waits up to max_wait_ms for more requests, or
+    until max_batch_size pairs are pending, then runs one predict over all
+    of them and hands each caller its slice of the scores.
+    """
+
+    def __init__(
+        self, reranker: Any, max_batch_size: int = 64, max_wait_ms: float = 5
+    ):
+        self.reranker = reranker
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._pending: list[tuple[List[Tuple[str, str]], Future]] = []
+        self._pending_pairs = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __getattr__(self, name):
+        # Expose the wrapped model (config, tokenizer, ...) to existing callers
+        if name == "reranker":
+            raise AttributeError(name)
+        return getattr(self.reranker, name)
+
+    def submit(self, sentences: List[Tuple[str, str]]) -> Future:
+        future = Future()
+        if not sentences:
+            future.set_result([])
+            return future
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BatchingReranker is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="rerank-batcher", daemon=True
+                )
+                self._worker.start()
+            self._pending.append((list(sentences), future))
+            self._pending_pairs += len(sentences)
+            self._condition.notify()
+        return future
+
+    def predict(
+        self, sentences: List[Tuple[str, str]], user=None
+    ) -> Optional[List[float]]:
+        return self.submit(sentences).result()
+
+    async def apredict(
+        self, sentences: List[Tuple[str, str]], user=None
+    ) -> Optional[List[float]]:
+        return await asyncio.wrap_future(self.submit(sentences))
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    async def aclose(self):
+        self.close()
+
+    def _next_batch(self) -> list[tuple[List[Tuple[str, str]], Future]]:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+
+            # Give concurrent callers a short window to join the batch
+            deadline = time.monotonic() + self.max_wait
+            while self._pending_pairs < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch, size = [], 0
+            while self._pending and (not batch or size < self.max_batch_size):
+                sentences, future = self._pending.pop(0)
+                batch.append((sentences, future))
+                size += len(sentences)
+            self._pending_pairs -= size
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                # Closed with nothing left to score
+                return
+
+            pairs = [pair for sentences, _ in batch for pair in sentences]
+            log.debug(
+                f"BatchingReranker: scoring {len(pairs)} pairs from {len(batch)} requests"
+            )
+            try:
+                scores = self.reranker.predict(pairs)
+                if scores is not None and not isinstance(scores, list):
+                    scores = scores.tolist()
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for sentences, future in batch:
+                future.set_result(
+                    scores[offset : offset + len(sentences)]
+                    if scores is not None
+                    else None
+                )
+                offset += len(sentences)
@@ -0,0 +1,118 @@
+import logging
+from collections import defaultdict
+from typing import Any, Callable, List, Optional, Tuple
+
+import torch
+
+from rag_system.backend.retrieval.models.base_reranker import BaseReranker
+
+log = logging.getLogger(__name__)
+
+
+def get_bucket(length: int, min_bucket: int = 32) -> int:
+    """Smallest power of two (at least min_bucket) that fits length tokens."""
+    bucket = min_bucket
+    while bucket < length:
+        bucket *= 2
+    return bucket
+
+
+class LengthBucketedReranker(BaseReranker):
+    """
+    Length-aware batching front for a CrossEncoder.
+
+    Pairs are tokenized once, truncated to the model's max length, and
+    grouped into power-of-two length buckets. Each bucket is padded and run
+    through the underlying transformer in length-sorted batches, straight
+    from the token ids, so padding stays close to the real sequence lengths
+    instead of the longest chunk of the request. Scores come back in input
+    order.
+    """
+
+    def __init__(self, model: Any, batch_size: int = 32, min_bucket: int = 32):
+        self.model = model
+        self.batch_size = batch_size
+        self.min_bucket = min_bucket
+
+    def __getattr__(self, name):
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
+
+    @property
+    def max_length(self) -> Optional[int]:
+        # Renamed from max_length in sentence-transformers 5
+        max_length = getattr(self.model, "max_seq_length", None)
+        if max_length is None:
+            max_length = getattr(self.model, "max_length", None)
+        if max_length is None:
+            max_length = getattr(self.model.tokenizer, "model_max_length", None)
+        return max_length
+
+    @property
+    def activation(self) -> Optional[Callable]:
+        # Renamed from default_activation_function in sentence-transformers 4
+        activation = getattr(self.model, "activation_fn", None)
+        if activation is None:
+            activation = getattr(self.model, "default_activation_function", None)
+        return activation
+
+    def _score(self, features: list[dict]) -> list[float]:
+        # Same forward pass as CrossEncoder.predict, minus its tokenization
+        model = self.model.model
+        batch = self.model.tokenizer.pad(
+            features, padding=True, return_tensors="pt"
+        ).to(model.device)
+        with torch.inference_mode():
+            logits = self.activation(model(**batch, return_dict=True).logits)
+        return logits.view(len(features), -1)[:, 0].float().cpu().tolist()
+
+    def predict(
+        self, sentences: List[Tuple[str, str]], user=None
+    ) -> Optional[List[float]]:
+        if not sentences:
+            return []
+
+        if self.activation is None:
+            # Unknown CrossEncoder version, let it tokenize and score itself
+            return [
+                float(score)
+                for score in self.model.predict(
+                    sentences, batch_size=self.batch_size, show_progress_bar=False
+                )
+            ]
+
+        encoded = self.model.tokenizer(
+            [query for query, _ in sentences],
+            [doc for _, doc in sentences],
+            truncation=True,
+            max_length=self.max_length,
+        )
+        features = [
+            {key: values[idx] for key, values in encoded.items()}
+            for idx in range(len(sentences))
+        ]
+        lengths = [len(feature["input_ids"]) for feature in features]
+
+        buckets = defaultdict(list)
+        for idx in sorted(range(len(sentences)), key=lambda idx: lengths[idx]):
+            buckets[get_bucket(lengths[idx], self.min_bucket)].append(idx)
+
+        self.model.model.eval()
+        scores: list[Optional[float]] = [None] * len(sentences)
+        for bucket, indices in sorted(buckets.items()):
+            for start in range(0, len(indices), self.batch_size):
+                batch = indices[start : start + self.batch_size]
+                for idx, score in zip(
+                    batch, self._score([features[idx] for idx in batch])
+                ):
+                    scores[idx] = score
+
+        log.debug(
+            "LengthBucketedReranker: "
+            + ", ".join(
+                f"{len(indices)} pairs <= {bucket} tokens"
+                for bucket, indices in sorted(buckets.items())
+            )
+        )
+        return scores
@@ -1,4 +1,5 @@
 import os
+import re
 import logging
 import torch
 import numpy as np
@@ -7,6 +8,12 @@ from colbert.modeling.checkpoint import Checkpoint
 
 
 from rag_system.backend.retrieval.models.base_reranker import BaseReranker
+from rag_system.backend.retrieval.models.colbert_index import TokenEmbeddingIndex
+from rag_system.backend.retrieval.rerank_cache import hash_text
+from rag_system.backend.settings import (
+    RAG_COLBERT_INDEX_DIR,
+    RAG_COLBERT_INDEX_SIZE_MB,
+)
 
 log = logging.getLogger(__name__)
 
@@ -33,7 +40,66 @@ class ColBERT(BaseReranker):
             name,
             colbert_config=ColBERTConfig(model_name=name),
         ).to(self.device)
-        pass
+
+        # Document token matrices are keyed by chunk content hash, since the
+        # reranker only ever sees candidate texts
+        index_dir = kwargs.get("index_dir") or RAG_COLBERT_INDEX_DIR
+        self.index = TokenEmbeddingIndex(
+            os.path.join(index_dir, re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_")),
+            max_bytes=RAG_COLBERT_INDEX_SIZE_MB * 1024 * 1024,
+        )
+
+    def _embed_documents(self, docs):
+        # Padded positions come back as zero rows, only real tokens are kept
+        embedded_docs = self.ckpt.docFromText(docs, bsize=32)[0].detach().cpu()
+        matrices = []
+        for embedded_doc in embedded_docs:
+            tokens = int((embedded_doc != 0).any(dim=-1).sum())
+            matrices.append(embedded_doc[:tokens].float().numpy())
+        return matrices
+
+    def index_documents(self, docs):
+        """
+        Compute and store the token embeddings of docs that are not indexed yet.
+
+        Called at ingestion time so that reranking only has to encode the query.
+        """
+        keys = {hash_text(doc): doc for doc in docs}
+        indexed = self.index.contains(list(keys))
+        missing = [key for key in keys if key not in indexed]
+        if not missing:
+            return 0
+
+        matrices = self._embed_documents([keys[key] for key in missing])
+        self.index.add_many(dict(zip(missing, matrices)))
+        return len(missing)
+
+    def get_document_embeddings(self, docs):
+        if not docs:
+            return torch.zeros((0, 0, 0), dtype=torch.float32)
+
+        keys = [hash_text(doc) for doc in docs]
+        matrices = self.index.get_many(keys)
+
+        missing = list(dict.fromkeys(key for key in keys if key not in matrices))
+        if missing:
+            # Chunks ingested before the index existed are embedded once here
+            log.debug(f"ColBERT: embedding {len(missing)} unindexed documents")
+            by_key = dict(zip(keys, docs))
+            computed = dict(
+                zip(missing, self._embed_documents([by_key[key] for key in missing]))
+            )
+            self.index.add_many(computed)
+            matrices.update(computed)
+
+        # Zero padding to the longest document, as docFromText returns them
+        max_tokens = max(matrices[key].shape[0] for key in keys)
+        dim = matrices[keys[0]].shape[1]
+        embedded_docs = torch.zeros((len(keys), max_tokens, dim), dtype=torch.float32)
+        for idx, key in enumerate(keys):
+            matrix = torch.from_numpy(np.asarray(matrices[key], dtype=np.float32))
+            embedded_docs[idx, : matrix.shape[0]] = matrix
+        return embedded_docs
 
     def calculate_similarity_scores(self, query_embeddings, document_embeddings):
 
@@ -73,8 +139,8 @@ class ColBERT(BaseReranker):
         query = sentences[0][0]
         docs = [i[1] for i in sentences]
 
-        # Embedding the documents
-        embedded_docs = self.ckpt.docFromText(docs, bsize=32)[0]
+        # Stored document token embeddings
+        embedded_docs = self.get_document_embeddings(docs)
         # Embedding the queries
         embedded_queries = self.ckpt.queryFromText([query], bsize=32)
         embedded_query = embedded_queries[0]
@@ -0,0 +1,255 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows, a single server process is assumed there
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+# SQLite's default bound parameter limit is 999
+_LOOKUP_BATCH = 500
+
+_ITEMSIZE = np.dtype(np.float16).itemsize
+
+
+class TokenEmbeddingIndex:
+    """
+    Persistent store of per-chunk ColBERT token embedding matrices.
+
+    Matrices are appended as float16 to a data file that is read through a
+    memory map, and a SQLite table maps every chunk key to its (offset,
+    token count, dimension) in that file. An advisory file lock serializes
+    appends across server processes sharing the directory. Once the file
+    outgrows max_bytes, the least recently used matrices are dropped and
+    the rest are compacted into a new file of the next generation.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._map: Optional[np.memmap] = None
+        self._map_generation: Optional[int] = None
+
+        Path(path).mkdir(parents=True, exist_ok=True)
+        self._lock_path = os.path.join(path, "tokens.lock")
+        self._conn = sqlite3.connect(
+            os.path.join(path, "index.db"), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS token_matrix (
+                key TEXT PRIMARY KEY,
+                offset INTEGER NOT NULL,
+                tokens INTEGER NOT NULL,
+                dim INTEGER NOT NULL,
+                used_at REAL NOT NULL DEFAULT 0
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS token_file (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                generation INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO token_file VALUES (0, 0);
+            """
+        )
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(token_matrix)")
+        }
+        if "used_at" not in columns:
+            self._conn.execute(
+                "ALTER TABLE token_matrix ADD COLUMN used_at REAL NOT NULL DEFAULT 0"
+            )
+        self._conn.commit()
+        Path(self._get_data_path(self._get_generation())).touch(exist_ok=True)
+
+    @property
+    def data_path(self) -> str:
+        return self._get_data_path(self._get_generation())
+
+    def _get_data_path(self, generation: int) -> str:
+        # Generation 0 keeps the name used before compaction existed
+        name = "tokens.f16" if generation == 0 else f"tokens.{generation}.f16"
+        return os.path.join(self.path, name)
+
+    def _get_generation(self) -> int:
+        return self._conn.execute(
+            "SELECT generation FROM token_file WHERE id = 0"
+        ).fetchone()[0]
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        # Appends and compaction are exclusive, readers only need the data
+        # file not to be swapped between reading offsets and mapping it
+        with self._lock, open(self._lock_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _get_map(self, generation: int, size: int) -> np.memmap:
+        # Rows committed after the last mapping live past its end
+        if (
+            self._map is None
+            or self._map_generation != generation
+            or self._map.shape[0] < size
+        ):
+            self._map = np.memmap(
+                self._get_data_path(generation), dtype=np.float16, mode="r"
+            )
+            self._map_generation = generation
+        return self._map
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, np.ndarray]:
+        """Return the stored (tokens, dim) float16 matrices of the known keys."""
+        keys = list(dict.fromkeys(keys))
+        with self._file_lock(exclusive=False):
+            rows = []
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start : start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    self._conn.execute(
+                        "SELECT key, offset, tokens, dim FROM token_matrix "
+                        f"WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                )
+                self._conn.execute(
+                    f"UPDATE token_matrix SET used_at = ? WHERE key IN ({placeholders})",
+                    [time.time(), *batch],
+                )
+            self._conn.commit()
+            if not rows:
+                return {}
+
+            data = self._get_map(
+                self._get_generation(),
+                max(offset + tokens * dim for _, offset, tokens, dim in rows),
+            )
+            return {
+                key: data[offset : offset + tokens * dim].reshape(tokens, dim)
+                for key, offset, tokens, dim in rows
+            }
+
+    def contains(self, keys: Sequence[str]) -> set[str]:
+        keys = list(dict.fromkeys(keys))
+        found = set()
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start : start + _LOOKUP_BATCH]
+                found.update(
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT key FROM token_matrix "
+                        f"WHERE key IN ({','.join('?' * len(batch))})",
+                        batch,
+                    )
+                )
+        return found
+
+    def add_many(self, matrices: dict[str, np.ndarray]) -> None:
+        """Append (tokens, dim) matrices; keys that are already stored are kept."""
+        with self._file_lock(exclusive=True):
+            existing = self.contains(list(matrices))
+            generation = self._get_generation()
+            rows = []
+            now = time.time()
+            with open(self._get_data_path(generation), "ab") as f:
+                # Under the file lock the end of the file is ours to append to
+                offset = f.seek(0, os.SEEK_END) // _ITEMSIZE
+                for key, matrix in matrices.items():
+                    if key in existing:
+                        continue
+                    matrix = np.ascontiguousarray(matrix, dtype=np.float16)
+                    f.write(matrix.tobytes())
+                    rows.append((key, offset, matrix.shape[0], matrix.shape[1], now))
+                    offset += matrix.size
+
+            # A crash before this commit only leaves unreferenced bytes behind
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO token_matrix VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+            if self.max_bytes > 0 and offset * _ITEMSIZE > self.max_bytes:
+                self._compact(generation)
+        log.debug(f"TokenEmbeddingIndex: stored {len(rows)} matrices in {self.path}")
+
+    def _compact(self, generation: int) -> None:
+        # Keep the most recently used matrices within 90% of the budget and
+        # copy them into the next generation's file; the switch to it is a
+        # single commit, so a crash leaves either file consistent
+        target = self.max_bytes * 0.9
+        kept, evicted = [], []
+        size = 0
+        for key, offset, tokens, dim in self._conn.execute(
+            "SELECT key, offset, tokens, dim FROM token_matrix ORDER BY used_at DESC"
+        ).fetchall():
+            nbytes = tokens * dim * _ITEMSIZE
+            if size + nbytes <= target:
+                kept.append((key, offset, tokens, dim))
+                size += nbytes
+            else:
+                evicted.append((key,))
+
+        data = self._get_map(
+            generation,
+            max((offset + tokens * dim for _, offset, tokens, dim in kept), default=0),
+        )
+        new_path = self._get_data_path(generation + 1)
+        offsets = []
+        with open(new_path, "wb") as f:
+            new_offset = 0
+            for key, offset, tokens, dim in sorted(kept, key=lambda row: row[1]):
+                f.write(data[offset : offset + tokens * dim].tobytes())
+                offsets.append((new_offset, key))
+                new_offset += tokens * dim
+
+        try:
+            self._conn.executemany("DELETE FROM token_matrix WHERE key = ?", evicted)
+            self._conn.executemany(
+                "UPDATE token_matrix SET offset = ? WHERE key = ?", offsets
+            )
+            self._conn.execute(
+                "UPDATE token_file SET generation = ? WHERE id = 0", (generation + 1,)
+            )
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            os.remove(new_path)
+            raise
+
+        # Processes still holding a map of the old file keep reading it
+        try:
+            os.remove(self._get_data_path(generation))
+        except OSError as e:
+            log.warning(f"TokenEmbeddingIndex: could not remove old data file: {e}")
+        log.info(
+            f"TokenEmbeddingIndex: evicted {len(evicted)} matrices from {self.path}, "
+            f"{size} bytes kept"
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM token_matrix").fetchone()
+            data_path = self.data_path
+        return {
+            "matrices": count[0],
+            "bytes": os.path.getsize(data_path),
+            "max_bytes": self.max_bytes,
+        }
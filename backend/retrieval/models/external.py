@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import threading
+import aiohttp
 import requests
 from typing import Optional, List, Tuple
 from urllib.parse import quote
@@ -6,6 +9,11 @@ from urllib.parse import quote
 
 from rag_system.backend.env import ENABLE_FORWARD_USER_INFO_HEADERS, REQUESTS_VERIFY
 from rag_system.backend.retrieval.models.base_reranker import BaseReranker
+from rag_system.backend.settings import (
+    RAG_EXTERNAL_RERANKER_POOL_SIZE,
+    RAG_EXTERNAL_RERANKER_CONNECT_TIMEOUT,
+    RAG_EXTERNAL_RERANKER_KEEPALIVE_TIMEOUT,
+)
 from rag_system.backend.utils.headers import include_user_info_headers
 
 
@@ -25,9 +33,13 @@ class ExternalReranker(BaseReranker):
         self.model = model
         self.timeout = timeout
 
-    def predict(
+        # Keep-alive sessions shared by all apredict calls, one per event loop
+        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._sessions_lock = threading.Lock()
+
+    def _build_request(
         self, sentences: List[Tuple[str, str]], user=None
-    ) -> Optional[List[float]]:
+    ) -> tuple[dict, dict]:
         query = sentences[0][0]
         docs = [i[1] for i in sentences]
 
@@ -38,17 +50,75 @@ class ExternalReranker(BaseReranker):
             "top_n": len(docs),
         }
 
-        try:
-            log.info(f"ExternalReranker:predict:model {self.model}")
-            log.info(f"ExternalReranker:predict:query {query}")
+        log.info(f"ExternalReranker:predict:model {self.model}")
+        log.info(f"ExternalReranker:predict:query {query}")
+
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+        if ENABLE_FORWARD_USER_INFO_HEADERS and user:
+            headers = include_user_info_headers(headers, user)
+
+        return headers, payload
+
+    def _parse_response(self, data: dict) -> Optional[List[float]]:
+        if "results" in data:
+            sorted_results = sorted(data["results"], key=lambda x: x["index"])
+            return [result["relevance_score"] for result in sorted_results]
+        else:
+            log.error("No results found in external reranking response")
+            return None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            # Sessions of loops that are gone (asyncio.run in a worker thread)
+            # can neither be used nor closed anymore, their sockets died
+            # with the loop
+            for closed_loop in [other for other in self._sessions if other.is_closed()]:
+                self._sessions.pop(closed_loop).detach()
+
+            session = self._sessions.get(loop)
+            if session is not None and not session.closed:
+                return session
+
+            session = self._sessions[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=RAG_EXTERNAL_RERANKER_POOL_SIZE,
+                    keepalive_timeout=RAG_EXTERNAL_RERANKER_KEEPALIVE_TIMEOUT,
+                    ssl=None if REQUESTS_VERIFY else False,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=self.timeout,
+                    connect=RAG_EXTERNAL_RERANKER_CONNECT_TIMEOUT,
+                ),
+                trust_env=True,
+            )
+            return session
 
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            }
+    async def aclose(self):
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, {}
 
-            if ENABLE_FORWARD_USER_INFO_HEADERS and user:
-                headers = include_user_info_headers(headers, user)
+        for session_loop, session in sessions.items():
+            if session.closed or session_loop.is_closed():
+                continue
+            if session_loop is loop:
+                await session.close()
+            elif session_loop.is_running():
+                # A session can only be closed on the loop it was created on
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+                )
+
+    def predict(
+        self, sentences: List[Tuple[str, str]], user=None
+    ) -> Optional[List[float]]:
+        try:
+            headers, payload = self._build_request(sentences, user)
 
             r = requests.post(
                 f"{self.url}",
@@ -59,14 +129,23 @@ class ExternalReranker(BaseReranker):
             )
 
             r.raise_for_status()
-            data = r.json()
-
-            if "results" in data:
-                sorted_results = sorted(data["results"], key=lambda x: x["index"])
-                return [result["relevance_score"] for result in sorted_results]
-            else:
-                log.error("No results found in external reranking response")
-                return None
+            return self._parse_response(r.json())
+
+        except Exception as e:
+            log.exception(f"Error in external reranking: {e}")
+            return None
+
+    async def apredict(
+        self, sentences: List[Tuple[str, str]], user=None
+    ) -> Optional[List[float]]:
+        try:
+            headers, payload = self._build_request(sentences, user)
+
+            async with self._get_session().post(
+                f"{self.url}", headers=headers, json=payload
+            ) as r:
+                r.raise_for_status()
+                return self._parse_response(await r.json())
 
         except Exception as e:
             log.exception(f"Error in external reranking: {e}")
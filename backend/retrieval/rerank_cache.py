@@ -0,0 +1,198 @@
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Sequence
+
+from rag_system.backend.settings import (
+    RAG_RERANK_SCORE_CACHE_SIZE,
+    RAG_RERANK_SCORE_CACHE_TTL,
+)
+
+log = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for cache lookups.
+
+    Only unicode form and whitespace are normalized; case is kept because
+    cross-encoders are generally case sensitive.
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).split())
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class RerankScoreCache:
+    """
+    Bounded LRU/TTL cache of reranker scores.
+
+    Scores are keyed by (reranker model, normalized query hash, chunk content
+    hash), so re-asked or regenerated questions only send the pairs the
+    model has not scored yet.
+    """
+
+    def __init__(self, max_entries: int, ttl: int = 0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get_many(
+        self, model: str, query_hash: str, chunk_hashes: Sequence[str]
+    ) -> list[Optional[float]]:
+        now = time.monotonic()
+        scores = []
+        with self._lock:
+            for chunk_hash in chunk_hashes:
+                key = (model, query_hash, chunk_hash)
+                entry = self._entries.get(key)
+                if entry is not None and (not self.ttl or now - entry[1] < self.ttl):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    scores.append(entry[0])
+                    continue
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                scores.append(None)
+        return scores
+
+    def set_many(
+        self,
+        model: str,
+        query_hash: str,
+        chunk_hashes: Sequence[str],
+        scores: Sequence[float],
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for chunk_hash, score in zip(chunk_hashes, scores):
+                key = (model, query_hash, chunk_hash)
+                self._entries[key] = (score, now)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _lookup(self, model: str, query: str, texts: Sequence[str]):
+        query_hash = hash_text(normalize_query(query))
+        chunk_hashes = [hash_text(text) for text in texts]
+        scores = self.get_many(model, query_hash, chunk_hashes)
+
+        # Score each distinct uncached text once
+        missing = {}
+        for idx, (chunk_hash, score) in enumerate(zip(chunk_hashes, scores)):
+            if score is None:
+                missing.setdefault(chunk_hash, idx)
+        return query_hash, chunk_hashes, scores, missing
+
+    def _store(
+        self,
+        model: str,
+        query_hash: str,
+        chunk_hashes: list[str],
+        scores: list[Optional[float]],
+        missing: dict[str, int],
+        new_scores: Sequence[float],
+    ) -> list[float]:
+        new_scores = [float(score) for score in new_scores]
+        self.set_many(model, query_hash, list(missing), new_scores)
+        scored = dict(zip(missing, new_scores))
+        log.debug(
+            f"rerank_score_cache: {len(chunk_hashes) - len(missing)} cached, "
+            f"{len(missing)} scored"
+        )
+        return [
+            scored[chunk_hash] if score is None else score
+            for chunk_hash, score in zip(chunk_hashes, scores)
+        ]
+
+    def wrap(
+        self, model: str, predict: Callable[..., Optional[Sequence[float]]]
+    ) -> Callable[..., Optional[list[float]]]:
+        """
+        Wrap a reranking function so that only uncached pairs reach the model.
+
+        predict takes (query, texts, user=None) and returns one score per
+        text, or None when scoring failed (nothing is cached then).
+        """
+
+        def cached_predict(query: str, texts: Sequence[str], user=None):
+            if not self.enabled or not texts:
+                return predict(query, texts, user=user)
+
+            query_hash, chunk_hashes, scores, missing = self._lookup(
+                model, query, texts
+            )
+            if not missing:
+                return scores
+
+            new_scores = predict(
+                query, [texts[idx] for idx in missing.values()], user=user
+            )
+            if new_scores is None:
+                return None
+            return self._store(
+                model, query_hash, chunk_hashes, scores, missing, new_scores
+            )
+
+        return cached_predict
+
+    def wrap_async(
+        self,
+        model: str,
+        apredict: Callable[..., Awaitable[Optional[Sequence[float]]]],
+    ) -> Callable[..., Awaitable[Optional[list[float]]]]:
+        """Async counterpart of wrap for rerankers with a native apredict."""
+
+        async def cached_apredict(query: str, texts: Sequence[str], user=None):
+            if not self.enabled or not texts:
+                return await apredict(query, texts, user=user)
+
+            query_hash, chunk_hashes, scores, missing = self._lookup(
+                model, query, texts
+            )
+            if not missing:
+                return scores
+
+            new_scores = await apredict(
+                query, [texts[idx] for idx in missing.values()], user=user
+            )
+            if new_scores is None:
+                return None
+            return self._store(
+                model, query_hash, chunk_hashes, scores, missing, new_scores
+            )
+
+        return cached_apredict
+
+
+RERANK_SCORE_CACHE = RerankScoreCache(
+    max_entries=RAG_RERANK_SCORE_CACHE_SIZE, ttl=RAG_RERANK_SCORE_CACHE_TTL
+)
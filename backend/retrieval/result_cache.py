@@ -0,0 +1,228 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+from rag_system.backend.retrieval.rerank_cache import normalize_query
+from rag_system.backend.settings import (
+    RAG_QUERY_RESULT_CACHE,
+    RAG_QUERY_RESULT_CACHE_PATH,
+    RAG_QUERY_RESULT_CACHE_SIZE,
+    RAG_QUERY_RESULT_CACHE_TTL,
+)
+
+log = logging.getLogger(__name__)
+
+
+class MemoryResultCacheBackend:
+    """In-process LRU store of serialized query results."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[float, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, created_at: float, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (created_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskResultCacheBackend:
+    """
+    SQLite store of serialized query results.
+
+    Keeps large result sets out of process memory and shares them between
+    server processes and across restarts, as keys carry the persistent
+    collection versions. The least recently used entries beyond
+    max_entries are pruned on write.
+    """
+
+    def __init__(
+        self, path: str, max_entries: int, clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS query_result (
+                key TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                used_at REAL NOT NULL,
+                value TEXT NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS query_result_used_idx ON query_result (used_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[tuple[float, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, value FROM query_result WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE query_result SET used_at = ? WHERE key = ?",
+                    (self._clock(), key),
+                )
+                self._conn.commit()
+            return row
+
+    def set(self, key: str, created_at: float, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO query_result VALUES (?, ?, ?, ?)",
+                (key, created_at, self._clock(), value),
+            )
+            self._conn.execute(
+                "DELETE FROM query_result WHERE key IN ("
+                "SELECT key FROM query_result ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM query_result WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM query_result")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM query_result").fetchone()[0]
+
+
+class QueryResultCache:
+    """
+    TTL cache of retrieval results (query_collection and hybrid search).
+
+    Keys cover the normalized queries, the collection set with each
+    collection's write version, and the retrieval parameters, so any write
+    to a searched collection turns its cached results into misses. A hit
+    skips embedding, search, BM25 and reranking altogether.
+    """
+
+    def __init__(
+        self, backend: Any, ttl: int = 0, clock: Callable[[], float] = time.time
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def get_key(
+        self,
+        kind: str,
+        queries: Sequence[str],
+        collection_names: Sequence[str],
+        versions: Sequence[int],
+        params: dict,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "kind": kind,
+                "queries": sorted({normalize_query(query) for query in queries}),
+                "collections": sorted(zip(collection_names, versions)),
+                "params": params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        if not self.enabled:
+            return None
+
+        entry = self.backend.get(key)
+        if entry is not None and (not self.ttl or self._clock() - entry[0] < self.ttl):
+            self.hits += 1
+            log.debug(f"query_result_cache:hit {key[:12]}")
+            return json.loads(entry[1])
+
+        if entry is not None:
+            self.backend.delete(key)
+        self.misses += 1
+        return None
+
+    def set(self, key: str, result: dict) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(key, self._clock(), json.dumps(result, default=str))
+        except Exception as e:
+            log.warning(f"Failed to cache query result: {e}")
+
+    def clear(self) -> None:
+        if self.enabled:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        return {
+            "backend": RAG_QUERY_RESULT_CACHE or None,
+            "entries": len(self.backend) if self.enabled else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def get_query_result_cache_backend(name: str) -> Optional[Any]:
+    if name == "memory":
+        return MemoryResultCacheBackend(RAG_QUERY_RESULT_CACHE_SIZE)
+    if name == "disk":
+        return DiskResultCacheBackend(
+            RAG_QUERY_RESULT_CACHE_PATH, RAG_QUERY_RESULT_CACHE_SIZE
+        )
+    if name:
+        log.warning(f"Unknown RAG_QUERY_RESULT_CACHE backend '{name}', caching disabled")
+    return None
+
+
+QUERY_RESULT_CACHE = QueryResultCache(
+    get_query_result_cache_backend(RAG_QUERY_RESULT_CACHE),
+    ttl=RAG_QUERY_RESULT_CACHE_TTL,
+)
@@ -2,31 +2,36 @@ import logging
 import os
 from typing import Awaitable, Optional, Union, Any
 
+import inspect
+import numpy as np
 import requests
 import aiohttp
 import asyncio
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
 import time
 import re
+import threading
 
 from urllib.parse import quote
 from huggingface_hub import snapshot_download
-from langchain_classic.retrievers import (
-    ContextualCompressionRetriever,
-    EnsembleRetriever,
-)
-from langchain_community.retrievers import BM25Retriever
-from langchain_core.documents import Document
 
 from rag_system.backend.settings import VECTOR_DB
 from rag_system.backend.retrieval.vector.factory import VECTOR_DB_CLIENT
+from rag_system.backend.retrieval.bm25 import BM25_INDEX
+from rag_system.backend.retrieval.fusion import fuse_results, get_adaptive_depth
+from rag_system.backend.retrieval.rerank_cache import RERANK_SCORE_CACHE
+from rag_system.backend.retrieval.embedding_cache import QUERY_EMBEDDING_CACHE
+from rag_system.backend.retrieval.result_cache import QUERY_RESULT_CACHE
 
 
 from rag_system.backend.model_registry import get_model
 from rag_system.backend.models.knowledge import Knowledges
 
-from rag_system.backend.retrieval.vector.main import GetResult
+from rag_system.backend.retrieval.vector.main import (
+    GetResult,
+    SearchResult,
+    merge_search_results,
+)
 from rag_system.backend.utils.headers import include_user_info_headers
 from rag_system.backend.dependencies import get_permission_provider
 from rag_system.backend.utils.misc import get_message_list
@@ -45,17 +50,19 @@ from rag_system.backend.settings import (
     RAG_EMBEDDING_QUERY_PREFIX,
     RAG_EMBEDDING_CONTENT_PREFIX,
     RAG_EMBEDDING_PREFIX_FIELD_NAME,
+    RAG_HYBRID_POOLED_RERANK,
+    RAG_HYBRID_POOLED_RERANK_TOP_M,
+    RAG_RERANK_PREFILTER_TOP_M,
+    RAG_RERANK_ADAPTIVE_DEPTH,
+    RAG_RERANK_ADAPTIVE_MIN_DEPTH,
+    RAG_RERANK_ADAPTIVE_MAX_DEPTH,
+    RAG_RERANK_ADAPTIVE_GAP,
+    RAG_SOURCES_MAX_CONCURRENCY,
 )
 
 log = logging.getLogger(__name__)
 
 
-from typing import Any
-
-from langchain_core.callbacks import CallbackManagerForRetrieverRun
-from langchain_core.retrievers import BaseRetriever
-
-
 def is_youtube_url(url: str) -> bool:
     youtube_regex = r"^(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+$"
     return re.match(youtube_regex, url) is not None
@@ -84,51 +91,58 @@ def get_content_from_url(request, url: str) -> str:
     return content, docs
 
 
-class VectorSearchRetriever(BaseRetriever):
-    collection_name: Any
-    embedding_function: Any
-    top_k: int
+def get_bm25_result(
+    collection_result: GetResult,
+    hits: list[tuple[str, float]],
+    positions: Optional[dict[str, int]] = None,
+) -> GetResult:
+    """Turn BM25 (id, score) hits into columns taken from the collection snapshot."""
+    if positions is None:
+        positions = {
+            doc_id: idx for idx, doc_id in enumerate(collection_result.ids[0])
+        }
 
-    def _get_relevant_documents(
-        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
-    ) -> list[Document]:
-        """Get documents relevant to a query.
+    indices = [positions[doc_id] for doc_id, _ in hits if doc_id in positions]
+    return GetResult(
+        ids=[[collection_result.ids[0][idx] for idx in indices]],
+        documents=[[collection_result.documents[0][idx] for idx in indices]],
+        metadatas=[[collection_result.metadatas[0][idx] for idx in indices]],
+    )
 
-        Args:
-            query: String to find relevant documents for.
-            run_manager: The callback handler to use.
 
-        Returns:
-            List of relevant documents.
-        """
-        return []
+_bm25_build_lock = threading.Lock()
 
-    async def _aget_relevant_documents(
-        self,
-        query: str,
-        *,
-        run_manager: CallbackManagerForRetrieverRun,
-    ) -> list[Document]:
-        embedding = await self.embedding_function(query, RAG_EMBEDDING_QUERY_PREFIX)
-        result = VECTOR_DB_CLIENT.search(
-            collection_name=self.collection_name,
-            vectors=[embedding],
-            limit=self.top_k,
+
+def ensure_bm25_index(
+    collection_name: str,
+    collection_result: GetResult,
+    enable_enriched_texts: bool = False,
+) -> None:
+    """Build the BM25 index of a collection if it is missing or out of date."""
+    with _bm25_build_lock:
+        if BM25_INDEX.is_current(
+            collection_name, collection_result.ids[0], enable_enriched_texts
+        ):
+            return
+
+        BM25_INDEX.build(
+            collection_name,
+            ids=collection_result.ids[0],
+            texts=(
+                get_enriched_texts(collection_result)
+                if enable_enriched_texts
+                else collection_result.documents[0]
+            ),
+            metadatas=collection_result.metadatas[0],
+            enriched=enable_enriched_texts,
         )
 
-        ids = result.ids[0]
-        metadatas = result.metadatas[0]
-        documents = result.documents[0]
 
-        results = []
-        for idx in range(len(ids)):
-            results.append(
-                Document(
-                    metadata=metadatas[idx],
-                    page_content=documents[idx],
-                )
-            )
-        return results
+def get_query_doc_result(tag: str, result: Optional[SearchResult]):
+    # Shared by query_doc and aquery_doc
+    if result:
+        log.info(f"{tag}:result {result.ids} {result.metadatas}")
+    return result
 
 
 def query_doc(
@@ -136,16 +150,32 @@ def query_doc(
 ):
     try:
         log.debug(f"query_doc:doc {collection_name}")
-        result = VECTOR_DB_CLIENT.search(
-            collection_name=collection_name,
-            vectors=[query_embedding],
-            limit=k,
+        return get_query_doc_result(
+            "query_doc",
+            VECTOR_DB_CLIENT.search(
+                collection_name=collection_name,
+                vectors=[query_embedding],
+                limit=k,
+            ),
         )
+    except Exception as e:
+        log.exception(f"Error querying doc {collection_name} with limit {k}: {e}")
+        raise e
 
-        if result:
-            log.info(f"query_doc:result {result.ids} {result.metadatas}")
 
-        return result
+async def aquery_doc(
+    collection_name: str, query_embedding: list[float], k: int, user: Optional[Any] = None
+):
+    try:
+        log.debug(f"aquery_doc:doc {collection_name}")
+        return get_query_doc_result(
+            "aquery_doc",
+            await VECTOR_DB_CLIENT.asearch(
+                collection_name=collection_name,
+                vectors=[query_embedding],
+                limit=k,
+            ),
+        )
     except Exception as e:
         log.exception(f"Error querying doc {collection_name} with limit {k}: {e}")
         raise e
@@ -165,42 +195,175 @@ def get_doc(collection_name: str, user: Optional[Any] = None):
         raise e
 
 
+def get_enrichment_text(metadata: dict) -> str:
+    metadata_parts = []
+
+    # Add filename (repeat twice for extra weight in BM25 scoring)
+    if metadata.get("name"):
+        filename = metadata["name"]
+        filename_tokens = filename.replace("_", " ").replace("-", " ").replace(".", " ")
+        metadata_parts.append(f"Filename: {filename} {filename_tokens} {filename_tokens}")
+
+    # Add title if available
+    if metadata.get("title"):
+        metadata_parts.append(f"Title: {metadata['title']}")
+
+    # Add document section headings if available (from markdown splitter)
+    if metadata.get("headings") and isinstance(metadata["headings"], list):
+        headings = " > ".join(str(h) for h in metadata["headings"])
+        metadata_parts.append(f"Section: {headings}")
+
+    # Add source URL/path if available
+    if metadata.get("source"):
+        metadata_parts.append(f"Source: {metadata['source']}")
+
+    # Add snippet for web search results
+    if metadata.get("snippet"):
+        metadata_parts.append(f"Snippet: {metadata['snippet']}")
+
+    return " ".join(metadata_parts)
+
+
+def get_enriched_text(text: str, metadata: dict) -> str:
+    # Only ever indexed by BM25, never stored with the chunk in the vector DB
+    enrichment = get_enrichment_text(metadata)
+    return f"{text} {enrichment}" if enrichment else text
+
+
 def get_enriched_texts(collection_result: GetResult) -> list[str]:
-    enriched_texts = []
-    for idx, text in enumerate(collection_result.documents[0]):
-        metadata = collection_result.metadatas[0][idx]
-        metadata_parts = [text]
-
-        # Add filename (repeat twice for extra weight in BM25 scoring)
-        if metadata.get("name"):
-            filename = metadata["name"]
-            filename_tokens = (
-                filename.replace("_", " ").replace("-", " ").replace(".", " ")
-            )
-            metadata_parts.append(
-                f"Filename: {filename} {filename_tokens} {filename_tokens}"
+    return [
+        get_enriched_text(text, collection_result.metadatas[0][idx] or {})
+        for idx, text in enumerate(collection_result.documents[0])
+    ]
+
+
+async def get_hybrid_candidates(
+    collection_name: str,
+    collection_result: GetResult,
+    query: str,
+    embedding_function,
+    k: int,
+    hybrid_bm25_weight: float,
+    enable_enriched_texts: bool = False,
+    bm25_result: Optional[GetResult] = None,
+    query_embedding: Optional[list[float]] = None,
+    include_vectors: bool = False,
+) -> tuple[SearchResult, Optional[list[float]]]:
+    """
+    Fuse the BM25 and vector hits of one collection into rerank candidates.
+
+    Returns the candidates together with the query embedding, which is
+    computed here when it was not given and a vector search is needed.
+    """
+    if bm25_result is None and hybrid_bm25_weight > 0:
+        await asyncio.to_thread(
+            ensure_bm25_index,
+            collection_name,
+            collection_result,
+            enable_enriched_texts,
+        )
+        bm25_result = get_bm25_result(
+            collection_result,
+            await asyncio.to_thread(BM25_INDEX.search, collection_name, query, k),
+        )
+
+    vector_result = None
+    if hybrid_bm25_weight < 1:
+        if query_embedding is None:
+            query_embedding = await embedding_function(
+                query, RAG_EMBEDDING_QUERY_PREFIX
             )
+        vector_result = await VECTOR_DB_CLIENT.asearch(
+            collection_name=collection_name,
+            vectors=[query_embedding],
+            limit=k,
+            include_vectors=include_vectors,
+        )
 
-        # Add title if available
-        if metadata.get("title"):
-            metadata_parts.append(f"Title: {metadata['title']}")
+    candidates = fuse_results(
+        [bm25_result, vector_result],
+        [hybrid_bm25_weight, 1.0 - hybrid_bm25_weight],
+    )
+    return candidates, query_embedding
 
-        # Add document section headings if available (from markdown splitter)
-        if metadata.get("headings") and isinstance(metadata["headings"], list):
-            headings = " > ".join(str(h) for h in metadata["headings"])
-            metadata_parts.append(f"Section: {headings}")
 
-        # Add source URL/path if available
-        if metadata.get("source"):
-            metadata_parts.append(f"Source: {metadata['source']}")
+async def rerank_hybrid_candidates(
+    candidates: SearchResult,
+    query: str,
+    embedding_function,
+    k: int,
+    reranking_function,
+    k_reranker: int,
+    r: float,
+    query_embedding: Optional[list[float]] = None,
+) -> dict:
+    if (
+        RAG_RERANK_ADAPTIVE_DEPTH
+        and reranking_function is not None
+        and candidates.distances
+    ):
+        depth = get_adaptive_depth(
+            candidates.distances[0],
+            # Never rerank fewer candidates than results are returned
+            min_depth=max(RAG_RERANK_ADAPTIVE_MIN_DEPTH, min(k, k_reranker)),
+            max_depth=RAG_RERANK_ADAPTIVE_MAX_DEPTH,
+            gap=RAG_RERANK_ADAPTIVE_GAP,
+        )
+        log.info(
+            f"rerank_hybrid_candidates: adaptive depth {depth} "
+            f"of {len(candidates.ids[0])} candidates"
+        )
+        candidates = SearchResult(
+            ids=[candidates.ids[0][:depth]],
+            documents=[candidates.documents[0][:depth]],
+            metadatas=[candidates.metadatas[0][:depth]],
+            distances=[candidates.distances[0][:depth]],
+            vectors=[candidates.vectors[0][:depth]] if candidates.vectors else None,
+        )
 
-        # Add snippet for web search results
-        if metadata.get("snippet"):
-            metadata_parts.append(f"Snippet: {metadata['snippet']}")
+    candidate_documents = candidates.documents[0]
+    candidate_metadatas = candidates.metadatas[0]
+    candidate_vectors = candidates.vectors[0] if candidates.vectors else None
 
-        enriched_texts.append(" ".join(metadata_parts))
+    compressor = RerankCompressor(
+        embedding_function=embedding_function,
+        top_n=k_reranker,
+        reranking_function=reranking_function,
+        r_score=r,
+        prefilter_top_m=RAG_RERANK_PREFILTER_TOP_M,
+    )
+    ranked = await compressor.arerank(
+        query,
+        candidate_documents,
+        vectors=candidate_vectors,
+        query_embedding=query_embedding,
+    )
+    if ranked is None:
+        log.warning(
+            "No valid scores found, check your reranking function. Returning original documents."
+        )
+        ranked = [(idx, None) for idx in range(len(candidate_documents))]
+
+    # retrieve only min(k, k_reranker) items
+    if k < k_reranker:
+        ranked = ranked[:k]
+
+    distances = [score for _, score in ranked]
+    documents = [candidate_documents[idx] for idx, _ in ranked]
+    metadatas = [
+        (
+            {**(candidate_metadatas[idx] or {}), "score": score}
+            if score is not None
+            else {**(candidate_metadatas[idx] or {})}
+        )
+        for idx, score in ranked
+    ]
 
-    return enriched_texts
+    return {
+        "distances": [distances],
+        "documents": [documents],
+        "metadatas": [metadatas],
+    }
 
 
 async def query_doc_with_hybrid_search(
@@ -214,6 +377,8 @@ async def query_doc_with_hybrid_search(
     r: float,
     hybrid_bm25_weight: float,
     enable_enriched_texts: bool = False,
+    bm25_result: Optional[GetResult] = None,
+    query_embedding: Optional[list[float]] = None,
 ) -> dict:
     try:
         # First check if collection_result has the required attributes
@@ -236,73 +401,32 @@ async def query_doc_with_hybrid_search(
 
         log.debug(f"query_doc_with_hybrid_search:doc {collection_name}")
 
-        bm25_texts = (
-            get_enriched_texts(collection_result)
-            if enable_enriched_texts
-            else collection_result.documents[0]
-        )
-
-        bm25_retriever = BM25Retriever.from_texts(
-            texts=bm25_texts,
-            metadatas=collection_result.metadatas[0],
-        )
-        bm25_retriever.k = k
-
-        vector_search_retriever = VectorSearchRetriever(
+        candidates, query_embedding = await get_hybrid_candidates(
             collection_name=collection_name,
+            collection_result=collection_result,
+            query=query,
             embedding_function=embedding_function,
-            top_k=k,
+            k=k,
+            hybrid_bm25_weight=hybrid_bm25_weight,
+            enable_enriched_texts=enable_enriched_texts,
+            bm25_result=bm25_result,
+            query_embedding=query_embedding,
+            # Embedding-similarity reranking reuses the stored vectors
+            include_vectors=(
+                reranking_function is None or RAG_RERANK_PREFILTER_TOP_M > 0
+            ),
         )
-
-        if hybrid_bm25_weight <= 0:
-            ensemble_retriever = EnsembleRetriever(
-                retrievers=[vector_search_retriever], weights=[1.0]
-            )
-        elif hybrid_bm25_weight >= 1:
-            ensemble_retriever = EnsembleRetriever(
-                retrievers=[bm25_retriever], weights=[1.0]
-            )
-        else:
-            ensemble_retriever = EnsembleRetriever(
-                retrievers=[bm25_retriever, vector_search_retriever],
-                weights=[hybrid_bm25_weight, 1.0 - hybrid_bm25_weight],
-            )
-
-        compressor = RerankCompressor(
+        result = await rerank_hybrid_candidates(
+            candidates,
+            query=query,
             embedding_function=embedding_function,
-            top_n=k_reranker,
+            k=k,
             reranking_function=reranking_function,
-            r_score=r,
+            k_reranker=k_reranker,
+            r=r,
+            query_embedding=query_embedding,
         )
 
-        compression_retriever = ContextualCompressionRetriever(
-            base_compressor=compressor, base_retriever=ensemble_retriever
-        )
-
-        result = await compression_retriever.ainvoke(query)
-
-        distances = [d.metadata.get("score") for d in result]
-        documents = [d.page_content for d in result]
-        metadatas = [d.metadata for d in result]
-
-        # retrieve only min(k, k_reranker) items, sort and cut by distance if k < k_reranker
-        if k < k_reranker:
-            sorted_items = sorted(
-                zip(distances, metadatas, documents), key=lambda x: x[0], reverse=True
-            )
-            sorted_items = sorted_items[:k]
-
-            if sorted_items:
-                distances, documents, metadatas = map(list, zip(*sorted_items))
-            else:
-                distances, documents, metadatas = [], [], []
-
-        result = {
-            "distances": [distances],
-            "documents": [documents],
-            "metadatas": [metadatas],
-        }
-
         log.info(
             "query_doc_with_hybrid_search:result "
             + f'{result["metadatas"]} {result["distances"]}'
@@ -398,29 +522,66 @@ def get_all_items_from_collections(collection_names: list[str]) -> dict:
     return merge_get_results(results)
 
 
+def get_model_cache_params(config) -> dict:
+    """The embedding and reranking models a query result depends on."""
+    return {
+        "embedding_engine": config.RAG_EMBEDDING_ENGINE,
+        "embedding_model": config.RAG_EMBEDDING_MODEL,
+        "reranking_engine": config.RAG_RERANKING_ENGINE,
+        "reranking_model": config.RAG_RERANKING_MODEL,
+    }
+
+
+async def get_query_result_cache_key(
+    kind: str,
+    collection_names: list[str],
+    queries: list[str],
+    model_params: Optional[dict],
+    **params,
+) -> Optional[str]:
+    # Without the models behind it, a result cannot be told apart from one
+    # computed by another process or before a model change
+    if not QUERY_RESULT_CACHE.enabled or model_params is None:
+        return None
+    # Keyed on each collection's write version, so any write is a miss
+    return QUERY_RESULT_CACHE.get_key(
+        kind,
+        queries,
+        collection_names,
+        await VECTOR_DB_CLIENT.aget_versions(collection_names),
+        {**params, **model_params, "query_prefix": RAG_EMBEDDING_QUERY_PREFIX},
+    )
+
+
+def cache_query_result(
+    cache_key: Optional[str], result: dict, error: bool = False
+) -> dict:
+    # A result missing a failed collection would outlive the failure
+    if cache_key and not error and result["documents"] and result["documents"][0]:
+        QUERY_RESULT_CACHE.set(cache_key, result)
+    return result
+
+
 async def query_collection(
     collection_names: list[str],
     queries: list[str],
     embedding_function,
     k: int,
+    model_params: Optional[dict] = None,
 ) -> dict:
     results = []
     error = False
+    collection_names = [name for name in collection_names if name]
 
-    def process_query_collection(collection_name, query_embedding):
-        try:
-            if collection_name:
-                result = query_doc(
-                    collection_name=collection_name,
-                    k=k,
-                    query_embedding=query_embedding,
-                )
-                if result is not None:
-                    return result.model_dump(), None
-            return None, None
-        except Exception as e:
-            log.exception(f"Error when querying the collection: {e}")
-            return None, e
+    # Expanded queries may repeat, search each distinct query only once
+    queries = list(dict.fromkeys(queries))
+
+    cache_key = await get_query_result_cache_key(
+        "vector", collection_names, queries, model_params, k=k
+    )
+    if cache_key and (cached := QUERY_RESULT_CACHE.get(cache_key)) is not None:
+        log.debug(f"query_collection: cached result for {len(queries)} queries")
+        return cached
 
     # Generate all query embeddings (in one call)
     query_embeddings = await embedding_function(
@@ -430,26 +591,73 @@ async def query_collection(
         f"query_collection: processing {len(queries)} queries across {len(collection_names)} collections"
     )
 
-    with ThreadPoolExecutor() as executor:
-        future_results = []
-        for query_embedding in query_embeddings:
-            for collection_name in collection_names:
-                result = executor.submit(
-                    process_query_collection, collection_name, query_embedding
+    async def search_collections():
+        nonlocal error
+        # The same chunk can live in several collections (a file and its
+        # knowledge base), so fetch k per collection for k unique chunks to
+        # survive the content dedup below
+        limit = k * max(len(collection_names), 1)
+        try:
+            # Every query vector against every collection in one search call
+            return await VECTOR_DB_CLIENT.asearch_many(
+                collection_names=collection_names,
+                vectors=query_embeddings,
+                limit=limit,
+            )
+        except Exception as e:
+            if len(collection_names) <= 1:
+                raise
+            log.warning(f"Batched collection search failed, searching one by one: {e}")
+
+        # A failing collection must not drop the results of the others; the
+        # same limit keeps the results independent of the path taken
+        collection_results = await asyncio.gather(
+            *[
+                VECTOR_DB_CLIENT.asearch(
+                    collection_name=collection_name,
+                    vectors=query_embeddings,
+                    limit=limit,
                 )
-                future_results.append(result)
-        task_results = [future.result() for future in future_results]
-
-    for result, err in task_results:
-        if err is not None:
-            error = True
-        elif result is not None:
-            results.append(result)
+                for collection_name in collection_names
+            ],
+            return_exceptions=True,
+        )
+        for collection_name, collection_result in zip(
+            collection_names, collection_results
+        ):
+            if isinstance(collection_result, Exception):
+                error = True
+                log.error(
+                    f"Error when querying the collection {collection_name}: "
+                    f"{collection_result}"
+                )
+        return merge_search_results(
+            [
+                collection_result
+                for collection_result in collection_results
+                if not isinstance(collection_result, Exception)
+            ]
+        )
 
-    if error and not results:
+    try:
+        result = await search_collections()
+        if result is not None:
+            log.info(f"query_collection:result {result.ids} {result.metadatas}")
+            results = [
+                {
+                    "distances": [result.distances[idx]],
+                    "documents": [result.documents[idx]],
+                    "metadatas": [result.metadatas[idx]],
+                }
+                for idx in range(len(result.ids or []))
+            ]
+    except Exception as e:
+        log.exception(f"Error when querying the collections: {e}")
         log.warning("All collection queries failed. No results returned.")
 
-    return merge_and_sort_query_results(results, k=k)
+    return cache_query_result(
+        cache_key, merge_and_sort_query_results(results, k=k), error
+    )
 
 
 async def query_collection_with_hybrid_search(
@@ -462,28 +670,146 @@ async def query_collection_with_hybrid_search(
     r: float,
     hybrid_bm25_weight: float,
     enable_enriched_texts: bool = False,
+    pooled_rerank: bool = RAG_HYBRID_POOLED_RERANK,
+    model_params: Optional[dict] = None,
 ) -> dict:
     results = []
     error = False
-    # Fetch collection data once per collection sequentially
+    # Expanded queries may repeat, search each distinct query only once
+    queries = list(dict.fromkeys(queries))
+
+    cache_key = await get_query_result_cache_key(
+        "hybrid",
+        collection_names,
+        queries,
+        model_params,
+        k=k,
+        reranking=reranking_function is not None,
+        k_reranker=k_reranker,
+        r=r,
+        hybrid_bm25_weight=hybrid_bm25_weight,
+        enable_enriched_texts=enable_enriched_texts,
+        pooled_rerank=pooled_rerank,
+    )
+    if cache_key and (cached := QUERY_RESULT_CACHE.get(cache_key)) is not None:
+        log.debug(
+            f"query_collection_with_hybrid_search: cached result for {len(queries)} queries"
+        )
+        return cached
+
+    # Fetch collection data once per collection, concurrently
     # Avoid fetching the same data multiple times later
-    collection_results = {}
-    for collection_name in collection_names:
+    async def fetch_collection(collection_name):
+        nonlocal error
         try:
             log.debug(
-                f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.get:collection {collection_name}"
-            )
-            collection_results[collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=collection_name
+                f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.aget:collection {collection_name}"
             )
+            return await VECTOR_DB_CLIENT.aget(collection_name=collection_name)
         except Exception as e:
             log.exception(f"Failed to fetch collection {collection_name}: {e}")
-            collection_results[collection_name] = None
+            error = True
+            return None
+
+    collection_results = dict(
+        zip(
+            collection_names,
+            await asyncio.gather(
+                *[
+                    fetch_collection(collection_name)
+                    for collection_name in collection_names
+                ]
+            ),
+        )
+    )
 
     log.info(
         f"Starting hybrid search for {len(queries)} queries in {len(collection_names)} collections..."
     )
 
+    def score_bm25(collection_name):
+        collection_result = collection_results[collection_name]
+        if (
+            not collection_result
+            or not collection_result.ids
+            or not collection_result.ids[0]
+        ):
+            return None
+
+        # Score every query against the collection in one batch
+        ensure_bm25_index(collection_name, collection_result, enable_enriched_texts)
+        positions = {
+            doc_id: idx for idx, doc_id in enumerate(collection_result.ids[0])
+        }
+        return {
+            query: get_bm25_result(collection_result, hits, positions)
+            for query, hits in zip(
+                queries, BM25_INDEX.search_many(collection_name, queries, k)
+            )
+        }
+
+    async def score_bm25_async(collection_name):
+        nonlocal error
+        try:
+            return await asyncio.to_thread(score_bm25, collection_name)
+        except Exception as e:
+            log.exception(f"Failed to score BM25 for {collection_name}: {e}")
+            error = True
+            return None
+
+    # Score all collections concurrently; a failure only drops its collection
+    bm25_collection_names = [
+        collection_name
+        for collection_name in collection_names
+        if collection_results[collection_name] is not None and hybrid_bm25_weight > 0
+    ]
+    bm25_results = {
+        collection_name: result
+        for collection_name, result in zip(
+            bm25_collection_names,
+            await asyncio.gather(
+                *[
+                    score_bm25_async(collection_name)
+                    for collection_name in bm25_collection_names
+                ]
+            ),
+        )
+        if result is not None
+    }
+
+    # Embed all queries in one call instead of once per (collection, query)
+    query_embeddings = {}
+    if hybrid_bm25_weight < 1 and any(
+        result is not None for result in collection_results.values()
+    ):
+        try:
+            query_embeddings = dict(
+                zip(
+                    queries,
+                    await embedding_function(
+                        queries, prefix=RAG_EMBEDDING_QUERY_PREFIX
+                    ),
+                )
+            )
+        except Exception as e:
+            log.exception(f"Failed to batch embed queries: {e}")
+
+    if pooled_rerank:
+        result, pooled_error = await rerank_pooled_hybrid_candidates(
+            collection_results=collection_results,
+            queries=queries,
+            embedding_function=embedding_function,
+            k=k,
+            reranking_function=reranking_function,
+            k_reranker=k_reranker,
+            r=r,
+            hybrid_bm25_weight=hybrid_bm25_weight,
+            enable_enriched_texts=enable_enriched_texts,
+            bm25_results=bm25_results,
+            query_embeddings=query_embeddings,
+        )
+        return cache_query_result(cache_key, result, error or pooled_error)
+
     async def process_query(collection_name, query):
         try:
             result = await query_doc_with_hybrid_search(
@@ -497,6 +823,8 @@ async def query_collection_with_hybrid_search(
                 r=r,
                 hybrid_bm25_weight=hybrid_bm25_weight,
                 enable_enriched_texts=enable_enriched_texts,
+                bm25_result=(bm25_results.get(collection_name) or {}).get(query),
+                query_embedding=query_embeddings.get(query),
             )
             return result, None
         except Exception as e:
@@ -528,7 +856,136 @@ async def query_collection_with_hybrid_search(
             "Hybrid search failed for all collections. Using Non-hybrid search as fallback."
         )
 
-    return merge_and_sort_query_results(results, k=k)
+    return cache_query_result(
+        cache_key, merge_and_sort_query_results(results, k=k), error
+    )
+
+
+def get_content_keyed_result(result: SearchResult) -> GetResult:
+    # Chunks are duplicated across collections under different ids (e.g. a
+    # file collection and its knowledge base), so pool them by content
+    return GetResult(
+        ids=[
+            [
+                hashlib.sha256(document.encode()).hexdigest()
+                for document in result.documents[0]
+            ]
+        ],
+        documents=result.documents,
+        metadatas=result.metadatas,
+        vectors=result.vectors,
+    )
+
+
+async def rerank_pooled_hybrid_candidates(
+    collection_results: dict[str, Optional[GetResult]],
+    queries: list[str],
+    embedding_function,
+    k: int,
+    reranking_function,
+    k_reranker: int,
+    r: float,
+    hybrid_bm25_weight: float,
+    enable_enriched_texts: bool = False,
+    bm25_results: Optional[dict] = None,
+    query_embeddings: Optional[dict] = None,
+) -> tuple[dict, bool]:
+    """
+    Rerank the candidates of all collections in one pass per query.
+
+    Each collection's BM25 and vector hits are fused as usual, then the
+    per-collection lists are pooled with RRF and deduplicated by content.
+    Only the pooled top RAG_HYBRID_POOLED_RERANK_TOP_M (default 2 * k)
+    candidates reach the reranker, in a single call per query. Returns the
+    merged result and whether any collection or query failed on the way.
+    """
+    bm25_results = bm25_results or {}
+    query_embeddings = query_embeddings or {}
+    top_m = RAG_HYBRID_POOLED_RERANK_TOP_M or 2 * k
+
+    collection_names = [
+        collection_name
+        for collection_name, collection_result in collection_results.items()
+        if collection_result is not None
+        and collection_result.documents
+        and collection_result.documents[0]
+    ]
+
+    async def get_candidates(collection_name, query):
+        try:
+            candidates, _ = await get_hybrid_candidates(
+                collection_name=collection_name,
+                collection_result=collection_results[collection_name],
+                query=query,
+                embedding_function=embedding_function,
+                k=k,
+                hybrid_bm25_weight=hybrid_bm25_weight,
+                enable_enriched_texts=enable_enriched_texts,
+                bm25_result=(bm25_results.get(collection_name) or {}).get(query),
+                query_embedding=query_embeddings.get(query),
+                include_vectors=(
+                    reranking_function is None or RAG_RERANK_PREFILTER_TOP_M > 0
+                ),
+            )
+            return candidates, None
+        except Exception as e:
+            log.exception(f"Error when collecting hybrid candidates: {e}")
+            return None, e
+
+    async def process_query(query):
+        candidate_results = await asyncio.gather(
+            *[
+                get_candidates(collection_name, query)
+                for collection_name in collection_names
+            ]
+        )
+        candidate_lists = [
+            get_content_keyed_result(candidates)
+            for candidates, err in candidate_results
+            if err is None
+        ]
+        errors = [err for _, err in candidate_results if err is not None]
+        if not candidate_lists:
+            return None, errors
+
+        pooled = fuse_results(
+            candidate_lists, [1.0] * len(candidate_lists), limit=top_m
+        )
+        log.debug(
+            f"rerank_pooled_hybrid_candidates: {len(pooled.ids[0])} pooled candidates "
+            f"from {len(candidate_lists)} collections"
+        )
+        try:
+            result = await rerank_hybrid_candidates(
+                pooled,
+                query=query,
+                embedding_function=embedding_function,
+                k=k,
+                reranking_function=reranking_function,
+                k_reranker=k_reranker,
+                r=r,
+                query_embedding=query_embeddings.get(query),
+            )
+        except Exception as e:
+            log.exception(f"Error when reranking pooled hybrid candidates: {e}")
+            return None, [*errors, e]
+        return result, errors
+
+    results = []
+    error = False
+    for result, errors in await asyncio.gather(
+        *[process_query(query) for query in queries]
+    ):
+        error = error or bool(errors)
+        if result is not None:
+            results.append(result)
+
+    if error and not results:
+        raise Exception(
+            "Hybrid search failed for all collections. Using Non-hybrid search as fallback."
+        )
+
+    return merge_and_sort_query_results(results, k=k), error
 
 
 def generate_openai_batch_embeddings(
@@ -791,7 +1248,15 @@ def get_embedding_function(
     embedding_batch_size,
     azure_api_version=None,
     enable_async=True,
+    cache_embeddings=True,
 ) -> Awaitable:
+    def cached(async_embedding_function):
+        if not cache_embeddings:
+            return async_embedding_function
+        return QUERY_EMBEDDING_CACHE.wrap(
+            embedding_engine, embedding_model, async_embedding_function
+        )
+
     if embedding_engine == "":
         # Sentence transformers: CPU-bound sync operation
         async def async_embedding_function(query, prefix=None, user=None):
@@ -807,7 +1272,7 @@ def get_embedding_function(
                 prefix,
             )
 
-        return async_embedding_function
+        return cached(async_embedding_function)
     elif embedding_engine in ["ollama", "openai", "azure_openai"]:
         embedding_function = lambda query, prefix=None, user=None: generate_embeddings(
             engine=embedding_engine,
@@ -861,7 +1326,7 @@ def get_embedding_function(
             else:
                 return await embedding_function(query, prefix, user)
 
-        return async_embedding_function
+        return cached(async_embedding_function)
     else:
         raise ValueError(f"Unknown embedding engine: {embedding_engine}")
 
@@ -914,272 +1379,361 @@ async def generate_embeddings(
         return embeddings[0] if isinstance(text, str) else embeddings
 
 
+def get_document_text(document) -> str:
+    # Rerank candidates are plain strings or langchain Documents
+    return document if isinstance(document, str) else document.page_content
+
+
 def get_reranking_function(reranking_engine, reranking_model, reranking_function):
     if reranking_function is None:
         return None
+    # Only (query, chunk) pairs missing from the score cache reach the model
+    cache_key = f"{reranking_engine}:{reranking_model}"
+
+    if hasattr(reranking_function, "apredict"):
+        # Pooled HTTP client or micro-batcher, awaited without a worker thread
+        cached_apredict = RERANK_SCORE_CACHE.wrap_async(
+            cache_key,
+            lambda query, texts, user=None: reranking_function.apredict(
+                [(query, text) for text in texts],
+                user=user if reranking_engine == "external" else None,
+            ),
+        )
+
+        async def async_reranking_function(query, documents, user=None):
+            return await cached_apredict(
+                query, [get_document_text(doc) for doc in documents], user=user
+            )
+
+        return async_reranking_function
+
     if reranking_engine == "external":
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents], user=user
+        predict = lambda query, texts, user=None: reranking_function.predict(
+            [(query, text) for text in texts], user=user
         )
     else:
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents]
+        predict = lambda query, texts, user=None: reranking_function.predict(
+            [(query, text) for text in texts]
+        )
+    cached_predict = RERANK_SCORE_CACHE.wrap(cache_key, predict)
+
+    # Local models are CPU/GPU bound, run them off the event loop
+    async def async_reranking_function(query, documents, user=None):
+        return await asyncio.to_thread(
+            cached_predict,
+            query,
+            [get_document_text(doc) for doc in documents],
+            user,
         )
 
+    return async_reranking_function
 
-async def get_sources_from_items(
-    request,
-    items,
-    queries,
-    embedding_function,
-    k,
-    reranking_function,
-    k_reranker,
-    r,
-    hybrid_bm25_weight,
-    hybrid_search,
-    full_context=False,
-    user: Optional[Any] = None,
-):
-    log.debug(
-        f"items: {items} {queries} {embedding_function} {reranking_function} {full_context}"
-    )
-
-    extracted_collections = []
-    query_results = []
-
-    for item in items:
-        query_result = None
-        collection_names = []
 
-        if item.get("type") == "text":
-            # Raw Text
-            # Used during temporary chat file uploads or web page & youtube attachements
+def resolve_item(request, item, user=None) -> tuple[Optional[dict], list]:
+    """
+    Resolve an attached item to its inline content or its collections.
 
-            if item.get("context") == "full":
-                if item.get("file"):
-                    # if item has file data, use it
-                    query_result = {
-                        "documents": [
-                            [item.get("file", {}).get("data", {}).get("content")]
-                        ],
-                        "metadatas": [[item.get("file", {}).get("meta", {})]],
-                    }
+    Returns (query_result, collection_names): items carrying their own
+    content (text, note, chat, url, full context files) yield a
+    query_result, the others the collection names to search.
+    """
+    query_result = None
+    collection_names = []
 
-            if query_result is None:
-                # Fallback
-                if item.get("collection_name"):
-                    # If item has a collection name, use it
-                    collection_names.append(item.get("collection_name"))
-                elif item.get("file"):
-                    # If item has file data, use it
-                    query_result = {
-                        "documents": [
-                            [item.get("file", {}).get("data", {}).get("content")]
-                        ],
-                        "metadatas": [[item.get("file", {}).get("meta", {})]],
-                    }
-                else:
-                    # Fallback to item content
-                    query_result = {
-                        "documents": [[item.get("content")]],
-                        "metadatas": [
-                            [{"file_id": item.get("id"), "name": item.get("name")}]
-                        ],
-                    }
+    if item.get("type") == "text":
+        # Raw Text
+        # Used during temporary chat file uploads or web page & youtube attachements
 
-        elif item.get("type") == "note":
-            # Note Attached
-            note = Notes.get_note_by_id(item.get("id"))
+        if item.get("context") == "full":
+            if item.get("file"):
+                # if item has file data, use it
+                query_result = {
+                    "documents": [
+                        [item.get("file", {}).get("data", {}).get("content")]
+                    ],
+                    "metadatas": [[item.get("file", {}).get("meta", {})]],
+                }
 
-            if note and (
-                user.role == "admin"
-                or note.user_id == user.id
-                or get_permission_provider(request).has_access(user.id, "read", note.access_control)
-            ):
-                # User has access to the note
+        if query_result is None:
+            # Fallback
+            if item.get("collection_name"):
+                # If item has a collection name, use it
+                collection_names.append(item.get("collection_name"))
+            elif item.get("file"):
+                # If item has file data, use it
                 query_result = {
-                    "documents": [[note.data.get("content", {}).get("md", "")]],
-                    "metadatas": [[{"file_id": note.id, "name": note.title}]],
+                    "documents": [
+                        [item.get("file", {}).get("data", {}).get("content")]
+                    ],
+                    "metadatas": [[item.get("file", {}).get("meta", {})]],
+                }
+            else:
+                # Fallback to item content
+                query_result = {
+                    "documents": [[item.get("content")]],
+                    "metadatas": [
+                        [{"file_id": item.get("id"), "name": item.get("name")}]
+                    ],
                 }
 
-        elif item.get("type") == "chat":
-            # Chat Attached
-            chat = Chats.get_chat_by_id(item.get("id"))
+    elif item.get("type") == "note":
+        # Note Attached
+        note = Notes.get_note_by_id(item.get("id"))
 
-            if chat and (user.role == "admin" or chat.user_id == user.id):
-                messages_map = chat.chat.get("history", {}).get("messages", {})
-                message_id = chat.chat.get("history", {}).get("currentId")
+        if note and (
+            user.role == "admin"
+            or note.user_id == user.id
+            or get_permission_provider(request).has_access(user.id, "read", note.access_control)
+        ):
+            # User has access to the note
+            query_result = {
+                "documents": [[note.data.get("content", {}).get("md", "")]],
+                "metadatas": [[{"file_id": note.id, "name": note.title}]],
+            }
 
-                if messages_map and message_id:
-                    # Reconstruct the message list in order
-                    message_list = get_message_list(messages_map, message_id)
-                    message_history = "\n".join(
-                        [
-                            f"#### {m.get('role', 'user').capitalize()}\n{m.get('content')}\n"
-                            for m in message_list
-                        ]
-                    )
+    elif item.get("type") == "chat":
+        # Chat Attached
+        chat = Chats.get_chat_by_id(item.get("id"))
+
+        if chat and (user.role == "admin" or chat.user_id == user.id):
+            messages_map = chat.chat.get("history", {}).get("messages", {})
+            message_id = chat.chat.get("history", {}).get("currentId")
+
+            if messages_map and message_id:
+                # Reconstruct the message list in order
+                message_list = get_message_list(messages_map, message_id)
+                message_history = "\n".join(
+                    [
+                        f"#### {m.get('role', 'user').capitalize()}\n{m.get('content')}\n"
+                        for m in message_list
+                    ]
+                )
 
-                    # User has access to the chat
-                    query_result = {
-                        "documents": [[message_history]],
-                        "metadatas": [[{"file_id": chat.id, "name": chat.title}]],
-                    }
+                # User has access to the chat
+                query_result = {
+                    "documents": [[message_history]],
+                    "metadatas": [[{"file_id": chat.id, "name": chat.title}]],
+                }
 
-        elif item.get("type") == "url":
-            content, docs = get_content_from_url(request, item.get("url"))
-            if docs:
+    elif item.get("type") == "url":
+        content, docs = get_content_from_url(request, item.get("url"))
+        if docs:
+            query_result = {
+                "documents": [[content]],
+                "metadatas": [[{"url": item.get("url"), "name": item.get("url")}]],
+            }
+    elif item.get("type") == "file":
+        if (
+            item.get("context") == "full"
+            or request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+        ):
+            if item.get("file", {}).get("data", {}).get("content", ""):
+                # Manual Full Mode Toggle
+                # Used from chat file modal, we can assume that the file content will be available from item.get("file").get("data", {}).get("content")
                 query_result = {
-                    "documents": [[content]],
-                    "metadatas": [[{"url": item.get("url"), "name": item.get("url")}]],
+                    "documents": [
+                        [item.get("file", {}).get("data", {}).get("content", "")]
+                    ],
+                    "metadatas": [
+                        [
+                            {
+                                "file_id": item.get("id"),
+                                "name": item.get("name"),
+                                **item.get("file")
+                                .get("data", {})
+                                .get("metadata", {}),
+                            }
+                        ]
+                    ],
                 }
-        elif item.get("type") == "file":
-            if (
-                item.get("context") == "full"
-                or request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
-            ):
-                if item.get("file", {}).get("data", {}).get("content", ""):
-                    # Manual Full Mode Toggle
-                    # Used from chat file modal, we can assume that the file content will be available from item.get("file").get("data", {}).get("content")
+            elif item.get("id"):
+                file_object = Files.get_file_by_id(item.get("id"))
+                if file_object:
                     query_result = {
-                        "documents": [
-                            [item.get("file", {}).get("data", {}).get("content", "")]
-                        ],
+                        "documents": [[file_object.data.get("content", "")]],
                         "metadatas": [
                             [
                                 {
                                     "file_id": item.get("id"),
-                                    "name": item.get("name"),
-                                    **item.get("file")
-                                    .get("data", {})
-                                    .get("metadata", {}),
+                                    "name": file_object.filename,
+                                    "source": file_object.filename,
                                 }
                             ]
                         ],
                     }
-                elif item.get("id"):
-                    file_object = Files.get_file_by_id(item.get("id"))
-                    if file_object:
-                        query_result = {
-                            "documents": [[file_object.data.get("content", "")]],
-                            "metadatas": [
-                                [
-                                    {
-                                        "file_id": item.get("id"),
-                                        "name": file_object.filename,
-                                        "source": file_object.filename,
-                                    }
-                                ]
-                            ],
-                        }
+        else:
+            # Fallback to collection names
+            if item.get("legacy"):
+                collection_names.append(f"{item['id']}")
             else:
-                # Fallback to collection names
-                if item.get("legacy"):
-                    collection_names.append(f"{item['id']}")
-                else:
-                    collection_names.append(f"file-{item['id']}")
+                collection_names.append(f"file-{item['id']}")
 
-        elif item.get("type") == "collection":
-            # Manual Full Mode Toggle for Collection
-            knowledge_base = Knowledges.get_knowledge_by_id(item.get("id"))
+    elif item.get("type") == "collection":
+        # Manual Full Mode Toggle for Collection
+        knowledge_base = Knowledges.get_knowledge_by_id(item.get("id"))
 
-            if knowledge_base and (
-                user.role == "admin"
-                or knowledge_base.user_id == user.id
-                or get_permission_provider(request).has_access(user.id, "read", knowledge_base.access_control)
+        if knowledge_base and (
+            user.role == "admin"
+            or knowledge_base.user_id == user.id
+            or get_permission_provider(request).has_access(user.id, "read", knowledge_base.access_control)
+        ):
+            if (
+                item.get("context") == "full"
+                or request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
             ):
-                if (
-                    item.get("context") == "full"
-                    or request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+                if knowledge_base and (
+                    user.role == "admin"
+                    or knowledge_base.user_id == user.id
+                    or get_permission_provider(request).has_access(user.id, "read", knowledge_base.access_control)
                 ):
-                    if knowledge_base and (
-                        user.role == "admin"
-                        or knowledge_base.user_id == user.id
-                        or get_permission_provider(request).has_access(user.id, "read", knowledge_base.access_control)
-                    ):
-                        files = Knowledges.get_files_by_id(knowledge_base.id)
-
-                        documents = []
-                        metadatas = []
-                        for file in files:
-                            documents.append(file.data.get("content", ""))
-                            metadatas.append(
-                                {
-                                    "file_id": file.id,
-                                    "name": file.filename,
-                                    "source": file.filename,
-                                }
-                            )
+                    files = Knowledges.get_files_by_id(knowledge_base.id)
+
+                    documents = []
+                    metadatas = []
+                    for file in files:
+                        documents.append(file.data.get("content", ""))
+                        metadatas.append(
+                            {
+                                "file_id": file.id,
+                                "name": file.filename,
+                                "source": file.filename,
+                            }
+                        )
 
-                        query_result = {
-                            "documents": [documents],
-                            "metadatas": [metadatas],
-                        }
+                    query_result = {
+                        "documents": [documents],
+                        "metadatas": [metadatas],
+                    }
+            else:
+                # Fallback to collection names
+                if item.get("legacy"):
+                    collection_names = item.get("collection_names", [])
                 else:
-                    # Fallback to collection names
-                    if item.get("legacy"):
-                        collection_names = item.get("collection_names", [])
-                    else:
-                        collection_names.append(item["id"])
-
-        elif item.get("docs"):
-            # BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL
-            query_result = {
-                "documents": [[doc.get("content") for doc in item.get("docs")]],
-                "metadatas": [[doc.get("metadata") for doc in item.get("docs")]],
-            }
-        elif item.get("collection_name"):
-            # Direct Collection Name
-            collection_names.append(item["collection_name"])
-        elif item.get("collection_names"):
-            # Collection Names List
-            collection_names.extend(item["collection_names"])
+                    collection_names.append(item["id"])
 
-        # If query_result is None
-        # Fallback to collection names and vector search the collections
-        if query_result is None and collection_names:
-            collection_names = set(collection_names).difference(extracted_collections)
-            if not collection_names:
-                log.debug(f"skipping {item} as it has already been extracted")
-                continue
+    elif item.get("docs"):
+        # BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL
+        query_result = {
+            "documents": [[doc.get("content") for doc in item.get("docs")]],
+            "metadatas": [[doc.get("metadata") for doc in item.get("docs")]],
+        }
+    elif item.get("collection_name"):
+        # Direct Collection Name
+        collection_names.append(item["collection_name"])
+    elif item.get("collection_names"):
+        # Collection Names List
+        collection_names.extend(item["collection_names"])
+
+    return query_result, collection_names
+
+
+async def get_sources_from_items(
+    request,
+    items,
+    queries,
+    embedding_function,
+    k,
+    reranking_function,
+    k_reranker,
+    r,
+    hybrid_bm25_weight,
+    hybrid_search,
+    full_context=False,
+    user: Optional[Any] = None,
+):
+    log.debug(
+        f"items: {items} {queries} {embedding_function} {reranking_function} {full_context}"
+    )
+
+    # Items are resolved and searched concurrently, at most
+    # RAG_SOURCES_MAX_CONCURRENCY at a time, results keep the item order
+    semaphore = asyncio.Semaphore(max(RAG_SOURCES_MAX_CONCURRENCY, 1))
 
+    async def resolve(item):
+        async with semaphore:
+            # Database lookups and url fetches block, keep them off the loop
+            return await asyncio.to_thread(resolve_item, request, item, user)
+
+    async def search(collection_names):
+        async with semaphore:
             try:
                 if full_context:
-                    query_result = get_all_items_from_collections(collection_names)
-                else:
-                    query_result = None  # Initialize to None
-                    if hybrid_search:
-                        try:
-                            query_result = await query_collection_with_hybrid_search(
-                                collection_names=collection_names,
-                                queries=queries,
-                                embedding_function=embedding_function,
-                                k=k,
-                                reranking_function=reranking_function,
-                                k_reranker=k_reranker,
-                                r=r,
-                                hybrid_bm25_weight=hybrid_bm25_weight,
-                                enable_enriched_texts=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS,
-                            )
-                        except Exception as e:
-                            log.debug(
-                                "Error when using hybrid search, using non hybrid search as fallback."
-                            )
-
-                    # fallback to non-hybrid search
-                    if not hybrid_search and query_result is None:
-                        query_result = await query_collection(
+                    return await asyncio.to_thread(
+                        get_all_items_from_collections, collection_names
+                    )
+
+                query_result = None  # Initialize to None
+                if hybrid_search:
+                    try:
+                        query_result = await query_collection_with_hybrid_search(
                             collection_names=collection_names,
                             queries=queries,
                             embedding_function=embedding_function,
                             k=k,
+                            reranking_function=reranking_function,
+                            k_reranker=k_reranker,
+                            r=r,
+                            hybrid_bm25_weight=hybrid_bm25_weight,
+                            enable_enriched_texts=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS,
+                            model_params=get_model_cache_params(
+                                request.app.state.config
+                            ),
+                        )
+                    except Exception as e:
+                        log.debug(
+                            "Error when using hybrid search, using non hybrid search as fallback."
                         )
+
+                # fallback to non-hybrid search
+                if not hybrid_search and query_result is None:
+                    query_result = await query_collection(
+                        collection_names=collection_names,
+                        queries=queries,
+                        embedding_function=embedding_function,
+                        k=k,
+                        model_params=get_model_cache_params(
+                            request.app.state.config
+                        ),
+                    )
+                return query_result
             except Exception as e:
                 log.exception(e)
+                return None
+
+    resolved = await asyncio.gather(*[resolve(item) for item in items])
+
+    # De-duplicate collections in item order before any search starts, so
+    # a collection is only searched for the first item that references it
+    extracted_collections = []
+    searches = {}
+    for idx, (item, (query_result, collection_names)) in enumerate(
+        zip(items, resolved)
+    ):
+        # If query_result is None
+        # Fallback to collection names and vector search the collections
+        if query_result is None and collection_names:
+            collection_names = set(collection_names).difference(extracted_collections)
+            if not collection_names:
+                log.debug(f"skipping {item} as it has already been extracted")
+                continue
 
+            searches[idx] = collection_names
             extracted_collections.extend(collection_names)
 
+    search_results = dict(
+        zip(
+            searches,
+            await asyncio.gather(
+                *[search(collection_names) for collection_names in searches.values()]
+            ),
+        )
+    )
+
+    query_results = []
+    for idx, (item, (query_result, _)) in enumerate(zip(items, resolved)):
+        if idx in searches:
+            query_result = search_results[idx]
+
         if query_result:
             if "data" in item:
                 del item["data"]
@@ -1252,11 +1806,29 @@ from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
 
 
+def cosine_similarity(query_embedding: list[float], embeddings: Sequence) -> list:
+    """
+    Cosine similarity of one query embedding against document embeddings.
+
+    Document vectors longer than the query are truncated to its dimension;
+    some stores (pgvector, opengauss) zero-pad vectors to a fixed length,
+    which leaves dot products and norms unchanged.
+    """
+    dimension = len(query_embedding)
+    query = np.asarray(query_embedding, dtype=np.float32)
+    matrix = np.asarray(
+        [embedding[:dimension] for embedding in embeddings], dtype=np.float32
+    )
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    return (matrix @ query / np.where(norms == 0, 1.0, norms)).tolist()
+
+
 class RerankCompressor(BaseDocumentCompressor):
     embedding_function: Any
     top_n: int
     reranking_function: Any
     r_score: float
+    prefilter_top_m: int = 0
 
     class Config:
         extra = "forbid"
@@ -1281,43 +1853,142 @@ class RerankCompressor(BaseDocumentCompressor):
         """
         return []
 
-    async def acompress_documents(
+    async def asimilarity(
         self,
-        documents: Sequence[Document],
         query: str,
-        callbacks: Optional[Callbacks] = None,
-    ) -> Sequence[Document]:
-        reranking = self.reranking_function is not None
-
-        scores = None
-        if reranking:
-            scores = await asyncio.to_thread(self.reranking_function, query, documents)
-        else:
-            from sentence_transformers import util
+        documents: Sequence,
+        vectors: Optional[Sequence] = None,
+        query_embedding: Optional[list[float]] = None,
+    ) -> list[float]:
+        """
+        Cosine similarity of documents to the query.
 
+        Stored document vectors (aligned with documents, None where unknown)
+        and the query embedding are reused when given, so only documents
+        without a usable vector are embedded.
+        """
+        if query_embedding is None:
             query_embedding = await self.embedding_function(
                 query, RAG_EMBEDDING_QUERY_PREFIX
             )
-            document_embedding = await self.embedding_function(
-                [doc.page_content for doc in documents], RAG_EMBEDDING_CONTENT_PREFIX
+
+        document_embeddings = list(vectors) if vectors else [None] * len(documents)
+        missing = [
+            idx
+            for idx, vector in enumerate(document_embeddings)
+            if vector is None or len(vector) < len(query_embedding)
+        ]
+        if missing:
+            embeddings = await self.embedding_function(
+                [get_document_text(documents[idx]) for idx in missing],
+                RAG_EMBEDDING_CONTENT_PREFIX,
             )
-            scores = util.cos_sim(query_embedding, document_embedding)[0]
+            for idx, embedding in zip(missing, embeddings):
+                document_embeddings[idx] = embedding
+        log.debug(
+            f"RerankCompressor:asimilarity reused {len(documents) - len(missing)} "
+            f"stored vectors, embedded {len(missing)} documents"
+        )
 
-        if scores is not None:
-            docs_with_scores = list(
-                zip(
-                    documents,
-                    scores.tolist() if not isinstance(scores, list) else scores,
+        return cosine_similarity(query_embedding, document_embeddings)
+
+    async def ascore(
+        self,
+        query: str,
+        documents: Sequence,
+        vectors: Optional[Sequence] = None,
+        query_embedding: Optional[list[float]] = None,
+    ) -> Optional[list]:
+        """
+        Score documents (strings or Documents) against the query.
+
+        Without a reranking function documents are scored by cosine
+        similarity (see asimilarity).
+        """
+        if not documents:
+            return []
+
+        if self.reranking_function is not None:
+            if asyncio.iscoroutinefunction(self.reranking_function):
+                scores = await self.reranking_function(query, documents)
+            else:
+                # Plain callables may wrap an async reranking function
+                scores = await asyncio.to_thread(
+                    self.reranking_function, query, documents
                 )
+                if inspect.isawaitable(scores):
+                    scores = await scores
+        else:
+            scores = await self.asimilarity(
+                query, documents, vectors=vectors, query_embedding=query_embedding
             )
-            if self.r_score:
-                docs_with_scores = [
-                    (d, s) for d, s in docs_with_scores if s >= self.r_score
-                ]
 
-            result = sorted(docs_with_scores, key=operator.itemgetter(1), reverse=True)
+        if scores is None:
+            return None
+        return scores.tolist() if not isinstance(scores, list) else scores
+
+    async def arerank(
+        self,
+        query: str,
+        documents: Sequence,
+        vectors: Optional[Sequence] = None,
+        query_embedding: Optional[list[float]] = None,
+    ) -> Optional[list[tuple[int, float]]]:
+        """
+        Return (index, score) pairs of the best documents, best first.
+
+        Documents below r_score are dropped and at most top_n are kept.
+        With prefilter_top_m set, only the documents closest to the query
+        by vector similarity (at least top_n) reach the reranking function.
+        None means no valid scores could be computed.
+        """
+        indices = list(range(len(documents)))
+        top_m = max(self.prefilter_top_m, self.top_n)
+        if (
+            self.reranking_function is not None
+            and self.prefilter_top_m > 0
+            and len(documents) > top_m
+        ):
+            similarities = np.asarray(
+                await self.asimilarity(
+                    query, documents, vectors=vectors, query_embedding=query_embedding
+                )
+            )
+            # Keep the candidate order for the reranker
+            indices = sorted(np.argsort(-similarities, kind="stable")[:top_m].tolist())
+            log.debug(
+                f"RerankCompressor:arerank prefiltered {len(documents)} "
+                f"candidates to {len(indices)}"
+            )
+            documents = [documents[idx] for idx in indices]
+            vectors = [vectors[idx] for idx in indices] if vectors else None
+
+        scores = await self.ascore(
+            query, documents, vectors=vectors, query_embedding=query_embedding
+        )
+        if scores is None:
+            return None
+
+        ranked = [
+            (indices[idx], score)
+            for idx, score in enumerate(scores)
+            if not self.r_score or score >= self.r_score
+        ]
+        ranked.sort(key=operator.itemgetter(1), reverse=True)
+        return ranked[: self.top_n]
+
+    async def acompress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Optional[Callbacks] = None,
+    ) -> Sequence[Document]:
+        ranked = await self.arerank(query, documents)
+
+        if ranked is not None:
             final_results = []
-            for doc, doc_score in result[: self.top_n]:
+            for idx, doc_score in ranked:
+                doc = documents[idx]
                 metadata = doc.metadata
                 metadata["score"] = doc_score
                 doc = Document(
@@ -0,0 +1,387 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from rag_system.backend.retrieval.vector.main import (
+    GetResult,
+    SearchResult,
+    VectorDBBase,
+    VectorItem,
+)
+
+log = logging.getLogger(__name__)
+
+
+def estimate_result_size(result: GetResult) -> int:
+    """Roughly estimate the in-memory size of a GetResult in bytes."""
+    size = 0
+    for documents in result.documents or []:
+        size += sum(len(document or "") for document in documents)
+    for metadatas in result.metadatas or []:
+        for metadata in metadatas:
+            if isinstance(metadata, dict):
+                size += sum(
+                    len(str(key)) + len(str(value)) for key, value in metadata.items()
+                )
+    for ids in result.ids or []:
+        size += sum(len(id) for id in ids)
+    return size
+
+
+class CollectionSnapshotCache:
+    """
+    Bounded LRU cache of full collection snapshots.
+
+    Entries are tagged with the collection write version they were read at,
+    so a snapshot taken before a write is never served after it.
+    """
+
+    def __init__(self, max_bytes: int, ttl: int = 0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[int, float, int, GetResult]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, collection_name: str, version: int) -> Optional[GetResult]:
+        with self._lock:
+            entry = self._entries.get(collection_name)
+            if entry is not None:
+                entry_version, created_at, _, result = entry
+                if entry_version == version and (
+                    not self.ttl or time.monotonic() - created_at < self.ttl
+                ):
+                    self._entries.move_to_end(collection_name)
+                    self.hits += 1
+                    return result
+                self._pop(collection_name)
+            self.misses += 1
+            return None
+
+    def set(self, collection_name: str, version: int, result: GetResult) -> None:
+        size = estimate_result_size(result)
+        if size > self.max_bytes:
+            log.debug(
+                f"snapshot_cache:skip {collection_name} ({size} bytes exceeds limit)"
+            )
+            return
+
+        with self._lock:
+            self._pop(collection_name)
+            self._entries[collection_name] = (version, time.monotonic(), size, result)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._entries:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, collection_name: Optional[str] = None) -> None:
+        with self._lock:
+            if collection_name is None:
+                self._entries.clear()
+                self.current_bytes = 0
+            else:
+                self._pop(collection_name)
+
+    def _pop(self, collection_name: str) -> None:
+        entry = self._entries.pop(collection_name, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class CollectionVersionStore:
+    """
+    Write counters of collections, shared by every process using the file.
+
+    Each collection has a counter in SQLite next to a global reset counter,
+    so a write made by any server process, before or after a restart,
+    changes the version all of them read.
+    """
+
+    # Row of the reset counter; collection names are never empty
+    _RESET = ""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS collection_version (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    def get(self, collection_name: str) -> int:
+        return self.get_many([collection_name])[0]
+
+    def get_many(self, collection_names: Sequence[str]) -> list[int]:
+        """Return the versions of several collections with one query."""
+        names = list(dict.fromkeys([self._RESET, *collection_names]))
+        with self._lock:
+            counters = dict(
+                self._conn.execute(
+                    "SELECT name, version FROM collection_version "
+                    f"WHERE name IN ({','.join('?' * len(names))})",
+                    names,
+                ).fetchall()
+            )
+        # Both counters only grow, so their sum changes on every write
+        reset = counters.get(self._RESET, 0)
+        return [counters.get(name, 0) + reset for name in collection_names]
+
+    def bump(self, collection_name: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO collection_version VALUES (?, 1) "
+                "ON CONFLICT (name) DO UPDATE SET version = version + 1",
+                (collection_name,),
+            )
+            self._conn.commit()
+
+    def bump_all(self) -> None:
+        self.bump(self._RESET)
+
+
+class VersionedVectorDB(VectorDBBase):
+    """
+    Vector DB wrapper that tracks a write version per collection.
+
+    Every write going through insert/upsert/delete/delete_collection/reset
+    bumps the collection version, which invalidates the cached snapshot
+    served by get(). Versions are kept in a CollectionVersionStore shared
+    by all server processes; the optional TTL only bounds staleness for
+    writes that bypass this wrapper.
+    """
+
+    def __init__(
+        self,
+        client: VectorDBBase,
+        snapshot_cache: CollectionSnapshotCache,
+        versions: CollectionVersionStore,
+    ):
+        self.client = client
+        self.snapshot_cache = snapshot_cache
+        self.versions = versions
+
+    def __getattr__(self, name):
+        # Expose backend specific helpers (close, insert_async, ...)
+        return getattr(self.client, name)
+
+    def get_version(self, collection_name: str) -> int:
+        """Return the current write version of a collection."""
+        return self.versions.get(collection_name)
+
+    async def aget_version(self, collection_name: str) -> int:
+        # A locked SQLite read, kept off the event loop
+        return await asyncio.to_thread(self.versions.get, collection_name)
+
+    async def aget_versions(self, collection_names: Sequence[str]) -> list[int]:
+        """Return the write versions of several collections off the event loop."""
+        return await asyncio.to_thread(self.versions.get_many, collection_names)
+
+    def _bump_version(self, collection_name: str) -> None:
+        self.versions.bump(collection_name)
+        self.snapshot_cache.invalidate(collection_name)
+
+    def has_collection(self, collection_name: str) -> bool:
+        return self.client.has_collection(collection_name=collection_name)
+
+    def delete_collection(self, collection_name: str) -> None:
+        try:
+            return self.client.delete_collection(collection_name=collection_name)
+        finally:
+            self._bump_version(collection_name)
+
+    def insert(self, collection_name: str, items: List[VectorItem]) -> None:
+        try:
+            return self.client.insert(collection_name=collection_name, items=items)
+        finally:
+            self._bump_version(collection_name)
+
+    def upsert(self, collection_name: str, items: List[VectorItem]) -> None:
+        try:
+            return self.client.upsert(collection_name=collection_name, items=items)
+        finally:
+            self._bump_version(collection_name)
+
+    def search(
+        self,
+        collection_name: str,
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        return self.client.search(
+            collection_name=collection_name,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    def query(
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
+    ) -> Optional[GetResult]:
+        # Keep the backend default limit (e.g. -1 for Milvus) when none is given
+        return self.client.query(
+            collection_name=collection_name,
+            filter=filter,
+            include_vectors=include_vectors,
+            **({"limit": limit} if limit is not None else {}),
+        )
+
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
+        # Snapshots only hold text and metadata; vectors are read through
+        if include_vectors or not self.snapshot_cache.enabled:
+            return self.client.get(
+                collection_name=collection_name, include_vectors=include_vectors
+            )
+
+        version = self.get_version(collection_name)
+        result = self.snapshot_cache.get(collection_name, version)
+        if result is not None:
+            log.debug(f"snapshot_cache:hit {collection_name} v{version}")
+            return result
+
+        result = self.client.get(collection_name=collection_name)
+        # Only cache if no write happened while the snapshot was being read
+        if result is not None and self.get_version(collection_name) == version:
+            self.snapshot_cache.set(collection_name, version, result)
+        return result
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        return await self.client.asearch(
+            collection_name=collection_name,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        return self.client.search_many(
+            collection_names=collection_names,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    async def asearch_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        return await self.client.asearch_many(
+            collection_names=collection_names,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    async def aquery(
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
+    ) -> Optional[GetResult]:
+        return await self.client.aquery(
+            collection_name=collection_name,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    async def aget(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
+        if include_vectors or not self.snapshot_cache.enabled:
+            return await self.client.aget(
+                collection_name=collection_name, include_vectors=include_vectors
+            )
+
+        version = await self.aget_version(collection_name)
+        result = self.snapshot_cache.get(collection_name, version)
+        if result is not None:
+            log.debug(f"snapshot_cache:hit {collection_name} v{version}")
+            return result
+
+        result = await self.client.aget(collection_name=collection_name)
+        if result is not None and await self.aget_version(collection_name) == version:
+            self.snapshot_cache.set(collection_name, version, result)
+        return result
+
+    def delete(
+        self,
+        collection_name: str,
+        ids: Optional[List[str]] = None,
+        filter: Optional[Dict] = None,
+    ) -> None:
+        try:
+            return self.client.delete(
+                collection_name=collection_name, ids=ids, filter=filter
+            )
+        finally:
+            self._bump_version(collection_name)
+
+    def reset(self) -> None:
+        try:
+            return self.client.reset()
+        finally:
+            self.versions.bump_all()
+            self.snapshot_cache.invalidate()
@@ -11,7 +11,7 @@ from rag_system.backend.retrieval.vector.main import (
     SearchResult,
     GetResult,
 )
-from rag_system.backend.retrieval.vector.utils import process_metadata
+from rag_system.backend.retrieval.vector.utils import process_metadata, vector_to_list
 
 from rag_system.backend.settings import (
     CHROMA_DATA_PATH,
@@ -74,22 +74,29 @@ class ChromaClient(VectorDBBase):
         vectors: list[list[float | int]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
         try:
             collection = self.client.get_collection(name=collection_name)
             if collection:
+                include = ["documents", "metadatas", "distances"]
+                if include_vectors:
+                    include.append("embeddings")
                 result = collection.query(
                     query_embeddings=vectors,
                     n_results=limit,
                     where=filter,
+                    include=include,
                 )
 
                 # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-odering to 0 -> 1
                 # https://docs.trychroma.com/docs/collections/configure cosine equation
-                distances: list = result["distances"][0]
-                distances = [2 - dist for dist in distances]
-                distances = [[dist / 2 for dist in distances]]
+                # One distance list per query vector
+                distances = [
+                    [(2 - dist) / 2 for dist in query_distances]
+                    for query_distances in result["distances"]
+                ]
 
                 return SearchResult(
                     **{
@@ -97,22 +104,42 @@ class ChromaClient(VectorDBBase):
                         "distances": distances,
                         "documents": result["documents"],
                         "metadatas": result["metadatas"],
+                        "vectors": self._get_vectors(result, nested=True),
                     }
                 )
             return None
         except Exception as e:
             return None
 
+    def _get_vectors(self, result, nested: bool = False) -> Optional[list]:
+        # Embeddings are only present when requested through include
+        embeddings = result.get("embeddings")
+        if embeddings is None:
+            return None
+        if nested:
+            return [
+                [vector_to_list(vector) for vector in vectors] for vectors in embeddings
+            ]
+        return [[vector_to_list(vector) for vector in embeddings]]
+
     def query(
-        self, collection_name: str, filter: dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         # Query the items from the collection based on the filter.
         try:
             collection = self.client.get_collection(name=collection_name)
             if collection:
+                include = ["documents", "metadatas"]
+                if include_vectors:
+                    include.append("embeddings")
                 result = collection.get(
                     where=filter,
                     limit=limit,
+                    include=include,
                 )
 
                 return GetResult(
@@ -120,22 +147,29 @@ class ChromaClient(VectorDBBase):
                         "ids": [result["ids"]],
                         "documents": [result["documents"]],
                         "metadatas": [result["metadatas"]],
+                        "vectors": self._get_vectors(result),
                     }
                 )
             return None
         except:
             return None
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         # Get all the items in the collection.
         collection = self.client.get_collection(name=collection_name)
         if collection:
-            result = collection.get()
+            include = ["documents", "metadatas"]
+            if include_vectors:
+                include.append("embeddings")
+            result = collection.get(include=include)
             return GetResult(
                 **{
                     "ids": [result["ids"]],
                     "documents": [result["documents"]],
                     "metadatas": [result["metadatas"]],
+                    "vectors": self._get_vectors(result),
                 }
             )
         return None
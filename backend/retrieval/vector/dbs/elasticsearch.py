@@ -49,54 +49,71 @@ class ElasticsearchClient(VectorDBBase):
     def _get_index_name(self, dimension: int) -> str:
         return f"{self.index_prefix}_d{str(dimension)}"
 
+    def _source_fields(self, include_vectors: bool = False) -> list[str]:
+        return ["text", "metadata", "vector"] if include_vectors else ["text", "metadata"]
+
     # Status: works
-    def _scan_result_to_get_result(self, result) -> GetResult:
+    def _scan_result_to_get_result(
+        self, result, include_vectors: bool = False
+    ) -> GetResult:
         if not result:
             return None
         ids = []
         documents = []
         metadatas = []
+        vectors = []
 
         for hit in result:
             ids.append(hit["_id"])
             documents.append(hit["_source"].get("text"))
             metadatas.append(hit["_source"].get("metadata"))
+            vectors.append(hit["_source"].get("vector"))
 
-        return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
+        return GetResult(
+            ids=[ids],
+            documents=[documents],
+            metadatas=[metadatas],
+            vectors=[vectors] if include_vectors else None,
+        )
 
     # Status: works
-    def _result_to_get_result(self, result) -> GetResult:
+    def _result_to_get_result(self, result, include_vectors: bool = False) -> GetResult:
         if not result["hits"]["hits"]:
             return None
-        ids = []
-        documents = []
-        metadatas = []
-
-        for hit in result["hits"]["hits"]:
-            ids.append(hit["_id"])
-            documents.append(hit["_source"].get("text"))
-            metadatas.append(hit["_source"].get("metadata"))
-
-        return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
+        return self._scan_result_to_get_result(
+            result["hits"]["hits"], include_vectors=include_vectors
+        )
 
     # Status: works
-    def _result_to_search_result(self, result) -> SearchResult:
+    def _result_to_search_result(
+        self, result, include_vectors: bool = False
+    ) -> SearchResult:
+        return self._results_to_search_result([result], include_vectors=include_vectors)
+
+    def _results_to_search_result(
+        self, results, include_vectors: bool = False
+    ) -> SearchResult:
+        # One result list per search response (query vector)
         ids = []
         distances = []
         documents = []
         metadatas = []
+        vectors = []
 
-        for hit in result["hits"]["hits"]:
-            ids.append(hit["_id"])
-            distances.append(hit["_score"])
-            documents.append(hit["_source"].get("text"))
-            metadatas.append(hit["_source"].get("metadata"))
+        for result in results:
+            hits = result["hits"]["hits"]
+            ids.append([hit["_id"] for hit in hits])
+            distances.append([hit["_score"] for hit in hits])
+            documents.append([hit["_source"].get("text") for hit in hits])
+            metadatas.append([hit["_source"].get("metadata") for hit in hits])
+            vectors.append([hit["_source"].get("vector") for hit in hits])
 
         return SearchResult(
-            ids=[ids],
-            distances=[distances],
-            documents=[documents],
-            metadatas=[metadatas],
+            ids=ids,
+            distances=distances,
+            documents=documents,
+            metadatas=metadatas,
+            vectors=vectors if include_vectors else None,
         )
 
     # Status: works
@@ -158,41 +175,79 @@ class ElasticsearchClient(VectorDBBase):
         vectors: list[list[float]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
-        query = {
-            "size": limit,
-            "_source": ["text", "metadata"],
-            "query": {
-                "script_score": {
-                    "query": {
-                        "bool": {"filter": [{"term": {"collection": collection_name}}]}
-                    },
-                    "script": {
-                        "source": "cosineSimilarity(params.vector, 'vector') + 1.0",
-                        "params": {
-                            "vector": vectors[0]
-                        },  # Assuming single query vector
-                    },
-                }
-            },
-        }
+        return self.search_many(
+            [collection_name],
+            vectors,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    def search_many(
+        self,
+        collection_names: list[str],
+        vectors: list[list[float]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        if not collection_names:
+            return None
 
-        result = self.client.search(
-            index=self._get_index_name(len(vectors[0])), body=query
+        # Collections of one dimension share an index, filter them in one query
+        collection_filter = (
+            {"term": {"collection": collection_names[0]}}
+            if len(collection_names) == 1
+            else {"terms": {"collection": collection_names}}
         )
 
-        return self._result_to_search_result(result)
+        def get_query(vector):
+            return {
+                "size": limit,
+                "_source": self._source_fields(include_vectors),
+                "query": {
+                    "script_score": {
+                        "query": {"bool": {"filter": [collection_filter]}},
+                        "script": {
+                            "source": "cosineSimilarity(params.vector, 'vector') + 1.0",
+                            "params": {"vector": vector},
+                        },
+                    }
+                },
+            }
+
+        index = self._get_index_name(len(vectors[0]))
+        if len(vectors) == 1:
+            result = self.client.search(index=index, body=get_query(vectors[0]))
+            return self._result_to_search_result(
+                result, include_vectors=include_vectors
+            )
+
+        # All query vectors in one round trip
+        searches = []
+        for vector in vectors:
+            searches.extend([{}, get_query(vector)])
+        result = self.client.msearch(index=index, body=searches)
+        return self._results_to_search_result(
+            result["responses"], include_vectors=include_vectors
+        )
 
     # Status: only tested halfwat
     def query(
-        self, collection_name: str, filter: dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         if not self.has_collection(collection_name):
             return None
 
         query_body = {
             "query": {"bool": {"filter": []}},
-            "_source": ["text", "metadata"],
+            "_source": self._source_fields(include_vectors),
         }
 
         for field, value in filter.items():
@@ -209,7 +264,7 @@ class ElasticsearchClient(VectorDBBase):
                 size=size,
             )
 
-            return self._result_to_get_result(result)
+            return self._result_to_get_result(result, include_vectors=include_vectors)
 
         except Exception as e:
             return None
@@ -225,15 +280,17 @@ class ElasticsearchClient(VectorDBBase):
             self._create_index(dimension=dimension)
 
     # Status: works
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         # Get all the items in the collection.
         query = {
             "query": {"bool": {"filter": [{"term": {"collection": collection_name}}]}},
-            "_source": ["text", "metadata"],
+            "_source": self._source_fields(include_vectors),
         }
         results = list(scan(self.client, index=f"{self.index_prefix}*", query=query))
 
-        return self._scan_result_to_get_result(results)
+        return self._scan_result_to_get_result(results, include_vectors=include_vectors)
 
     # Status: works
     def insert(self, collection_name: str, items: list[VectorItem]):
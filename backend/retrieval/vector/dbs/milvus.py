@@ -6,7 +6,7 @@ import json
 import logging
 from typing import Optional
 
-from rag_system.backend.retrieval.vector.utils import process_metadata
+from rag_system.backend.retrieval.vector.utils import process_metadata, vector_to_list
 from rag_system.backend.retrieval.vector.main import (
     VectorDBBase,
     VectorItem,
@@ -37,39 +37,48 @@ class MilvusClient(VectorDBBase):
         else:
             self.client = Client(uri=MILVUS_URI, db_name=MILVUS_DB, token=MILVUS_TOKEN)
 
-    def _result_to_get_result(self, result) -> GetResult:
+    def _result_to_get_result(self, result, include_vectors: bool = False) -> GetResult:
         ids = []
         documents = []
         metadatas = []
+        vectors = []
         for match in result:
             _ids = []
             _documents = []
             _metadatas = []
+            _vectors = []
             for item in match:
                 _ids.append(item.get("id"))
                 _documents.append(item.get("data", {}).get("text"))
                 _metadatas.append(item.get("metadata"))
+                _vectors.append(vector_to_list(item.get("vector")))
             ids.append(_ids)
             documents.append(_documents)
             metadatas.append(_metadatas)
+            vectors.append(_vectors)
         return GetResult(
             **{
                 "ids": ids,
                 "documents": documents,
                 "metadatas": metadatas,
+                "vectors": vectors if include_vectors else None,
             }
         )
 
-    def _result_to_search_result(self, result) -> SearchResult:
+    def _result_to_search_result(
+        self, result, include_vectors: bool = False
+    ) -> SearchResult:
         ids = []
         distances = []
         documents = []
         metadatas = []
+        vectors = []
         for match in result:
             _ids = []
             _distances = []
             _documents = []
             _metadatas = []
+            _vectors = []
             for item in match:
                 _ids.append(item.get("id"))
                 # normalize milvus score from [-1, 1] to [0, 1] range
@@ -78,16 +87,19 @@ class MilvusClient(VectorDBBase):
                 _distances.append(_dist)
                 _documents.append(item.get("entity", {}).get("data", {}).get("text"))
                 _metadatas.append(item.get("entity", {}).get("metadata"))
+                _vectors.append(vector_to_list(item.get("entity", {}).get("vector")))
             ids.append(_ids)
             distances.append(_distances)
             documents.append(_documents)
             metadatas.append(_metadatas)
+            vectors.append(_vectors)
         return SearchResult(
             **{
                 "ids": ids,
                 "distances": distances,
                 "documents": documents,
                 "metadatas": metadatas,
+                "vectors": vectors if include_vectors else None,
             }
         )
 
@@ -184,6 +196,7 @@ class MilvusClient(VectorDBBase):
         vectors: list[list[float | int]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
         collection_name = collection_name.replace("-", "_")
@@ -194,12 +207,18 @@ class MilvusClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}",
             data=vectors,
             limit=limit,
-            output_fields=["data", "metadata"],
+            output_fields=["data", "metadata", *(["vector"] if include_vectors else [])],
             # search_params=search_params # Potentially add later if needed
         )
-        return self._result_to_search_result(result)
+        return self._result_to_search_result(result, include_vectors=include_vectors)
 
-    def query(self, collection_name: str, filter: dict, limit: int = -1):
+    def query(
+        self,
+        collection_name: str,
+        filter: dict,
+        limit: int = -1,
+        include_vectors: bool = False,
+    ):
         connections.connect(uri=MILVUS_URI, token=MILVUS_TOKEN, db_name=MILVUS_DB)
 
         collection_name = collection_name.replace("-", "_")
@@ -232,6 +251,7 @@ class MilvusClient(VectorDBBase):
                     "id",
                     "data",
                     "metadata",
+                    *(["vector"] if include_vectors else []),
                 ],
                 limit=limit if limit > 0 else -1,
             )
@@ -245,7 +265,10 @@ class MilvusClient(VectorDBBase):
                 all_results.extend(batch)
 
             log.debug(f"Total results from query: {len(all_results)}")
-            return self._result_to_get_result([all_results] if all_results else [[]])
+            return self._result_to_get_result(
+                [all_results] if all_results else [[]],
+                include_vectors=include_vectors,
+            )
 
         except Exception as e:
             log.exception(
@@ -253,7 +276,9 @@ class MilvusClient(VectorDBBase):
             )
             return None
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         # Get all the items in the collection. This can be very resource-intensive for large collections.
         collection_name = collection_name.replace("-", "_")
         log.warning(
@@ -261,7 +286,12 @@ class MilvusClient(VectorDBBase):
         )
         # Using query with a trivial filter to get all items.
         # This will use the paginated query logic.
-        return self.query(collection_name=collection_name, filter={}, limit=-1)
+        return self.query(
+            collection_name=collection_name,
+            filter={},
+            limit=-1,
+            include_vectors=include_vectors,
+        )
 
     def insert(self, collection_name: str, items: list[VectorItem]):
         # Insert the items into the collection, if the collection does not exist, it will be created.
@@ -17,7 +17,9 @@ from rag_system.backend.retrieval.vector.main import (
     SearchResult,
     VectorDBBase,
     VectorItem,
+    merge_search_results,
 )
+from rag_system.backend.retrieval.vector.utils import vector_to_list
 from pymilvus import (
     connections,
     utility,
@@ -162,6 +164,7 @@ class MilvusClient(VectorDBBase):
         vectors: List[List[float]],
         filter: Optional[Dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         if not vectors:
             return None
@@ -172,34 +175,95 @@ class MilvusClient(VectorDBBase):
         if not utility.has_collection(mt_collection):
             return None
 
+        return self._search_resources(
+            mt_collection, [resource_id], vectors, limit, include_vectors
+        )
+
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        # One search per shared collection, filtered on all its resource ids
+        if not vectors:
+            return None
+
+        resources_by_collection: Dict[str, List[str]] = {}
+        for collection_name in collection_names:
+            mt_collection, resource_id = self._get_collection_and_resource_id(
+                collection_name
+            )
+            resources_by_collection.setdefault(mt_collection, []).append(resource_id)
+
+        return merge_search_results(
+            [
+                self._search_resources(
+                    mt_collection, resource_ids, vectors, limit, include_vectors
+                )
+                for mt_collection, resource_ids in resources_by_collection.items()
+                if utility.has_collection(mt_collection)
+            ],
+            limit,
+        )
+
+    def _search_resources(
+        self,
+        mt_collection: str,
+        resource_ids: List[str],
+        vectors: List[List[float]],
+        limit: int,
+        include_vectors: bool,
+    ) -> SearchResult:
         collection = Collection(mt_collection)
         collection.load()
 
+        if len(resource_ids) == 1:
+            expr = f"{RESOURCE_ID_FIELD} == '{resource_ids[0]}'"
+        else:
+            id_list_str = ", ".join([f"'{resource_id}'" for resource_id in resource_ids])
+            expr = f"{RESOURCE_ID_FIELD} in [{id_list_str}]"
+
         search_params = {"metric_type": MILVUS_METRIC_TYPE, "params": {}}
         results = collection.search(
             data=vectors,
             anns_field="vector",
             param=search_params,
             limit=limit,
-            expr=f"{RESOURCE_ID_FIELD} == '{resource_id}'",
-            output_fields=["id", "text", "metadata"],
+            expr=expr,
+            output_fields=[
+                "id",
+                "text",
+                "metadata",
+                *(["vector"] if include_vectors else []),
+            ],
         )
 
-        ids, documents, metadatas, distances = [], [], [], []
+        ids, documents, metadatas, distances, result_vectors = [], [], [], [], []
         for hits in results:
             batch_ids, batch_docs, batch_metadatas, batch_dists = [], [], [], []
+            batch_vectors = []
             for hit in hits:
                 batch_ids.append(hit.entity.get("id"))
                 batch_docs.append(hit.entity.get("text"))
                 batch_metadatas.append(hit.entity.get("metadata"))
                 batch_dists.append(hit.distance)
+                if include_vectors:
+                    batch_vectors.append(vector_to_list(hit.entity.get("vector")))
             ids.append(batch_ids)
             documents.append(batch_docs)
             metadatas.append(batch_metadatas)
             distances.append(batch_dists)
+            result_vectors.append(batch_vectors)
 
         return SearchResult(
-            ids=ids, documents=documents, metadatas=metadatas, distances=distances
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas,
+            distances=distances,
+            vectors=result_vectors if include_vectors else None,
         )
 
     def delete(
@@ -245,7 +309,11 @@ class MilvusClient(VectorDBBase):
         collection.delete(f"{RESOURCE_ID_FIELD} == '{resource_id}'")
 
     def query(
-        self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict[str, Any],
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         mt_collection, resource_id = self._get_collection_and_resource_id(
             collection_name
@@ -266,7 +334,12 @@ class MilvusClient(VectorDBBase):
 
         iterator = collection.query_iterator(
             expr=" and ".join(expr),
-            output_fields=["id", "text", "metadata"],
+            output_fields=[
+                "id",
+                "text",
+                "metadata",
+                *(["vector"] if include_vectors else []),
+            ],
             limit=limit if limit else -1,
         )
 
@@ -281,11 +354,25 @@ class MilvusClient(VectorDBBase):
         ids = [res["id"] for res in all_results]
         documents = [res["text"] for res in all_results]
         metadatas = [res["metadata"] for res in all_results]
+        result_vectors = (
+            [[vector_to_list(res["vector"]) for res in all_results]]
+            if include_vectors
+            else None
+        )
 
-        return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
+        return GetResult(
+            ids=[ids],
+            documents=[documents],
+            metadatas=[metadatas],
+            vectors=result_vectors,
+        )
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
-        return self.query(collection_name, filter={}, limit=None)
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
+        return self.query(
+            collection_name, filter={}, limit=None, include_vectors=include_vectors
+        )
 
     def insert(self, collection_name: str, items: List[VectorItem]):
         return self.upsert(collection_name, items)
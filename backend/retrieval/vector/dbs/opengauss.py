@@ -54,7 +54,7 @@ class OpenGaussDialect(PGDialect_psycopg2):
 # Register dialect
 registry.register("opengauss", __name__, "OpenGaussDialect")
 
-from rag_system.backend.retrieval.vector.utils import process_metadata
+from rag_system.backend.retrieval.vector.utils import process_metadata, vector_to_list
 from rag_system.backend.retrieval.vector.main import (
     VectorDBBase,
     VectorItem,
@@ -234,6 +234,7 @@ class OpenGaussClient(VectorDBBase):
         vectors: List[List[float]],
         filter: Optional[Dict[str, Any]] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         try:
             if not vectors:
@@ -263,6 +264,8 @@ class OpenGaussClient(VectorDBBase):
                     "distance"
                 ),
             ]
+            if include_vectors:
+                result_fields.append(DocumentChunk.vector)
 
             subq = (
                 select(*result_fields)
@@ -282,6 +285,7 @@ class OpenGaussClient(VectorDBBase):
                     subq.c.text,
                     subq.c.vmetadata,
                     subq.c.distance,
+                    *([subq.c.vector] if include_vectors else []),
                 )
                 .select_from(query_vectors)
                 .join(subq, true())
@@ -295,6 +299,7 @@ class OpenGaussClient(VectorDBBase):
             distances = [[] for _ in range(num_queries)]
             documents = [[] for _ in range(num_queries)]
             metadatas = [[] for _ in range(num_queries)]
+            result_vectors = [[] for _ in range(num_queries)]
 
             for row in results:
                 qid = int(row.qid)
@@ -302,10 +307,16 @@ class OpenGaussClient(VectorDBBase):
                 distances[qid].append((2.0 - row.distance) / 2.0)
                 documents[qid].append(row.text)
                 metadatas[qid].append(row.vmetadata)
+                if include_vectors:
+                    result_vectors[qid].append(vector_to_list(row.vector))
 
             self.session.rollback()
             return SearchResult(
-                ids=ids, distances=distances, documents=documents, metadatas=metadatas
+                ids=ids,
+                distances=distances,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=result_vectors if include_vectors else None,
             )
         except Exception as e:
             self.session.rollback()
@@ -313,7 +324,11 @@ class OpenGaussClient(VectorDBBase):
             return None
 
     def query(
-        self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict[str, Any],
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         try:
             query = self.session.query(DocumentChunk).filter(
@@ -335,15 +350,29 @@ class OpenGaussClient(VectorDBBase):
             documents = [[result.text for result in results]]
             metadatas = [[result.vmetadata for result in results]]
 
+            result_vectors = (
+                [[vector_to_list(result.vector) for result in results]]
+                if include_vectors
+                else None
+            )
+
             self.session.rollback()
-            return GetResult(ids=ids, documents=documents, metadatas=metadatas)
+            return GetResult(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=result_vectors,
+            )
         except Exception as e:
             self.session.rollback()
             log.exception(f"Conditional query failed: {e}")
             return None
 
     def get(
-        self, collection_name: str, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         try:
             query = self.session.query(DocumentChunk).filter(
@@ -361,8 +390,19 @@ class OpenGaussClient(VectorDBBase):
             documents = [[result.text for result in results]]
             metadatas = [[result.vmetadata for result in results]]
 
+            result_vectors = (
+                [[vector_to_list(result.vector) for result in results]]
+                if include_vectors
+                else None
+            )
+
             self.session.rollback()
-            return GetResult(ids=ids, documents=documents, metadatas=metadatas)
+            return GetResult(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=result_vectors,
+            )
         except Exception as e:
             self.session.rollback()
             log.exception(f"Failed to retrieve data: {e}")
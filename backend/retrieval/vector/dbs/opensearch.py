@@ -31,41 +31,63 @@ class OpenSearchClient(VectorDBBase):
     def _get_index_name(self, collection_name: str) -> str:
         return f"{self.index_prefix}_{collection_name}"
 
-    def _result_to_get_result(self, result) -> GetResult:
+    def _source_fields(self, include_vectors: bool = False) -> list[str]:
+        return ["text", "metadata", "vector"] if include_vectors else ["text", "metadata"]
+
+    def _result_to_get_result(self, result, include_vectors: bool = False) -> GetResult:
         if not result["hits"]["hits"]:
             return None
 
         ids = []
         documents = []
         metadatas = []
+        vectors = []
 
         for hit in result["hits"]["hits"]:
             ids.append(hit["_id"])
             documents.append(hit["_source"].get("text"))
             metadatas.append(hit["_source"].get("metadata"))
+            vectors.append(hit["_source"].get("vector"))
 
-        return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
+        return GetResult(
+            ids=[ids],
+            documents=[documents],
+            metadatas=[metadatas],
+            vectors=[vectors] if include_vectors else None,
+        )
 
-    def _result_to_search_result(self, result) -> SearchResult:
-        if not result["hits"]["hits"]:
+    def _result_to_search_result(
+        self, result, include_vectors: bool = False
+    ) -> SearchResult:
+        return self._results_to_search_result([result], include_vectors=include_vectors)
+
+    def _results_to_search_result(
+        self, results, include_vectors: bool = False
+    ) -> SearchResult:
+        if not any(result["hits"]["hits"] for result in results):
             return None
 
+        # One result list per search response (query vector)
         ids = []
         distances = []
         documents = []
         metadatas = []
+        vectors = []
 
-        for hit in result["hits"]["hits"]:
-            ids.append(hit["_id"])
-            distances.append(hit["_score"])
-            documents.append(hit["_source"].get("text"))
-            metadatas.append(hit["_source"].get("metadata"))
+        for result in results:
+            hits = result["hits"]["hits"]
+            ids.append([hit["_id"] for hit in hits])
+            distances.append([hit["_score"] for hit in hits])
+            documents.append([hit["_source"].get("text") for hit in hits])
+            metadatas.append([hit["_source"].get("metadata") for hit in hits])
+            vectors.append([hit["_source"].get("vector") for hit in hits])
 
         return SearchResult(
-            ids=[ids],
-            distances=[distances],
-            documents=[documents],
-            metadatas=[metadatas],
+            ids=ids,
+            distances=distances,
+            documents=documents,
+            metadatas=metadatas,
+            vectors=vectors if include_vectors else None,
         )
 
     def _create_index(self, collection_name: str, dimension: int):
@@ -118,46 +140,62 @@ class OpenSearchClient(VectorDBBase):
         vectors: list[list[float | int]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         try:
             if not self.has_collection(collection_name):
                 return None
 
-            query = {
-                "size": limit,
-                "_source": ["text", "metadata"],
-                "query": {
-                    "script_score": {
-                        "query": {"match_all": {}},
-                        "script": {
-                            "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
-                            "params": {
-                                "field": "vector",
-                                "query_value": vectors[0],
-                            },  # Assuming single query vector
-                        },
-                    }
-                },
-            }
+            def get_query(vector):
+                return {
+                    "size": limit,
+                    "_source": self._source_fields(include_vectors),
+                    "query": {
+                        "script_score": {
+                            "query": {"match_all": {}},
+                            "script": {
+                                "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
+                                "params": {
+                                    "field": "vector",
+                                    "query_value": vector,
+                                },
+                            },
+                        }
+                    },
+                }
 
-            result = self.client.search(
-                index=self._get_index_name(collection_name), body=query
-            )
+            index = self._get_index_name(collection_name)
+            if len(vectors) == 1:
+                result = self.client.search(index=index, body=get_query(vectors[0]))
+                return self._result_to_search_result(
+                    result, include_vectors=include_vectors
+                )
 
-            return self._result_to_search_result(result)
+            # All query vectors in one round trip
+            searches = []
+            for vector in vectors:
+                searches.extend([{}, get_query(vector)])
+            result = self.client.msearch(index=index, body=searches)
+            return self._results_to_search_result(
+                result["responses"], include_vectors=include_vectors
+            )
 
         except Exception as e:
             return None
 
     def query(
-        self, collection_name: str, filter: dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         if not self.has_collection(collection_name):
             return None
 
         query_body = {
             "query": {"bool": {"filter": []}},
-            "_source": ["text", "metadata"],
+            "_source": self._source_fields(include_vectors),
         }
 
         for field, value in filter.items():
@@ -174,7 +212,7 @@ class OpenSearchClient(VectorDBBase):
                 size=size,
             )
 
-            return self._result_to_get_result(result)
+            return self._result_to_get_result(result, include_vectors=include_vectors)
 
         except Exception as e:
             return None
@@ -183,13 +221,18 @@ class OpenSearchClient(VectorDBBase):
         if not self.has_collection(collection_name):
             self._create_index(collection_name, dimension)
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
-        query = {"query": {"match_all": {}}, "_source": ["text", "metadata"]}
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
+        query = {
+            "query": {"match_all": {}},
+            "_source": self._source_fields(include_vectors),
+        }
 
         result = self.client.search(
             index=self._get_index_name(collection_name), body=query
         )
-        return self._result_to_get_result(result)
+        return self._result_to_get_result(result, include_vectors=include_vectors)
 
     def insert(self, collection_name: str, items: list[VectorItem]):
         self._create_index_if_not_exists(
@@ -42,6 +42,7 @@ from rag_system.backend.retrieval.vector.main import (
     SearchResult,
     GetResult,
 )
+from rag_system.backend.retrieval.vector.utils import vector_to_list
 
 from rag_system.backend.settings import (
     ORACLE_DB_USE_WALLET,
@@ -526,6 +527,7 @@ class Oracle23aiClient(VectorDBBase):
         vectors: List[List[Union[float, int]]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         """
         Search for similar vectors in the database.
@@ -536,6 +538,7 @@ class Oracle23aiClient(VectorDBBase):
             collection_name (str): Name of the collection to search
             vectors (List[List[Union[float, int]]]): Query vectors to find similar items for
             limit (int): Maximum number of results to return per query
+            include_vectors (bool): Also return the stored vector of each match
 
         Returns:
             Optional[SearchResult]: Search results containing ids, distances, documents, and metadata
@@ -564,6 +567,8 @@ class Oracle23aiClient(VectorDBBase):
             distances = [[] for _ in range(num_queries)]
             documents = [[] for _ in range(num_queries)]
             metadatas = [[] for _ in range(num_queries)]
+            result_vectors = [[] for _ in range(num_queries)]
+            vector_column = ", dc.vector" if include_vectors else ""
 
             with self.get_connection() as connection:
                 with connection.cursor() as cursor:
@@ -571,10 +576,10 @@ class Oracle23aiClient(VectorDBBase):
                         vector_blob = self._vector_to_blob(vector)
 
                         cursor.execute(
-                            """
+                            f"""
                             SELECT dc.id, dc.text, 
                                 JSON_SERIALIZE(dc.vmetadata RETURNING VARCHAR2(4096)) as vmetadata,
-                                VECTOR_DISTANCE(dc.vector, :query_vector, COSINE) as distance
+                                VECTOR_DISTANCE(dc.vector, :query_vector, COSINE) as distance{vector_column}
                             FROM document_chunk dc
                             WHERE dc.collection_name = :collection_name
                             ORDER BY VECTOR_DISTANCE(dc.vector, :query_vector, COSINE)
@@ -604,13 +609,19 @@ class Oracle23aiClient(VectorDBBase):
                             )
                             metadatas[qid].append(self._json_to_metadata(metadata_str))
                             distances[qid].append(float(row[3]))
+                            if include_vectors:
+                                result_vectors[qid].append(vector_to_list(row[4]))
 
             log.info(
                 f"Search completed. Found {sum(len(ids[i]) for i in range(num_queries))} total results."
             )
 
             return SearchResult(
-                ids=ids, distances=distances, documents=documents, metadatas=metadatas
+                ids=ids,
+                distances=distances,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=result_vectors if include_vectors else None,
             )
 
         except Exception as e:
@@ -618,7 +629,11 @@ class Oracle23aiClient(VectorDBBase):
             return None
 
     def query(
-        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         """
         Query items based on metadata filters.
@@ -629,6 +644,7 @@ class Oracle23aiClient(VectorDBBase):
             collection_name (str): Name of the collection to query
             filter (Dict[str, Any]): Metadata filters to apply
             limit (Optional[int]): Maximum number of results to return
+            include_vectors (bool): Also return the stored vector of each item
 
         Returns:
             Optional[GetResult]: Query results containing ids, documents, and metadata
@@ -645,8 +661,9 @@ class Oracle23aiClient(VectorDBBase):
         try:
             limit = limit or 100
 
-            query = """
-                SELECT id, text, JSON_SERIALIZE(vmetadata RETURNING VARCHAR2(4096)) as vmetadata 
+            vector_column = ", vector" if include_vectors else ""
+            query = f"""
+                SELECT id, text, JSON_SERIALIZE(vmetadata RETURNING VARCHAR2(4096)) as vmetadata{vector_column}
                 FROM document_chunk
                 WHERE collection_name = :collection_name
             """
@@ -689,13 +706,24 @@ class Oracle23aiClient(VectorDBBase):
 
             log.info(f"Query completed. Found {len(results)} results.")
 
-            return GetResult(ids=ids, documents=documents, metadatas=metadatas)
+            return GetResult(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=(
+                    [[vector_to_list(row[3]) for row in results]]
+                    if include_vectors
+                    else None
+                ),
+            )
 
         except Exception as e:
             log.exception(f"Error during query: {e}")
             return None
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         """
         Get all items in a collection.
 
@@ -704,6 +732,7 @@ class Oracle23aiClient(VectorDBBase):
         Args:
             collection_name (str): Name of the collection to retrieve
             limit (Optional[int]): Maximum number of items to retrieve
+            include_vectors (bool): Also return the stored vector of each item
 
         Returns:
             Optional[GetResult]: Result containing ids, documents, and metadata
@@ -720,12 +749,13 @@ class Oracle23aiClient(VectorDBBase):
 
         try:
             limit = 1000  # Hardcoded limit for get operation
+            vector_column = ", vector" if include_vectors else ""
 
             with self.get_connection() as connection:
                 with connection.cursor() as cursor:
                     cursor.execute(
-                        """
-                        SELECT /*+ MONITOR */ id, text, JSON_SERIALIZE(vmetadata RETURNING VARCHAR2(4096)) as vmetadata
+                        f"""
+                        SELECT /*+ MONITOR */ id, text, JSON_SERIALIZE(vmetadata RETURNING VARCHAR2(4096)) as vmetadata{vector_column}
                         FROM document_chunk
                         WHERE collection_name = :collection_name
                         FETCH FIRST :limit ROWS ONLY
@@ -756,7 +786,16 @@ class Oracle23aiClient(VectorDBBase):
                 ]
             ]
 
-            return GetResult(ids=ids, documents=documents, metadatas=metadatas)
+            return GetResult(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=(
+                    [[vector_to_list(row[3]) for row in results]]
+                    if include_vectors
+                    else None
+                ),
+            )
 
         except Exception as e:
             log.exception(f"Error during get: {e}")
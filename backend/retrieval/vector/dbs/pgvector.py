@@ -27,7 +27,7 @@ from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.exc import NoSuchTableError
 
 
-from rag_system.backend.retrieval.vector.utils import process_metadata
+from rag_system.backend.retrieval.vector.utils import process_metadata, vector_to_list
 from rag_system.backend.retrieval.vector.main import (
     VectorDBBase,
     VectorItem,
@@ -428,9 +428,27 @@ class PgvectorClient(VectorDBBase):
         vectors: List[List[float]],
         filter: Optional[Dict[str, Any]] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
+        return self.search_many(
+            [collection_name],
+            vectors,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        # All collections share document_chunk, one statement serves them all
         try:
-            if not vectors:
+            if not vectors or not collection_names:
                 return None
 
             # Adjust query vectors to VECTOR_LENGTH
@@ -468,6 +486,8 @@ class PgvectorClient(VectorDBBase):
             else:
                 result_fields.append(DocumentChunk.text)
                 result_fields.append(DocumentChunk.vmetadata)
+            if include_vectors:
+                result_fields.append(DocumentChunk.vector)
             result_fields.append(
                 (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)).label(
                     "distance"
@@ -475,7 +495,13 @@ class PgvectorClient(VectorDBBase):
             )
 
             # Build the lateral subquery for each query vector
-            where_clauses = [DocumentChunk.collection_name == collection_name]
+            where_clauses = [
+                (
+                    DocumentChunk.collection_name == collection_names[0]
+                    if len(collection_names) == 1
+                    else DocumentChunk.collection_name.in_(collection_names)
+                )
+            ]
 
             # Apply metadata filter if provided
             if filter:
@@ -532,6 +558,7 @@ class PgvectorClient(VectorDBBase):
                     subq.c.text,
                     subq.c.vmetadata,
                     subq.c.distance,
+                    *([subq.c.vector] if include_vectors else []),
                 )
                 .select_from(query_vectors)
                 .join(subq, true())
@@ -545,6 +572,9 @@ class PgvectorClient(VectorDBBase):
             distances = [[] for _ in range(num_queries)]
             documents = [[] for _ in range(num_queries)]
             metadatas = [[] for _ in range(num_queries)]
+            result_vectors = (
+                [[] for _ in range(num_queries)] if include_vectors else None
+            )
 
             if not results:
                 return SearchResult(
@@ -552,6 +582,7 @@ class PgvectorClient(VectorDBBase):
                     distances=distances,
                     documents=documents,
                     metadatas=metadatas,
+                    vectors=result_vectors,
                 )
 
             for row in results:
@@ -562,10 +593,16 @@ class PgvectorClient(VectorDBBase):
                 distances[qid].append((2.0 - row.distance) / 2.0)
                 documents[qid].append(row.text)
                 metadatas[qid].append(row.vmetadata)
+                if include_vectors:
+                    result_vectors[qid].append(vector_to_list(row.vector))
 
             self.session.rollback()  # read-only transaction
             return SearchResult(
-                ids=ids, distances=distances, documents=documents, metadatas=metadatas
+                ids=ids,
+                distances=distances,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=result_vectors,
             )
         except Exception as e:
             self.session.rollback()
@@ -573,7 +610,11 @@ class PgvectorClient(VectorDBBase):
             return None
 
     def query(
-        self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict[str, Any],
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         try:
             if PGVECTOR_PGCRYPTO:
@@ -595,6 +636,7 @@ class PgvectorClient(VectorDBBase):
                     pgcrypto_decrypt(
                         DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
                     ).label("vmetadata"),
+                    *([DocumentChunk.vector] if include_vectors else []),
                 ).where(*where_clauses)
                 if limit is not None:
                     stmt = stmt.limit(limit)
@@ -620,12 +662,18 @@ class PgvectorClient(VectorDBBase):
             ids = [[result.id for result in results]]
             documents = [[result.text for result in results]]
             metadatas = [[result.vmetadata for result in results]]
+            result_vectors = (
+                [[vector_to_list(result.vector) for result in results]]
+                if include_vectors
+                else None
+            )
 
             self.session.rollback()  # read-only transaction
             return GetResult(
                 ids=ids,
                 documents=documents,
                 metadatas=metadatas,
+                vectors=result_vectors,
             )
         except Exception as e:
             self.session.rollback()
@@ -633,7 +681,10 @@ class PgvectorClient(VectorDBBase):
             return None
 
     def get(
-        self, collection_name: str, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         try:
             if PGVECTOR_PGCRYPTO:
@@ -645,6 +696,7 @@ class PgvectorClient(VectorDBBase):
                     pgcrypto_decrypt(
                         DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
                     ).label("vmetadata"),
+                    *([DocumentChunk.vector] if include_vectors else []),
                 ).where(DocumentChunk.collection_name == collection_name)
                 if limit is not None:
                     stmt = stmt.limit(limit)
@@ -669,8 +721,19 @@ class PgvectorClient(VectorDBBase):
                 documents = [[result.text for result in results]]
                 metadatas = [[result.vmetadata for result in results]]
 
+            result_vectors = (
+                [[vector_to_list(result.vector) for result in results]]
+                if include_vectors
+                else None
+            )
+
             self.session.rollback()  # read-only transaction
-            return GetResult(ids=ids, documents=documents, metadatas=metadatas)
+            return GetResult(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                vectors=result_vectors,
+            )
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during get: {e}")
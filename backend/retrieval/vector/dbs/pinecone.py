@@ -204,23 +204,28 @@ class PineconeClient(VectorDBBase):
             # For other metrics, use as is
             return score
 
-    def _result_to_get_result(self, matches: list) -> GetResult:
+    def _result_to_get_result(
+        self, matches: list, include_vectors: bool = False
+    ) -> GetResult:
         """Convert Pinecone matches to GetResult format."""
         ids = []
         documents = []
         metadatas = []
+        vectors = []
 
         for match in matches:
             metadata = getattr(match, "metadata", {}) or {}
             ids.append(match.id if hasattr(match, "id") else match["id"])
             documents.append(metadata.get("text", ""))
             metadatas.append(metadata)
+            vectors.append(getattr(match, "values", None) or None)
 
         return GetResult(
             **{
                 "ids": [ids],
                 "documents": [documents],
                 "metadatas": [metadatas],
+                "vectors": [vectors] if include_vectors else None,
             }
         )
 
@@ -396,6 +401,7 @@ class PineconeClient(VectorDBBase):
         vectors: List[List[Union[float, int]]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         """Search for similar vectors in a collection."""
         if not vectors or not vectors[0]:
@@ -410,50 +416,56 @@ class PineconeClient(VectorDBBase):
             limit = NO_LIMIT
 
         try:
-            # Search using the first vector (assuming this is the intended behavior)
-            query_vector = vectors[0]
-
-            # Perform the search
-            query_response = self.index.query(
-                vector=query_vector,
-                top_k=limit,
-                include_metadata=True,
-                filter={"collection_name": collection_name_with_prefix},
+            # Pinecone queries take one vector, run them on the shared pool
+            query_responses = self._executor.map(
+                lambda query_vector: self.index.query(
+                    vector=query_vector,
+                    top_k=limit,
+                    include_metadata=True,
+                    include_values=include_vectors,
+                    filter={"collection_name": collection_name_with_prefix},
+                ),
+                vectors,
             )
 
-            matches = getattr(query_response, "matches", []) or []
-            if not matches:
-                # Return empty result if no matches
-                return SearchResult(
-                    ids=[[]],
-                    documents=[[]],
-                    metadatas=[[]],
-                    distances=[[]],
-                )
-
-            # Convert to GetResult format
-            get_result = self._result_to_get_result(matches)
+            ids, documents, metadatas, distances, result_vectors = [], [], [], [], []
+            for query_response in query_responses:
+                matches = getattr(query_response, "matches", []) or []
 
-            # Calculate normalized distances based on metric
-            distances = [
-                [
-                    self._normalize_distance(getattr(match, "score", 0.0))
-                    for match in matches
-                ]
-            ]
+                # Convert to GetResult format
+                get_result = self._result_to_get_result(
+                    matches, include_vectors=include_vectors
+                )
+                ids.extend(get_result.ids)
+                documents.extend(get_result.documents)
+                metadatas.extend(get_result.metadatas)
+                result_vectors.extend(get_result.vectors or [[]])
+
+                # Calculate normalized distances based on metric
+                distances.append(
+                    [
+                        self._normalize_distance(getattr(match, "score", 0.0))
+                        for match in matches
+                    ]
+                )
 
             return SearchResult(
-                ids=get_result.ids,
-                documents=get_result.documents,
-                metadatas=get_result.metadatas,
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
                 distances=distances,
+                vectors=result_vectors if include_vectors else None,
             )
         except Exception as e:
             log.error(f"Error searching in '{collection_name_with_prefix}': {e}")
             return None
 
     def query(
-        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         """Query vectors by metadata filter."""
         collection_name_with_prefix = self._get_collection_name_with_prefix(
@@ -478,16 +490,19 @@ class PineconeClient(VectorDBBase):
                 filter=pinecone_filter,
                 top_k=limit,
                 include_metadata=True,
+                include_values=include_vectors,
             )
 
             matches = getattr(query_response, "matches", []) or []
-            return self._result_to_get_result(matches)
+            return self._result_to_get_result(matches, include_vectors=include_vectors)
 
         except Exception as e:
             log.error(f"Error querying collection '{collection_name}': {e}")
             return None
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         """Get all vectors in a collection."""
         collection_name_with_prefix = self._get_collection_name_with_prefix(
             collection_name
@@ -502,11 +517,12 @@ class PineconeClient(VectorDBBase):
                 vector=zero_vector,
                 top_k=NO_LIMIT,
                 include_metadata=True,
+                include_values=include_vectors,
                 filter={"collection_name": collection_name_with_prefix},
             )
 
             matches = getattr(query_response, "matches", []) or []
-            return self._result_to_get_result(matches)
+            return self._result_to_get_result(matches, include_vectors=include_vectors)
 
         except Exception as e:
             log.error(f"Error getting collection '{collection_name}': {e}")
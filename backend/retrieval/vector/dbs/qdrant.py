@@ -1,8 +1,10 @@
 from typing import Optional
+import asyncio
 import logging
+import threading
 from urllib.parse import urlparse
 
-from qdrant_client import QdrantClient as Qclient
+from qdrant_client import AsyncQdrantClient, QdrantClient as Qclient
 from qdrant_client.http.models import PointStruct
 from qdrant_client.models import models
 
@@ -39,6 +41,12 @@ class QdrantClient(VectorDBBase):
         self.QDRANT_TIMEOUT = QDRANT_TIMEOUT
         self.QDRANT_HNSW_M = QDRANT_HNSW_M
 
+        # Async clients are bound to the event loop they were first used on,
+        # and writes run asyncio.run in worker threads, so keep one per loop
+        self._client_kwargs = None
+        self._aclients: dict[asyncio.AbstractEventLoop, AsyncQdrantClient] = {}
+        self._aclients_lock = threading.Lock()
+
         if not self.QDRANT_URI:
             self.client = None
             return
@@ -49,7 +57,7 @@ class QdrantClient(VectorDBBase):
         http_port = parsed.port or 6333  # default REST port
 
         if self.PREFER_GRPC:
-            self.client = Qclient(
+            client_kwargs = dict(
                 host=host,
                 port=http_port,
                 grpc_port=self.GRPC_PORT,
@@ -58,28 +66,54 @@ class QdrantClient(VectorDBBase):
                 timeout=self.QDRANT_TIMEOUT,
             )
         else:
-            self.client = Qclient(
+            client_kwargs = dict(
                 url=self.QDRANT_URI,
                 api_key=self.QDRANT_API_KEY,
                 timeout=QDRANT_TIMEOUT,
             )
+        self.client = Qclient(**client_kwargs)
+        self._client_kwargs = client_kwargs
+
+    @property
+    def aclient(self) -> Optional[AsyncQdrantClient]:
+        """Native async client of the running event loop, for the read path."""
+        if self._client_kwargs is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        with self._aclients_lock:
+            # Clients of closed loops cannot be used anymore
+            for closed_loop in [other for other in self._aclients if other.is_closed()]:
+                del self._aclients[closed_loop]
 
-    def _result_to_get_result(self, points) -> GetResult:
+            aclient = self._aclients.get(loop)
+            if aclient is None:
+                aclient = self._aclients[loop] = AsyncQdrantClient(
+                    **self._client_kwargs
+                )
+            return aclient
+
+    def _result_to_get_result(
+        self, points, include_vectors: bool = False
+    ) -> GetResult:
         ids = []
         documents = []
         metadatas = []
+        vectors = []
 
         for point in points:
             payload = point.payload
             ids.append(point.id)
             documents.append(payload["text"])
             metadatas.append(payload["metadata"])
+            vectors.append(point.vector)
 
         return GetResult(
             **{
                 "ids": [ids],
                 "documents": [documents],
                 "metadatas": [metadatas],
+                "vectors": [vectors] if include_vectors else None,
             }
         )
 
@@ -150,26 +184,83 @@ class QdrantClient(VectorDBBase):
         vectors: list[list[float | int]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
         if limit is None:
             limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
 
-        query_response = self.client.query_points(
+        # All query vectors in one batch request
+        query_responses = self.client.query_batch_points(
             collection_name=f"{self.collection_prefix}_{collection_name}",
-            query=vectors[0],
-            limit=limit,
+            requests=self._get_query_requests(vectors, limit, include_vectors),
         )
-        get_result = self._result_to_get_result(query_response.points)
-        return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
+        return self._result_to_search_result(query_responses, include_vectors)
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        if limit is None:
+            limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
+
+        # All query vectors in one batch request
+        query_responses = await self.aclient.query_batch_points(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            requests=self._get_query_requests(vectors, limit, include_vectors),
+        )
+        return self._result_to_search_result(query_responses, include_vectors)
+
+    def _get_query_requests(
+        self, vectors: list[list[float | int]], limit: int, include_vectors: bool
+    ) -> list[models.QueryRequest]:
+        return [
+            models.QueryRequest(
+                query=vector,
+                limit=limit,
+                with_payload=True,
+                with_vector=include_vectors,
+            )
+            for vector in vectors
+        ]
+
+    def _result_to_search_result(
+        self, query_responses, include_vectors: bool = False
+    ) -> SearchResult:
+        # One result list per query vector
+        ids, documents, metadatas, vectors, distances = [], [], [], [], []
+        for query_response in query_responses:
+            get_result = self._result_to_get_result(
+                query_response.points, include_vectors=include_vectors
+            )
+            ids.extend(get_result.ids)
+            documents.extend(get_result.documents)
+            metadatas.extend(get_result.metadatas)
+            vectors.extend(get_result.vectors or [])
             # qdrant distance is [-1, 1], normalize to [0, 1]
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            distances.append(
+                [(point.score + 1.0) / 2.0 for point in query_response.points]
+            )
+
+        return SearchResult(
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas,
+            vectors=vectors if include_vectors else None,
+            distances=distances,
         )
 
-    def query(self, collection_name: str, filter: dict, limit: Optional[int] = None):
+    def query(
+        self,
+        collection_name: str,
+        filter: dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
+    ):
         # Construct the filter string for querying
         if not self.has_collection(collection_name):
             return None
@@ -177,31 +268,73 @@ class QdrantClient(VectorDBBase):
             if limit is None:
                 limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
 
-            field_conditions = []
-            for key, value in filter.items():
-                field_conditions.append(
-                    models.FieldCondition(
-                        key=f"metadata.{key}", match=models.MatchValue(value=value)
-                    )
-                )
-
             points = self.client.scroll(
                 collection_name=f"{self.collection_prefix}_{collection_name}",
-                scroll_filter=models.Filter(should=field_conditions),
+                scroll_filter=self._get_scroll_filter(filter),
+                limit=limit,
+                with_vectors=include_vectors,
+            )
+            return self._result_to_get_result(points[0], include_vectors=include_vectors)
+        except Exception as e:
+            log.exception(f"Error querying a collection '{collection_name}': {e}")
+            return None
+
+    async def aquery(
+        self,
+        collection_name: str,
+        filter: dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
+    ):
+        if not await self.aclient.collection_exists(
+            f"{self.collection_prefix}_{collection_name}"
+        ):
+            return None
+        try:
+            if limit is None:
+                limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
+
+            points = await self.aclient.scroll(
+                collection_name=f"{self.collection_prefix}_{collection_name}",
+                scroll_filter=self._get_scroll_filter(filter),
                 limit=limit,
+                with_vectors=include_vectors,
             )
-            return self._result_to_get_result(points[0])
+            return self._result_to_get_result(points[0], include_vectors=include_vectors)
         except Exception as e:
             log.exception(f"Error querying a collection '{collection_name}': {e}")
             return None
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def _get_scroll_filter(self, filter: dict) -> models.Filter:
+        field_conditions = []
+        for key, value in filter.items():
+            field_conditions.append(
+                models.FieldCondition(
+                    key=f"metadata.{key}", match=models.MatchValue(value=value)
+                )
+            )
+        return models.Filter(should=field_conditions)
+
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         # Get all the items in the collection.
         points = self.client.scroll(
             collection_name=f"{self.collection_prefix}_{collection_name}",
             limit=NO_LIMIT,  # otherwise qdrant would set limit to 10!
+            with_vectors=include_vectors,
+        )
+        return self._result_to_get_result(points[0], include_vectors=include_vectors)
+
+    async def aget(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
+        points = await self.aclient.scroll(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            limit=NO_LIMIT,  # otherwise qdrant would set limit to 10!
+            with_vectors=include_vectors,
         )
-        return self._result_to_get_result(points[0])
+        return self._result_to_get_result(points[0], include_vectors=include_vectors)
 
     def insert(self, collection_name: str, items: list[VectorItem]):
         # Insert the items into the collection, if the collection does not exist, it will be created.
@@ -18,6 +18,7 @@ from rag_system.backend.retrieval.vector.main import (
     SearchResult,
     VectorDBBase,
     VectorItem,
+    merge_search_results,
 )
 from qdrant_client import QdrantClient as Qclient
 from qdrant_client.http.exceptions import UnexpectedResponse
@@ -88,14 +89,22 @@ class QdrantClient(VectorDBBase):
         self.WEB_SEARCH_COLLECTION = f"{self.collection_prefix}_web-search"
         self.HASH_BASED_COLLECTION = f"{self.collection_prefix}_hash-based"
 
-    def _result_to_get_result(self, points) -> GetResult:
-        ids, documents, metadatas = [], [], []
+    def _result_to_get_result(
+        self, points, include_vectors: bool = False
+    ) -> GetResult:
+        ids, documents, metadatas, vectors = [], [], [], []
         for point in points:
             payload = point.payload
             ids.append(point.id)
             documents.append(payload["text"])
             metadatas.append(payload["metadata"])
-        return GetResult(ids=[ids], documents=[documents], metadatas=[metadatas])
+            vectors.append(point.vector)
+        return GetResult(
+            ids=[ids],
+            documents=[documents],
+            metadatas=[metadatas],
+            vectors=[vectors] if include_vectors else None,
+        )
 
     def _get_collection_and_tenant_id(self, collection_name: str) -> Tuple[str, str]:
         """
@@ -259,6 +268,7 @@ class QdrantClient(VectorDBBase):
         vectors: List[List[float | int]],
         filter: Optional[Dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         """
         Search for the nearest neighbor items based on the vectors with tenant isolation.
@@ -270,23 +280,100 @@ class QdrantClient(VectorDBBase):
             log.debug(f"Collection {mt_collection} doesn't exist, search returns None")
             return None
 
-        tenant_filter = _tenant_filter(tenant_id)
-        query_response = self.client.query_points(
+        return self._search_tenants(
+            mt_collection, [tenant_id], vectors, limit, include_vectors
+        )
+
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float | int]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        """
+        Search several collections with one request per shared collection.
+        """
+        if not self.client or not vectors:
+            return None
+
+        tenants_by_collection: Dict[str, List[str]] = {}
+        for collection_name in collection_names:
+            mt_collection, tenant_id = self._get_collection_and_tenant_id(
+                collection_name
+            )
+            tenants_by_collection.setdefault(mt_collection, []).append(tenant_id)
+
+        results = []
+        for mt_collection, tenant_ids in tenants_by_collection.items():
+            if not self.client.collection_exists(collection_name=mt_collection):
+                log.debug(f"Collection {mt_collection} doesn't exist, skipping")
+                continue
+            results.append(
+                self._search_tenants(
+                    mt_collection, tenant_ids, vectors, limit, include_vectors
+                )
+            )
+        return merge_search_results(results, limit)
+
+    def _search_tenants(
+        self,
+        mt_collection: str,
+        tenant_ids: List[str],
+        vectors: List[List[float | int]],
+        limit: int,
+        include_vectors: bool,
+    ) -> SearchResult:
+        tenant_filter = (
+            _tenant_filter(tenant_ids[0])
+            if len(tenant_ids) == 1
+            else models.FieldCondition(
+                key=TENANT_ID_FIELD, match=models.MatchAny(any=tenant_ids)
+            )
+        )
+        # All query vectors in one batch request
+        query_responses = self.client.query_batch_points(
             collection_name=mt_collection,
-            query=vectors[0],
-            limit=limit,
-            query_filter=models.Filter(must=[tenant_filter]),
+            requests=[
+                models.QueryRequest(
+                    query=vector,
+                    limit=limit,
+                    filter=models.Filter(must=[tenant_filter]),
+                    with_payload=True,
+                    with_vector=include_vectors,
+                )
+                for vector in vectors
+            ],
         )
-        get_result = self._result_to_get_result(query_response.points)
+
+        # One result list per query vector
+        ids, documents, metadatas, result_vectors, distances = [], [], [], [], []
+        for query_response in query_responses:
+            get_result = self._result_to_get_result(
+                query_response.points, include_vectors=include_vectors
+            )
+            ids.extend(get_result.ids)
+            documents.extend(get_result.documents)
+            metadatas.extend(get_result.metadatas)
+            result_vectors.extend(get_result.vectors or [])
+            distances.append(
+                [(point.score + 1.0) / 2.0 for point in query_response.points]
+            )
         return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas,
+            vectors=result_vectors if include_vectors else None,
+            distances=distances,
         )
 
     def query(
-        self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict[str, Any],
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ):
         """
         Query points with filters and tenant isolation.
@@ -306,10 +393,13 @@ class QdrantClient(VectorDBBase):
             collection_name=mt_collection,
             scroll_filter=combined_filter,
             limit=limit,
+            with_vectors=include_vectors,
         )
-        return self._result_to_get_result(points[0])
+        return self._result_to_get_result(points[0], include_vectors=include_vectors)
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         """
         Get all items in a collection with tenant isolation.
         """
@@ -324,8 +414,9 @@ class QdrantClient(VectorDBBase):
             collection_name=mt_collection,
             scroll_filter=models.Filter(must=[tenant_filter]),
             limit=NO_LIMIT,
+            with_vectors=include_vectors,
         )
-        return self._result_to_get_result(points[0])
+        return self._result_to_get_result(points[0], include_vectors=include_vectors)
 
     def upsert(self, collection_name: str, items: List[VectorItem]):
         """
@@ -300,6 +300,7 @@ class S3VectorClient(VectorDBBase):
         vectors: List[List[Union[float, int]]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         """
         Search for similar vectors in a collection using multiple query vectors.
@@ -323,6 +324,7 @@ class S3VectorClient(VectorDBBase):
             all_documents = []
             all_metadatas = []
             all_distances = []
+            all_vectors = []
 
             # Process each query vector
             for i, query_vector in enumerate(vectors):
@@ -379,6 +381,10 @@ class S3VectorClient(VectorDBBase):
                 all_documents.append(query_documents)
                 all_metadatas.append(query_metadatas)
                 all_distances.append(query_distances)
+                if include_vectors:
+                    all_vectors.append(
+                        self._get_vector_data(collection_name, query_ids)
+                    )
 
             log.info(f"Search completed. Found results for {len(all_ids)} queries")
 
@@ -388,6 +394,7 @@ class S3VectorClient(VectorDBBase):
                 documents=all_documents if all_documents else None,
                 metadatas=all_metadatas if all_metadatas else None,
                 distances=all_distances if all_distances else None,
+                vectors=all_vectors if include_vectors else None,
             )
 
         except Exception as e:
@@ -408,8 +415,37 @@ class S3VectorClient(VectorDBBase):
                     return None
             raise
 
+    def _get_vector_data(
+        self, collection_name: str, keys: List[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        Fetch the stored vectors for the given keys, in key order.
+
+        query_vectors cannot return vector data, so search results are
+        completed with a get_vectors call when vectors are requested.
+        """
+        if not keys:
+            return []
+
+        response = self.client.get_vectors(
+            vectorBucketName=self.bucket_name,
+            indexName=collection_name,
+            keys=keys,
+            returnData=True,
+            returnMetadata=False,
+        )
+        data = {
+            vector.get("key"): vector.get("data", {}).get("float32")
+            for vector in response.get("vectors", [])
+        }
+        return [data.get(key) for key in keys]
+
     def query(
-        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         """
         Query vectors from a collection using metadata filter.
@@ -421,7 +457,7 @@ class S3VectorClient(VectorDBBase):
 
         if not filter:
             log.warning("No filter provided, returning all vectors")
-            return self.get(collection_name)
+            return self.get(collection_name, include_vectors=include_vectors)
 
         try:
             log.info(f"Querying collection '{collection_name}' with filter: {filter}")
@@ -431,7 +467,9 @@ class S3VectorClient(VectorDBBase):
             # we'll retrieve all vectors and filter client-side
 
             # Get all vectors first
-            all_vectors_result = self.get(collection_name)
+            all_vectors_result = self.get(
+                collection_name, include_vectors=include_vectors
+            )
 
             if not all_vectors_result or not all_vectors_result.ids:
                 log.warning("No vectors found in collection")
@@ -445,11 +483,15 @@ class S3VectorClient(VectorDBBase):
             all_metadatas = (
                 all_vectors_result.metadatas[0] if all_vectors_result.metadatas else []
             )
+            all_data = (
+                all_vectors_result.vectors[0] if all_vectors_result.vectors else []
+            )
 
             # Apply client-side filtering
             filtered_ids = []
             filtered_documents = []
             filtered_metadatas = []
+            filtered_vectors = []
 
             for i, metadata in enumerate(all_metadatas):
                 if self._matches_filter(metadata, filter):
@@ -457,6 +499,8 @@ class S3VectorClient(VectorDBBase):
                         filtered_ids.append(all_ids[i])
                     if i < len(all_documents):
                         filtered_documents.append(all_documents[i])
+                    if i < len(all_data):
+                        filtered_vectors.append(all_data[i])
                     filtered_metadatas.append(metadata)
 
                     # Apply limit if specified
@@ -473,6 +517,7 @@ class S3VectorClient(VectorDBBase):
                     ids=[filtered_ids],
                     documents=[filtered_documents],
                     metadatas=[filtered_metadatas],
+                    vectors=[filtered_vectors] if include_vectors else None,
                 )
             else:
                 return GetResult(ids=[[]], documents=[[]], metadatas=[[]])
@@ -492,7 +537,9 @@ class S3VectorClient(VectorDBBase):
                     return GetResult(ids=[[]], documents=[[]], metadatas=[[]])
             raise
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         """
         Retrieve all vectors from a collection.
         """
@@ -508,6 +555,7 @@ class S3VectorClient(VectorDBBase):
             all_ids = []
             all_documents = []
             all_metadatas = []
+            all_vectors = []
 
             # Handle pagination
             next_token = None
@@ -517,7 +565,7 @@ class S3VectorClient(VectorDBBase):
                 request_params = {
                     "vectorBucketName": self.bucket_name,
                     "indexName": collection_name,
-                    "returnData": False,  # Don't include vector data (not needed for get)
+                    "returnData": include_vectors,  # Vector data only when requested
                     "returnMetadata": True,  # Include metadata
                     "maxResults": 500,  # Use reasonable page size
                 }
@@ -562,6 +610,7 @@ class S3VectorClient(VectorDBBase):
                     all_ids.append(vector_id)
                     all_documents.append(document_text)
                     all_metadatas.append(vector_metadata)
+                    all_vectors.append(vector_array or None)
 
                 # Check if there are more pages
                 next_token = response.get("nextToken")
@@ -576,7 +625,10 @@ class S3VectorClient(VectorDBBase):
             # The Open WebUI GetResult expects lists of lists, so we wrap each list
             if all_ids:
                 return GetResult(
-                    ids=[all_ids], documents=[all_documents], metadatas=[all_metadatas]
+                    ids=[all_ids],
+                    documents=[all_documents],
+                    metadatas=[all_metadatas],
+                    vectors=[all_vectors] if include_vectors else None,
                 )
             else:
                 return GetResult(ids=[[]], documents=[[]], metadatas=[[]])
@@ -9,7 +9,7 @@ from rag_system.backend.retrieval.vector.main import (
     SearchResult,
     GetResult,
 )
-from rag_system.backend.retrieval.vector.utils import process_metadata
+from rag_system.backend.retrieval.vector.utils import process_metadata, vector_to_list
 from rag_system.backend.settings import (
     WEAVIATE_HTTP_HOST,
     WEAVIATE_HTTP_PORT,
@@ -46,6 +46,19 @@ def _convert_uuids_to_strings(obj: Any) -> Any:
         return obj
 
 
+def _get_object_vector(obj: Any) -> Optional[List[float]]:
+    """
+    Return the default vector of a Weaviate object, if it was fetched.
+
+    Weaviate returns vectors keyed by vector name; collections created by
+    this client only have the unnamed "default" vector.
+    """
+    vector = getattr(obj, "vector", None)
+    if isinstance(vector, dict):
+        vector = vector.get("default", next(iter(vector.values()), None))
+    return vector_to_list(vector)
+
+
 class WeaviateClient(VectorDBBase):
     def __init__(self):
         self.url = WEAVIATE_HTTP_HOST
@@ -164,6 +177,7 @@ class WeaviateClient(VectorDBBase):
         vectors: List[List[Union[float, int]]],
         filter: Optional[dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         sane_collection_name = self._sanitize_collection_name(collection_name)
         if not self.client.collections.exists(sane_collection_name):
@@ -177,6 +191,7 @@ class WeaviateClient(VectorDBBase):
             [],
             [],
         )
+        result_vectors = []
 
         for vector_embedding in vectors:
             try:
@@ -184,6 +199,7 @@ class WeaviateClient(VectorDBBase):
                     near_vector=vector_embedding,
                     limit=limit,
                     return_metadata=weaviate.classes.query.MetadataQuery(distance=True),
+                    include_vector=include_vectors,
                 )
 
                 ids = [str(obj.uuid) for obj in response.objects]
@@ -211,11 +227,15 @@ class WeaviateClient(VectorDBBase):
                 result_documents.append(documents)
                 result_metadatas.append(metadatas)
                 result_distances.append(distances)
+                result_vectors.append(
+                    [_get_object_vector(obj) for obj in response.objects]
+                )
             except Exception:
                 result_ids.append([])
                 result_documents.append([])
                 result_metadatas.append([])
                 result_distances.append([])
+                result_vectors.append([])
 
         return SearchResult(
             **{
@@ -223,11 +243,16 @@ class WeaviateClient(VectorDBBase):
                 "documents": result_documents,
                 "metadatas": result_metadatas,
                 "distances": result_distances,
+                "vectors": result_vectors if include_vectors else None,
             }
         )
 
     def query(
-        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         sane_collection_name = self._sanitize_collection_name(collection_name)
         if not self.client.collections.exists(sane_collection_name):
@@ -251,7 +276,7 @@ class WeaviateClient(VectorDBBase):
 
         try:
             response = collection.query.fetch_objects(
-                filters=weaviate_filter, limit=limit
+                filters=weaviate_filter, limit=limit, include_vector=include_vectors
             )
 
             ids = [str(obj.uuid) for obj in response.objects]
@@ -268,25 +293,33 @@ class WeaviateClient(VectorDBBase):
                     "ids": [ids],
                     "documents": [documents],
                     "metadatas": [metadatas],
+                    "vectors": (
+                        [[_get_object_vector(obj) for obj in response.objects]]
+                        if include_vectors
+                        else None
+                    ),
                 }
             )
         except Exception:
             return None
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         sane_collection_name = self._sanitize_collection_name(collection_name)
         if not self.client.collections.exists(sane_collection_name):
             return None
 
         collection = self.client.collections.get(sane_collection_name)
-        ids, documents, metadatas = [], [], []
+        ids, documents, metadatas, vectors = [], [], [], []
 
         try:
-            for item in collection.iterator():
+            for item in collection.iterator(include_vector=include_vectors):
                 ids.append(str(item.uuid))
                 properties = dict(item.properties) if item.properties else {}
                 documents.append(properties.pop("text", ""))
                 metadatas.append(_convert_uuids_to_strings(properties))
+                vectors.append(_get_object_vector(item))
 
             if not ids:
                 return None
@@ -296,6 +329,7 @@ class WeaviateClient(VectorDBBase):
                     "ids": [ids],
                     "documents": [documents],
                     "metadatas": [metadatas],
+                    "vectors": [vectors] if include_vectors else None,
                 }
             )
         except Exception:
@@ -1,9 +1,17 @@
 from rag_system.backend.retrieval.vector.main import VectorDBBase
+from rag_system.backend.retrieval.vector.cache import (
+    CollectionSnapshotCache,
+    CollectionVersionStore,
+    VersionedVectorDB,
+)
 from rag_system.backend.retrieval.vector.type import VectorType
 from rag_system.backend.settings import (
     VECTOR_DB,
     ENABLE_QDRANT_MULTITENANCY_MODE,
     ENABLE_MILVUS_MULTITENANCY_MODE,
+    RAG_COLLECTION_SNAPSHOT_CACHE_SIZE_MB,
+    RAG_COLLECTION_SNAPSHOT_CACHE_TTL,
+    RAG_COLLECTION_VERSIONS_PATH,
 )
 
 
@@ -79,4 +87,11 @@ class Vector:
                 raise ValueError(f"Unsupported vector type: {vector_type}")
 
 
-VECTOR_DB_CLIENT = Vector.get_vector(VECTOR_DB)
+VECTOR_DB_CLIENT = VersionedVectorDB(
+    Vector.get_vector(VECTOR_DB),
+    CollectionSnapshotCache(
+        max_bytes=RAG_COLLECTION_SNAPSHOT_CACHE_SIZE_MB * 1024 * 1024,
+        ttl=RAG_COLLECTION_SNAPSHOT_CACHE_TTL,
+    ),
+    CollectionVersionStore(RAG_COLLECTION_VERSIONS_PATH),
+)
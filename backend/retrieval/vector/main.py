@@ -1,3 +1,5 @@
+import asyncio
+
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
@@ -14,12 +16,64 @@ class GetResult(BaseModel):
     ids: Optional[List[List[str]]]
     documents: Optional[List[List[str]]]
     metadatas: Optional[List[List[Any]]]
+    # Stored vectors, only populated when requested with include_vectors=True
+    vectors: Optional[List[List[Any]]] = None
 
 
 class SearchResult(GetResult):
     distances: Optional[List[List[float | int]]]
 
 
+def merge_search_results(
+    results: List[Optional[SearchResult]], limit: Optional[int] = None
+) -> Optional[SearchResult]:
+    """
+    Merge per-collection results of the same query vectors.
+
+    For every query vector the hits of all results are ordered by distance
+    (higher is better, as every backend normalizes to [0, 1]) and cut to
+    limit.
+    """
+    results = [result for result in results if result is not None and result.ids]
+    if not results:
+        return None
+
+    include_vectors = any(result.vectors is not None for result in results)
+    ids, documents, metadatas, distances, vectors = [], [], [], [], []
+    for qid in range(max(len(result.ids) for result in results)):
+        hits = []
+        for result in results:
+            if qid >= len(result.ids):
+                continue
+            for idx in range(len(result.ids[qid])):
+                hits.append(
+                    (
+                        result.distances[qid][idx],
+                        result.ids[qid][idx],
+                        result.documents[qid][idx],
+                        result.metadatas[qid][idx],
+                        result.vectors[qid][idx] if result.vectors else None,
+                    )
+                )
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        if limit is not None:
+            hits = hits[:limit]
+
+        distances.append([hit[0] for hit in hits])
+        ids.append([hit[1] for hit in hits])
+        documents.append([hit[2] for hit in hits])
+        metadatas.append([hit[3] for hit in hits])
+        vectors.append([hit[4] for hit in hits])
+
+    return SearchResult(
+        ids=ids,
+        documents=documents,
+        metadatas=metadatas,
+        distances=distances,
+        vectors=vectors if include_vectors else None,
+    )
+
+
 class VectorDBBase(ABC):
     """
     Abstract base class for all vector database backends.
@@ -58,22 +112,148 @@ class VectorDBBase(ABC):
         vectors: List[List[Union[float, int]]],
         filter: Optional[Dict] = None,
         limit: int = 10,
+        include_vectors: bool = False,
     ) -> Optional[SearchResult]:
         """Search for similar vectors in a collection."""
         pass
 
     @abstractmethod
     def query(
-        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
     ) -> Optional[GetResult]:
         """Query vectors from a collection using metadata filter."""
         pass
 
     @abstractmethod
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    def get(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
         """Retrieve all vectors from a collection."""
         pass
 
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        """
+        Async search. Runs search in a worker thread unless the backend
+        overrides it with a native async client call.
+        """
+        return await asyncio.to_thread(
+            self.search,
+            collection_name=collection_name,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
+            include_vectors=include_vectors,
+        )
+
+    def search_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        """
+        Search several collections at once.
+
+        Returns, for every query vector, the best `limit` hits across all
+        collections. Backends that keep collections in one physical table or
+        index override this with a single query; by default every
+        collection is searched and the results are merged.
+        """
+        return merge_search_results(
+            [
+                self.search(
+                    collection_name=collection_name,
+                    vectors=vectors,
+                    filter=filter,
+                    limit=limit,
+                    include_vectors=include_vectors,
+                )
+                for collection_name in collection_names
+            ],
+            limit,
+        )
+
+    async def asearch_many(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        include_vectors: bool = False,
+    ) -> Optional[SearchResult]:
+        """
+        Async search_many. Native search_many implementations run in a worker
+        thread, otherwise the collections are searched concurrently.
+        """
+        if type(self).search_many is not VectorDBBase.search_many:
+            return await asyncio.to_thread(
+                self.search_many,
+                collection_names=collection_names,
+                vectors=vectors,
+                filter=filter,
+                limit=limit,
+                include_vectors=include_vectors,
+            )
+
+        results = await asyncio.gather(
+            *[
+                self.asearch(
+                    collection_name=collection_name,
+                    vectors=vectors,
+                    filter=filter,
+                    limit=limit,
+                    include_vectors=include_vectors,
+                )
+                for collection_name in collection_names
+            ],
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        return merge_search_results(
+            [result for result in results if not isinstance(result, Exception)],
+            limit,
+        )
+
+    async def aquery(
+        self,
+        collection_name: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        include_vectors: bool = False,
+    ) -> Optional[GetResult]:
+        """Async query, offloaded to a worker thread by default."""
+        # Keep the backend default limit when none is given
+        return await asyncio.to_thread(
+            self.query,
+            collection_name=collection_name,
+            filter=filter,
+            include_vectors=include_vectors,
+            **({"limit": limit} if limit is not None else {}),
+        )
+
+    async def aget(
+        self, collection_name: str, include_vectors: bool = False
+    ) -> Optional[GetResult]:
+        """Async get, offloaded to a worker thread by default."""
+        return await asyncio.to_thread(
+            self.get, collection_name=collection_name, include_vectors=include_vectors
+        )
+
     @abstractmethod
     def delete(
         self,
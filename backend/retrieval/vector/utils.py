@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 
 KEYS_TO_EXCLUDE = ["content", "pages", "tables", "paragraphs", "sections", "figures"]
 
@@ -26,3 +27,14 @@ def process_metadata(
         ):
             metadata[key] = str(value)
     return metadata
+
+
+def vector_to_list(vector) -> Optional[list[float]]:
+    # Backends hand back lists, numpy arrays or pgvector HalfVector objects
+    if vector is None:
+        return None
+    if hasattr(vector, "to_list"):
+        return vector.to_list()
+    if hasattr(vector, "tolist"):
+        return vector.tolist()
+    return list(vector)
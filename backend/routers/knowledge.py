@@ -3,7 +3,9 @@ from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import StreamingResponse
 from fastapi.concurrency import run_in_threadpool
+import asyncio
 import logging
+import time
 import io
 import zipfile
 
@@ -15,6 +17,7 @@ from rag_system.backend.dependencies import (
     get_permission_provider,
     get_storage_provider,
 )
+from rag_system.backend.db import get_db_context
 from rag_system.backend.model_registry import get_model
 from rag_system.backend.models.knowledge import (
     KnowledgeFileListResponse,
@@ -25,6 +28,14 @@ from rag_system.backend.models.knowledge import (
 )
  
 from rag_system.backend.retrieval.vector.factory import VECTOR_DB_CLIENT
+from rag_system.backend.retrieval.bm25 import BM25_INDEX
+from rag_system.backend.retrieval.jobs import (
+    COMPLETED,
+    FAILED,
+    JOB_STORE,
+    PENDING,
+    RUNNING,
+)
 from rag_system.backend.routers.retrieval import (
     process_file,
     ProcessFileForm,
@@ -32,6 +43,10 @@ from rag_system.backend.routers.retrieval import (
     BatchProcessFilesForm,
 )
 from rag_system.backend.constants import ERROR_MESSAGES
+from rag_system.backend.settings import (
+    RAG_REINDEX_CONCURRENCY,
+    RAG_REINDEX_STALE_SECONDS,
+)
 
 
 log = logging.getLogger(__name__)
@@ -273,67 +288,291 @@ async def create_new_knowledge(
 ############################
 
 
+REINDEX_JOB_KIND = "knowledge_reindex"
+
+# Reindex job running in this process and the start of its current run
+_reindex_task: Optional[asyncio.Task] = None
+_reindex_run_started_at: Optional[float] = None
+
+
+def _get_heartbeat_interval() -> float:
+    return max(1.0, RAG_REINDEX_STALE_SECONDS / 4)
+
+
+def _is_stale(job: dict) -> bool:
+    # The owning process stopped heartbeating, a restart or a crash
+    return (
+        RAG_REINDEX_STALE_SECONDS > 0
+        and time.time() - job["updated_at"] > RAG_REINDEX_STALE_SECONDS
+    )
+
+
+def _get_file_field(file, name: str):
+    # Knowledges.get_files_by_id returns dumped rows
+    return file.get(name) if isinstance(file, dict) else getattr(file, name, None)
+
+
+def create_reindex_job(db: Session) -> str:
+    items = []
+    for knowledge_base in Knowledges.get_knowledge_bases(db=db):
+        # The collection is reset once, before its first file is reprocessed
+        items.append(
+            (f"{knowledge_base.id}:collection", {"knowledge_id": knowledge_base.id})
+        )
+        for file in Knowledges.get_files_by_id(knowledge_base.id, db=db):
+            file_id = _get_file_field(file, "id")
+            items.append(
+                (
+                    f"{knowledge_base.id}:{file_id}",
+                    {
+                        "knowledge_id": knowledge_base.id,
+                        "file_id": file_id,
+                        "filename": _get_file_field(file, "filename"),
+                        "hash": _get_file_field(file, "hash"),
+                    },
+                )
+            )
+    return JOB_STORE.create_job(REINDEX_JOB_KIND, items)
+
+
+def _reset_collection(collection_name: str) -> None:
+    if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+        VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+    BM25_INDEX.delete_collection(collection_name)
+
+
+def _delete_file_chunks(collection_name: str, file_id: str) -> None:
+    try:
+        VECTOR_DB_CLIENT.delete(
+            collection_name=collection_name, filter={"file_id": file_id}
+        )
+        BM25_INDEX.delete(collection_name, filter={"file_id": file_id})
+    except Exception as e:
+        # Nothing was written for the file yet
+        log.debug(f"No chunks of file {file_id} to delete in {collection_name}: {e}")
+
+
+def _reindex_file(request: Request, file_id: str, knowledge_id: str, user) -> None:
+    # Runs outside the request that started the job, so with its own session
+    with get_db_context() as db:
+        process_file(
+            request,
+            ProcessFileForm(file_id=file_id, collection_name=knowledge_id),
+            user=user,
+            db=db,
+        )
+
+
+async def _heartbeat(job_id: str) -> None:
+    # Keeps other processes from taking over the job while a slow file runs
+    while True:
+        await asyncio.sleep(_get_heartbeat_interval())
+        await asyncio.to_thread(JOB_STORE.heartbeat, job_id)
+
+
+async def run_reindex_job(request: Request, job_id: str, user) -> None:
+    """
+    Process the unfinished items of a claimed reindex job.
+
+    Knowledge bases are handled in order; the files of a knowledge base are
+    reprocessed concurrently (RAG_REINDEX_CONCURRENCY), except files with the
+    same content hash, and every item is checkpointed in JOB_STORE as soon
+    as it finishes.
+    """
+    global _reindex_run_started_at
+    _reindex_run_started_at = time.time()
+    heartbeat = asyncio.create_task(_heartbeat(job_id))
+    try:
+        await _run_reindex_items(request, job_id, user)
+    finally:
+        heartbeat.cancel()
+
+
+async def _run_reindex_items(request: Request, job_id: str, user) -> None:
+    items = await asyncio.to_thread(
+        JOB_STORE.get_items, job_id, statuses=(PENDING, RUNNING)
+    )
+    log.info(f"Reindex job {job_id}: {len(items)} items left to process")
+
+    knowledge_items: dict[str, list[dict]] = {}
+    for item in items:
+        knowledge_items.setdefault(item["payload"]["knowledge_id"], []).append(item)
+
+    semaphore = asyncio.Semaphore(max(1, RAG_REINDEX_CONCURRENCY))
+
+    async def reindex_file(item: dict) -> None:
+        payload = item["payload"]
+        async with semaphore:
+            try:
+                if item["status"] == RUNNING:
+                    # Interrupted mid-file, drop its partial chunks first
+                    await run_in_threadpool(
+                        _delete_file_chunks,
+                        payload["knowledge_id"],
+                        payload["file_id"],
+                    )
+                await asyncio.to_thread(
+                    JOB_STORE.set_item_status, job_id, item["item_id"], RUNNING
+                )
+                await run_in_threadpool(
+                    _reindex_file,
+                    request,
+                    payload["file_id"],
+                    payload["knowledge_id"],
+                    user,
+                )
+                await asyncio.to_thread(
+                    JOB_STORE.set_item_status, job_id, item["item_id"], COMPLETED
+                )
+            except Exception as e:
+                error = getattr(e, "detail", None) or str(e)
+                log.error(
+                    f"Error processing file {payload.get('filename')} "
+                    f"(ID: {payload['file_id']}): {error}"
+                )
+                await asyncio.to_thread(
+                    JOB_STORE.set_item_status, job_id, item["item_id"], FAILED, error
+                )
+
+    async def reindex_files(items: list[dict]) -> None:
+        for item in items:
+            await reindex_file(item)
+
+    def set_items_status(items: list[dict], status: str, error=None) -> None:
+        for item in items:
+            JOB_STORE.set_item_status(job_id, item["item_id"], status, error)
+
+    try:
+        for knowledge_id, knowledge_base_items in knowledge_items.items():
+            file_items = [
+                item for item in knowledge_base_items if "file_id" in item["payload"]
+            ]
+            reset_items = [
+                item for item in knowledge_base_items if item not in file_items
+            ]
+            try:
+                for item in reset_items:
+                    await run_in_threadpool(_reset_collection, knowledge_id)
+                    await asyncio.to_thread(set_items_status, [item], COMPLETED)
+            except Exception as e:
+                log.error(f"Error deleting collection {knowledge_id}: {str(e)}")
+                await asyncio.to_thread(set_items_status, reset_items, FAILED, str(e))
+                # Skip, the files are not added on top of the stale collection
+                await asyncio.to_thread(
+                    set_items_status, file_items, FAILED, "Collection reset failed"
+                )
+                continue
+
+            # The duplicate content check and the insert are not atomic, so
+            # files with the same hash run one after the other and the later
+            # ones are rejected as duplicates, like a sequential reindex
+            hash_items: dict[str, list[dict]] = {}
+            for item in file_items:
+                hash_items.setdefault(
+                    item["payload"].get("hash") or item["item_id"], []
+                ).append(item)
+            await asyncio.gather(
+                *[reindex_files(items) for items in hash_items.values()]
+            )
+    except asyncio.CancelledError:
+        # Shutdown: hand the job back, the next POST /reindex resumes it
+        # without waiting for the heartbeat to go stale
+        log.info(f"Reindex job {job_id} interrupted")
+        await asyncio.to_thread(JOB_STORE.set_job_status, job_id, PENDING)
+        raise
+    except Exception as e:
+        log.exception(f"Reindex job {job_id} failed: {e}")
+        await asyncio.to_thread(JOB_STORE.set_job_status, job_id, FAILED, str(e))
+        return
+
+    job = await asyncio.to_thread(JOB_STORE.get_job, job_id)
+    await asyncio.to_thread(JOB_STORE.set_job_status, job_id, COMPLETED)
+    log.info(
+        f"Reindex job {job_id} completed: {job['counts'][COMPLETED]} items done, "
+        f"{job['counts'][FAILED]} failed"
+    )
+
+
 @router.post("/reindex", response_model=bool)
 async def reindex_knowledge_files(
     request: Request,
     user=Depends(get_verified_user),
     db: Session = Depends(get_session),
 ):
+    """
+    Start reindexing every knowledge base as a background job.
+
+    An interrupted job is resumed from its checkpoints instead of starting
+    over; progress is reported by /reindex/status. The job is claimed in
+    JOB_STORE, so only one server process runs it at a time.
+    """
+    global _reindex_task
+
     if user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ERROR_MESSAGES.UNAUTHORIZED,
         )
 
-    knowledge_bases = Knowledges.get_knowledge_bases(db=db)
+    if _reindex_task is not None and not _reindex_task.done():
+        log.info("Reindexing is already running")
+        return True
 
-    log.info(f"Starting reindexing for {len(knowledge_bases)} knowledge bases")
+    if not JOB_STORE.get_unfinished_jobs(REINDEX_JOB_KIND):
+        log.info(f"Created reindex job {create_reindex_job(db)}")
 
-    for knowledge_base in knowledge_bases:
-        try:
-            files = Knowledges.get_files_by_id(knowledge_base.id, db=db)
-            try:
-                if VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_base.id):
-                    VECTOR_DB_CLIENT.delete_collection(
-                        collection_name=knowledge_base.id
-                    )
-            except Exception as e:
-                log.error(f"Error deleting collection {knowledge_base.id}: {str(e)}")
-                continue  # Skip, don't raise
+    # A job another process is running keeps its heartbeat fresh and is not
+    # claimed; a pending job or a stale running one (interrupted) is
+    job = await asyncio.to_thread(
+        JOB_STORE.claim_job, REINDEX_JOB_KIND, stale_after=RAG_REINDEX_STALE_SECONDS
+    )
+    if job is None:
+        log.info("Reindexing is already running in another process")
+        return True
 
-            failed_files = []
-            for file in files:
-                try:
-                    await run_in_threadpool(
-                        process_file,
-                        request,
-                        ProcessFileForm(
-                            file_id=file.id, collection_name=knowledge_base.id
-                        ),
-                        user=user,
-                        db=db,
-                    )
-                except Exception as e:
-                    log.error(
-                        f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
-                    )
-                    failed_files.append({"file_id": file.id, "error": str(e)})
-                    continue
+    log.info(
+        f"Running reindex job {job['id']}: "
+        f"{job['counts'][PENDING] + job['counts'][RUNNING]} of {job['total']} "
+        "items left"
+    )
+    _reindex_task = asyncio.create_task(run_reindex_job(request, job["id"], user))
+    return True
 
-        except Exception as e:
-            log.error(f"Error processing knowledge base {knowledge_base.id}: {str(e)}")
-            # Don't raise, just continue
-            continue
 
-        if failed_files:
-            log.warning(
-                f"Failed to process {len(failed_files)} files in knowledge base {knowledge_base.id}"
-            )
-            for failed in failed_files:
-                log.warning(f"File ID: {failed['file_id']}, Error: {failed['error']}")
+@router.get("/reindex/status", response_model=Optional[dict])
+async def get_reindex_status(user=Depends(get_admin_user)):
+    job = JOB_STORE.get_latest_job(REINDEX_JOB_KIND)
+    if job is None:
+        return None
 
-    log.info(f"Reindexing completed.")
-    return True
+    local = _reindex_task is not None and not _reindex_task.done()
+    if not local and (
+        (job["status"] == RUNNING and _is_stale(job))
+        or (job["status"] == PENDING and job["started_at"] is not None)
+    ):
+        # Left behind by a crash or a shutdown, POST /reindex resumes it
+        job["status"] = "interrupted"
+
+    # Running here, or in another process that keeps heartbeating
+    active = job["status"] == RUNNING
+    job["active"] = active
+    job.update(
+        JOB_STORE.get_throughput(
+            job["id"], since=_reindex_run_started_at if local else job["started_at"]
+        )
+        if active
+        else {"items_per_second": None, "eta_seconds": None}
+    )
+    job["failures"] = [
+        {
+            "knowledge_id": item["payload"].get("knowledge_id"),
+            "file_id": item["payload"].get("file_id"),
+            "filename": item["payload"].get("filename"),
+            "error": item["error"],
+        }
+        for item in JOB_STORE.get_items(job["id"], statuses=(FAILED,))
+    ]
+    return job
 
 
 ############################
@@ -638,6 +877,7 @@ def update_file_from_knowledge_by_id(
     VECTOR_DB_CLIENT.delete(
         collection_name=knowledge.id, filter={"file_id": form_data.file_id}
     )
+    BM25_INDEX.delete(knowledge.id, filter={"file_id": form_data.file_id})
 
     # Add content to the vector database
     try:
@@ -716,6 +956,9 @@ def remove_file_from_knowledge_by_id(
         VECTOR_DB_CLIENT.delete(
             collection_name=knowledge.id, filter={"hash": file.hash}
         )  # Remove by hash as well in case of duplicates
+
+        BM25_INDEX.delete(knowledge.id, filter={"file_id": form_data.file_id})
+        BM25_INDEX.delete(knowledge.id, filter={"hash": file.hash})
     except Exception as e:
         log.debug("This was most likely caused by bypassing embedding processing")
         log.debug(e)
@@ -727,6 +970,7 @@ def remove_file_from_knowledge_by_id(
             file_collection = f"file-{form_data.file_id}"
             if VECTOR_DB_CLIENT.has_collection(collection_name=file_collection):
                 VECTOR_DB_CLIENT.delete_collection(collection_name=file_collection)
+            BM25_INDEX.delete_collection(file_collection)
         except Exception as e:
             log.debug("This was most likely caused by bypassing embedding processing")
             log.debug(e)
@@ -808,6 +1052,7 @@ async def delete_knowledge_by_id(
     # Clean up vector DB
     try:
         VECTOR_DB_CLIENT.delete_collection(collection_name=id)
+        BM25_INDEX.delete_collection(id)
     except Exception as e:
         log.debug(e)
         pass
@@ -850,6 +1095,7 @@ async def reset_knowledge_by_id(
 
     try:
         VECTOR_DB_CLIENT.delete_collection(collection_name=id)
+        BM25_INDEX.delete_collection(id)
     except Exception as e:
         log.debug(e)
         pass
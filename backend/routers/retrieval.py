@@ -4,9 +4,12 @@ import mimetypes
 import os
 import shutil
 import asyncio
+import functools
 
 import re
 import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from datetime import datetime
 from pathlib import Path
 from typing import Iterator, List, Optional, Sequence, Union
@@ -49,6 +52,23 @@ from sqlalchemy.orm import Session
 
 
 from rag_system.backend.retrieval.vector.factory import VECTOR_DB_CLIENT
+from rag_system.backend.retrieval.vector.main import GetResult
+from rag_system.backend.retrieval.jobs import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    JOB_STORE,
+    PENDING,
+    RUNNING,
+)
+from rag_system.backend.db import get_db_context
+from rag_system.backend.retrieval.bm25 import BM25_INDEX
+from rag_system.backend.retrieval.rerank_cache import RERANK_SCORE_CACHE
+from rag_system.backend.retrieval.result_cache import QUERY_RESULT_CACHE
+from rag_system.backend.retrieval.embedding_cache import (
+    CHUNK_EMBEDDING_STORE,
+    QUERY_EMBEDDING_CACHE,
+)
 
 # Document loaders
 from rag_system.backend.retrieval.loaders.main import Loader
@@ -85,11 +105,13 @@ from rag_system.backend.retrieval.web.external import search_external
 from rag_system.backend.retrieval.utils import (
     get_content_from_url,
     get_embedding_function,
+    get_enriched_text,
     get_reranking_function,
+    get_model_cache_params,
     get_model_path,
     query_collection,
     query_collection_with_hybrid_search,
-    query_doc,
+    aquery_doc,
     query_doc_with_hybrid_search,
 )
 from rag_system.backend.retrieval.vector.utils import filter_metadata
@@ -105,10 +127,17 @@ from rag_system.backend.settings import (
     RAG_EMBEDDING_MODEL_TRUST_REMOTE_CODE,
     RAG_RERANKING_MODEL_AUTO_UPDATE,
     RAG_RERANKING_MODEL_TRUST_REMOTE_CODE,
+    RAG_RERANKING_LENGTH_BUCKETING,
+    RAG_RERANKING_BATCH_SIZE,
+    RAG_RERANKING_BATCH_WAIT_MS,
+    RAG_RERANKING_BATCH_MAX_SIZE,
     UPLOAD_DIR,
     DEFAULT_LOCALE,
     RAG_EMBEDDING_CONTENT_PREFIX,
     RAG_EMBEDDING_QUERY_PREFIX,
+    RAG_INGESTION_WORKERS,
+    RAG_INGESTION_POLL_INTERVAL,
+    RAG_INGESTION_STALE_SECONDS,
 )
 from rag_system.backend.env import (
     DEVICE_TYPE,
@@ -250,6 +279,28 @@ def get_rf(
                 except Exception as e2:
                     log.warning(f"Failed to adjust pad_token_id on CrossEncoder: {e2}")
 
+                if RAG_RERANKING_LENGTH_BUCKETING:
+                    from rag_system.backend.retrieval.models.bucketing import (
+                        LengthBucketedReranker,
+                    )
+
+                    # Batch candidates of similar token length together
+                    rf = LengthBucketedReranker(
+                        rf, batch_size=RAG_RERANKING_BATCH_SIZE
+                    )
+
+                if RAG_RERANKING_BATCH_WAIT_MS > 0:
+                    from rag_system.backend.retrieval.models.batching import (
+                        BatchingReranker,
+                    )
+
+                    # Coalesce concurrent requests into shared forward passes
+                    rf = BatchingReranker(
+                        rf,
+                        max_batch_size=RAG_RERANKING_BATCH_MAX_SIZE,
+                        max_wait_ms=RAG_RERANKING_BATCH_WAIT_MS,
+                    )
+
     return rf
 
 
@@ -260,7 +311,16 @@ def get_rf(
 ##########################################
 
 
-router = APIRouter()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Merged into the lifespan of the app including the router, so queued
+    # and interrupted ingestion jobs are picked up without waiting for a request
+    INGESTION_QUEUE.start(app)
+    yield
+    await INGESTION_QUEUE.stop()
+
+
+router = APIRouter(lifespan=lifespan)
 
 
 class CollectionNameForm(BaseModel):
@@ -290,6 +350,17 @@ async def get_status(request: Request):
     }
 
 
+@router.get("/cache/stats")
+async def get_cache_stats(request: Request, user=Depends(get_admin_user)):
+    return {
+        "collection_snapshots": VECTOR_DB_CLIENT.snapshot_cache.stats(),
+        "rerank_scores": RERANK_SCORE_CACHE.stats(),
+        "query_results": QUERY_RESULT_CACHE.stats(),
+        "query_embeddings": QUERY_EMBEDDING_CACHE.stats(),
+        "chunk_embeddings": CHUNK_EMBEDDING_STORE.stats(),
+    }
+
+
 @router.get("/embedding")
 async def get_embedding_config(request: Request, user=Depends(get_admin_user)):
     return {
@@ -440,6 +511,9 @@ async def update_embedding_config(
             ),
             enable_async=request.app.state.config.ENABLE_ASYNC_EMBEDDING,
         )
+        # Cached embeddings and results come from the previous embedding model
+        QUERY_EMBEDDING_CACHE.clear()
+        QUERY_RESULT_CACHE.clear()
 
         return {
             "status": True,
@@ -947,6 +1021,8 @@ async def update_rag_config(
     # Reranking settings
     if request.app.state.config.RAG_RERANKING_ENGINE == "":
         # Unloading the internal reranker and clear VRAM memory
+        if hasattr(getattr(request.app.state, "rf", None), "aclose"):
+            await request.app.state.rf.aclose()
         request.app.state.rf = None
         request.app.state.RERANKING_FUNCTION = None
         import gc
@@ -996,6 +1072,10 @@ async def update_rag_config(
                 request.app.state.config.ENABLE_RAG_HYBRID_SEARCH
                 and not request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
             ):
+                # Release the connections/batching worker of the previous reranker
+                if hasattr(getattr(request.app.state, "rf", None), "aclose"):
+                    await request.app.state.rf.aclose()
+
                 request.app.state.rf = get_rf(
                     request.app.state.config.RAG_RERANKING_ENGINE,
                     request.app.state.config.RAG_RERANKING_MODEL,
@@ -1018,6 +1098,8 @@ async def update_rag_config(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=ERROR_MESSAGES.DEFAULT(e),
         )
+    # Cached hybrid results were ranked under the previous reranking settings
+    QUERY_RESULT_CACHE.clear()
 
     # Chunking settings
     request.app.state.config.TEXT_SPLITTER = (
@@ -1426,18 +1508,7 @@ def save_docs_to_vector_db(
         f"save_docs_to_vector_db: document {_get_docs_info(docs)} {collection_name}"
     )
 
-    # Check if entries with the same hash (metadata.hash) already exist
-    if metadata and "hash" in metadata:
-        result = VECTOR_DB_CLIENT.query(
-            collection_name=collection_name,
-            filter={"hash": metadata["hash"]},
-        )
-
-        if result is not None and result.ids and len(result.ids) > 0:
-            existing_doc_ids = result.ids[0]
-            if existing_doc_ids:
-                log.info(f"Document with hash {metadata['hash']} already exists")
-                raise ValueError(ERROR_MESSAGES.DUPLICATE_CONTENT)
+    check_duplicate_content(collection_name, metadata)
 
     if split:
         if request.app.state.config.ENABLE_MARKDOWN_HEADER_TEXT_SPLITTER:
@@ -1504,10 +1575,7 @@ def save_docs_to_vector_db(
         {
             **doc.metadata,
             **(metadata if metadata else {}),
-            "embedding_config": {
-                "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
-                "model": request.app.state.config.RAG_EMBEDDING_MODEL,
-            },
+            "embedding_config": get_current_embedding_config(request),
         }
         for doc in docs
     ]
@@ -1518,6 +1586,7 @@ def save_docs_to_vector_db(
 
             if overwrite:
                 VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+                BM25_INDEX.delete_collection(collection_name)
                 log.info(f"deleting existing collection {collection_name}")
             elif add is False:
                 log.info(
@@ -1526,35 +1595,42 @@ def save_docs_to_vector_db(
                 return True
 
         log.info(f"generating embeddings for {collection_name}")
-        embedding_function = get_embedding_function(
+        # Only chunks missing from the persistent store reach the provider
+        embedding_function = CHUNK_EMBEDDING_STORE.wrap(
             request.app.state.config.RAG_EMBEDDING_ENGINE,
             request.app.state.config.RAG_EMBEDDING_MODEL,
-            request.app.state.ef,
-            (
-                request.app.state.config.RAG_OPENAI_API_BASE_URL
-                if request.app.state.config.RAG_EMBEDDING_ENGINE == "openai"
-                else (
-                    request.app.state.config.RAG_OLLAMA_BASE_URL
-                    if request.app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
-                    else request.app.state.config.RAG_AZURE_OPENAI_BASE_URL
-                )
-            ),
-            (
-                request.app.state.config.RAG_OPENAI_API_KEY
-                if request.app.state.config.RAG_EMBEDDING_ENGINE == "openai"
-                else (
-                    request.app.state.config.RAG_OLLAMA_API_KEY
-                    if request.app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
-                    else request.app.state.config.RAG_AZURE_OPENAI_API_KEY
-                )
-            ),
-            request.app.state.config.RAG_EMBEDDING_BATCH_SIZE,
-            azure_api_version=(
-                request.app.state.config.RAG_AZURE_OPENAI_API_VERSION
-                if request.app.state.config.RAG_EMBEDDING_ENGINE == "azure_openai"
-                else None
+            get_embedding_function(
+                request.app.state.config.RAG_EMBEDDING_ENGINE,
+                request.app.state.config.RAG_EMBEDDING_MODEL,
+                request.app.state.ef,
+                (
+                    request.app.state.config.RAG_OPENAI_API_BASE_URL
+                    if request.app.state.config.RAG_EMBEDDING_ENGINE == "openai"
+                    else (
+                        request.app.state.config.RAG_OLLAMA_BASE_URL
+                        if request.app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
+                        else request.app.state.config.RAG_AZURE_OPENAI_BASE_URL
+                    )
+                ),
+                (
+                    request.app.state.config.RAG_OPENAI_API_KEY
+                    if request.app.state.config.RAG_EMBEDDING_ENGINE == "openai"
+                    else (
+                        request.app.state.config.RAG_OLLAMA_API_KEY
+                        if request.app.state.config.RAG_EMBEDDING_ENGINE == "ollama"
+                        else request.app.state.config.RAG_AZURE_OPENAI_API_KEY
+                    )
+                ),
+                request.app.state.config.RAG_EMBEDDING_BATCH_SIZE,
+                azure_api_version=(
+                    request.app.state.config.RAG_AZURE_OPENAI_API_VERSION
+                    if request.app.state.config.RAG_EMBEDDING_ENGINE == "azure_openai"
+                    else None
+                ),
+                enable_async=request.app.state.config.ENABLE_ASYNC_EMBEDDING,
+                # Chunks are cached in the store, keep them from evicting queries
+                cache_embeddings=False,
             ),
-            enable_async=request.app.state.config.ENABLE_ASYNC_EMBEDDING,
         )
 
         # Run async embedding in sync context
@@ -1584,6 +1660,125 @@ def save_docs_to_vector_db(
         )
 
         log.info(f"added {len(items)} items to collection {collection_name}")
+        index_inserted_items(request, collection_name, items)
+
+        return True
+    except Exception as e:
+        log.exception(e)
+        raise e
+
+
+def check_duplicate_content(collection_name: str, metadata: Optional[dict]) -> None:
+    # Check if entries with the same hash (metadata.hash) already exist
+    if metadata and "hash" in metadata:
+        result = VECTOR_DB_CLIENT.query(
+            collection_name=collection_name,
+            filter={"hash": metadata["hash"]},
+        )
+
+        if result is not None and result.ids and len(result.ids) > 0:
+            existing_doc_ids = result.ids[0]
+            if existing_doc_ids:
+                log.info(f"Document with hash {metadata['hash']} already exists")
+                raise ValueError(ERROR_MESSAGES.DUPLICATE_CONTENT)
+
+
+def index_inserted_items(request: Request, collection_name: str, items: list[dict]):
+    try:
+        enable_enriched_texts = bool(
+            request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS
+        )
+        BM25_INDEX.add(
+            collection_name,
+            ids=[item["id"] for item in items],
+            texts=[
+                (
+                    get_enriched_text(item["text"], item["metadata"])
+                    if enable_enriched_texts
+                    else item["text"]
+                )
+                for item in items
+            ],
+            metadatas=[item["metadata"] for item in items],
+            enriched=enable_enriched_texts,
+        )
+    except Exception as e:
+        # The index is rebuilt lazily on the next hybrid search
+        log.warning(f"Failed to update BM25 index for {collection_name}: {e}")
+
+    # Late-interaction rerankers (ColBERT) precompute document token embeddings
+    rf = getattr(request.app.state, "rf", None)
+    if rf is not None and hasattr(rf, "index_documents"):
+        try:
+            indexed = rf.index_documents([item["text"] for item in items])
+            log.info(f"indexed {indexed} chunks for late-interaction reranking")
+        except Exception as e:
+            # Missing chunks are embedded on their first rerank instead
+            log.warning(
+                f"Failed to index reranker embeddings for {collection_name}: {e}"
+            )
+
+
+def get_current_embedding_config(request: Request) -> dict:
+    return {
+        "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
+        "model": request.app.state.config.RAG_EMBEDDING_MODEL,
+    }
+
+
+def can_copy_vectors(request: Request, result: Optional[GetResult]) -> bool:
+    """
+    Whether stored chunks can be copied as-is into another collection.
+
+    Every chunk needs its vector and must have been embedded with the
+    current embedding engine and model.
+    """
+    if result is None or not result.ids or not result.ids[0] or not result.vectors:
+        return False
+
+    embedding_config = get_current_embedding_config(request)
+    for metadata, vector in zip(result.metadatas[0], result.vectors[0]):
+        # Backends without nested metadata store the config stringified
+        config = (metadata or {}).get("embedding_config")
+        if not vector or config not in (embedding_config, str(embedding_config)):
+            return False
+    return True
+
+
+def copy_docs_to_vector_db(
+    request: Request,
+    result: GetResult,
+    collection_name: str,
+    metadata: Optional[dict] = None,
+) -> bool:
+    """
+    Add already embedded chunks to a collection without re-embedding them.
+
+    The chunks, their vectors and metadata (see can_copy_vectors) are
+    bulk-inserted under new ids, then indexed like save_docs_to_vector_db.
+    """
+    check_duplicate_content(collection_name, metadata)
+
+    items = [
+        {
+            "id": str(uuid.uuid4()),
+            "text": text,
+            "vector": vector,
+            "metadata": {
+                **(item_metadata or {}),
+                **(metadata if metadata else {}),
+                "embedding_config": get_current_embedding_config(request),
+            },
+        }
+        for text, item_metadata, vector in zip(
+            result.documents[0], result.metadatas[0], result.vectors[0]
+        )
+    ]
+
+    try:
+        log.info(f"copying {len(items)} embedded items to collection {collection_name}")
+        VECTOR_DB_CLIENT.insert(collection_name=collection_name, items=items)
+        index_inserted_items(request, collection_name, items)
         return True
     except Exception as e:
         log.exception(e)
@@ -1615,6 +1810,7 @@ def process_file(
         try:
 
             collection_name = form_data.collection_name
+            embedded_result = None
 
             if collection_name is None:
                 collection_name = f"file-{file.id}"
@@ -1628,6 +1824,7 @@ def process_file(
                     VECTOR_DB_CLIENT.delete_collection(
                         collection_name=f"file-{file.id}"
                     )
+                    BM25_INDEX.delete_collection(f"file-{file.id}")
                 except:
                     # Audio file upload pipeline
                     pass
@@ -1651,9 +1848,15 @@ def process_file(
                 # Usage: /knowledge/{id}/file/add, /knowledge/{id}/file/update
 
                 result = VECTOR_DB_CLIENT.query(
-                    collection_name=f"file-{file.id}", filter={"file_id": file.id}
+                    collection_name=f"file-{file.id}",
+                    filter={"file_id": file.id},
+                    include_vectors=True,
                 )
 
+                # Chunks embedded with the current model are copied as-is
+                if can_copy_vectors(request, result):
+                    embedded_result = result
+
                 if result is not None and len(result.ids[0]) > 0:
                     docs = [
                         Document(
@@ -1766,18 +1969,30 @@ def process_file(
                 }
             else:
                 try:
-                    result = save_docs_to_vector_db(
-                        request,
-                        docs=docs,
-                        collection_name=collection_name,
-                        metadata={
-                            "file_id": file.id,
-                            "name": file.filename,
-                            "hash": hash,
-                        },
-                        add=(True if form_data.collection_name else False),
-                        user=user,
-                    )
+                    if embedded_result is not None:
+                        result = copy_docs_to_vector_db(
+                            request,
+                            embedded_result,
+                            collection_name=collection_name,
+                            metadata={
+                                "file_id": file.id,
+                                "name": file.filename,
+                                "hash": hash,
+                            },
+                        )
+                    else:
+                        result = save_docs_to_vector_db(
+                            request,
+                            docs=docs,
+                            collection_name=collection_name,
+                            metadata={
+                                "file_id": file.id,
+                                "name": file.filename,
+                                "hash": hash,
+                            },
+                            add=(True if form_data.collection_name else False),
+                            user=user,
+                        )
                     log.info(f"added {len(docs)} items to collection {collection_name}")
 
                     if result:
@@ -1834,6 +2049,276 @@ def process_file(
         )
 
 
+############################
+# Background ingestion queue
+############################
+
+INGESTION_JOB_KIND = "file_ingestion"
+
+
+def _get_user_fields(user) -> dict:
+    # What ingestion reads of the user: ownership, role and forwarded headers
+    return {
+        field: getattr(user, field, None) for field in ("id", "name", "email", "role")
+    }
+
+
+def _process_queued_file(request: Request, form_data: ProcessFileForm, user) -> dict:
+    # Runs outside the request that queued it, so with its own session
+    with get_db_context() as db:
+        return process_file(request, form_data, user=user, db=db)
+
+
+def _set_file_status(file_id: str, file_status: str) -> None:
+    with get_db_context() as db:
+        _files().update_file_data_by_id(file_id, {"status": file_status}, db=db)
+
+
+def _get_file_chunk_ids(form_data: ProcessFileForm) -> set[str]:
+    collection_name = form_data.collection_name or f"file-{form_data.file_id}"
+    result = VECTOR_DB_CLIENT.query(
+        collection_name=collection_name, filter={"file_id": form_data.file_id}
+    )
+    return set(result.ids[0]) if result and result.ids else set()
+
+
+def _discard_ingested_file(
+    form_data: ProcessFileForm, existing_ids: Optional[set[str]]
+) -> None:
+    # Only the chunks written by the cancelled run are dropped; a file that
+    # was already in the collection keeps the chunks it had before
+    collection_name = form_data.collection_name or f"file-{form_data.file_id}"
+    ids = []
+    if existing_ids is not None:
+        try:
+            ids = list(_get_file_chunk_ids(form_data) - existing_ids)
+            if ids:
+                VECTOR_DB_CLIENT.delete(collection_name=collection_name, ids=ids)
+                BM25_INDEX.delete(collection_name, ids=ids)
+        except Exception as e:
+            log.warning(f"Could not drop the chunks of file {form_data.file_id}: {e}")
+
+    with get_db_context() as db:
+        _files().update_file_data_by_id(
+            form_data.file_id, {"status": "cancelled"}, db=db
+        )
+        if ids:
+            # Like a failed upload, the file can be processed again
+            _files().update_file_hash_by_id(form_data.file_id, None, db=db)
+
+
+class IngestionQueue:
+    """
+    Worker pool for files queued through /process/file/queue.
+
+    Jobs are kept in JOB_STORE, so queued work survives restarts, and the
+    claim is atomic, so several server processes sharing the store split
+    one queue between them. Workers are started with the app (see lifespan)
+    and run whichever process's jobs they claim, so everything they need is
+    read from the job itself.
+    """
+
+    def __init__(self, workers: int, poll_interval: float, stale_after: float):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.request: Optional[Request] = None
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def heartbeat_interval(self) -> float:
+        return max(1.0, self.stale_after / 4) if self.stale_after > 0 else 30.0
+
+    def start(self, app: FastAPI) -> None:
+        if any(not task.done() for task in self._tasks):
+            return
+        # process_file only reads request.app
+        self.request = Request({"type": "http", "app": app})
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(max(1, self.workers))
+        ]
+        log.info(f"Started {len(self._tasks)} ingestion workers")
+
+    async def stop(self) -> None:
+        # Jobs interrupted here go stale and are claimed again later
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def enqueue(self, form_data: ProcessFileForm, user) -> str:
+        job_id = JOB_STORE.create_job(
+            INGESTION_JOB_KIND,
+            [(form_data.file_id, {})],
+            params={"form": form_data.model_dump(), "user": _get_user_fields(user)},
+        )
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job_id
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(
+                    JOB_STORE.claim_job, INGESTION_JOB_KIND, self.stale_after
+                )
+            except Exception as e:
+                log.exception(f"Failed to claim an ingestion job: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._run(job)
+            except Exception as e:
+                log.exception(f"Ingestion job {job['id']} failed: {e}")
+                JOB_STORE.set_job_status(job["id"], FAILED, str(e))
+
+    async def _run(self, job: dict) -> None:
+        job_id = job["id"]
+        form_data = ProcessFileForm(**job["params"]["form"])
+        user = SimpleNamespace(**job["params"]["user"])
+
+        log.info(f"Ingestion job {job_id}: processing file {form_data.file_id}")
+        JOB_STORE.set_item_status(job_id, form_data.file_id, RUNNING)
+        await asyncio.to_thread(_set_file_status, form_data.file_id, "processing")
+        try:
+            # What a cancellation must leave in place
+            existing_ids = await asyncio.to_thread(_get_file_chunk_ids, form_data)
+        except Exception as e:
+            log.warning(f"Could not list the chunks of file {form_data.file_id}: {e}")
+            existing_ids = None
+
+        task = asyncio.ensure_future(
+            run_in_threadpool(_process_queued_file, self.request, form_data, user)
+        )
+        while not task.done():
+            # Keeps other processes from reclaiming the job as stale
+            await asyncio.wait({task}, timeout=self.heartbeat_interval)
+            JOB_STORE.heartbeat(job_id)
+
+        error = None
+        try:
+            task.result()
+        except Exception as e:
+            error = getattr(e, "detail", None) or str(e)
+
+        # Only finishes a job that was not cancelled in the meantime
+        if not JOB_STORE.set_job_status(
+            job_id, FAILED if error else COMPLETED, error, only_from=RUNNING
+        ):
+            # Cancelled while processing, drop what was written; a failed
+            # run (e.g. duplicate content) wrote nothing
+            await asyncio.to_thread(
+                _discard_ingested_file,
+                form_data,
+                existing_ids if error is None else None,
+            )
+            JOB_STORE.set_item_status(job_id, form_data.file_id, CANCELLED)
+            log.info(f"Ingestion job {job_id} cancelled")
+        elif error is not None:
+            # process_file already marked the file as failed
+            JOB_STORE.set_item_status(job_id, form_data.file_id, FAILED, error)
+        else:
+            JOB_STORE.set_item_status(job_id, form_data.file_id, COMPLETED)
+            log.info(f"Ingestion job {job_id} completed")
+
+
+INGESTION_QUEUE = IngestionQueue(
+    workers=RAG_INGESTION_WORKERS,
+    poll_interval=RAG_INGESTION_POLL_INTERVAL,
+    stale_after=RAG_INGESTION_STALE_SECONDS,
+)
+
+
+def _get_ingestion_job(job_id: str, user) -> dict:
+    job = JOB_STORE.get_job(job_id)
+    if (
+        job is None
+        or job["kind"] != INGESTION_JOB_KIND
+        or (user.role != "admin" and job["params"]["user"]["id"] != user.id)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
+        )
+
+    form = job.pop("params")["form"]
+    return {
+        **{
+            key: job[key]
+            for key in (
+                "id",
+                "status",
+                "error",
+                "created_at",
+                "started_at",
+                "updated_at",
+                "finished_at",
+            )
+        },
+        "file_id": form["file_id"],
+        "collection_name": form.get("collection_name"),
+    }
+
+
+@router.post("/process/file/queue")
+async def queue_process_file(
+    request: Request,
+    form_data: ProcessFileForm,
+    user=Depends(get_verified_user),
+    db: Session = Depends(get_session),
+):
+    """
+    Queue a file for processing and return its ingestion job immediately.
+
+    The file status moves through pending, processing and then completed,
+    failed or cancelled; the job is polled with /process/jobs/{job_id}.
+    """
+    if user.role == "admin":
+        file = _files().get_file_by_id(form_data.file_id, db=db)
+    else:
+        file = _files().get_file_by_id_and_user_id(form_data.file_id, user.id, db=db)
+
+    if not file:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
+        )
+
+    _files().update_file_data_by_id(file.id, {"status": "pending"}, db=db)
+    job_id = INGESTION_QUEUE.enqueue(form_data, user)
+    # No-op once the lifespan started the workers; covers host apps that do
+    # not run router lifespans
+    INGESTION_QUEUE.start(request.app)
+    return _get_ingestion_job(job_id, user)
+
+
+@router.get("/process/jobs/{job_id}")
+async def get_process_job(
+    request: Request, job_id: str, user=Depends(get_verified_user)
+):
+    return _get_ingestion_job(job_id, user)
+
+
+@router.post("/process/jobs/{job_id}/cancel")
+async def cancel_process_job(
+    request: Request, job_id: str, user=Depends(get_verified_user)
+):
+    job = _get_ingestion_job(job_id, user)
+    if JOB_STORE.cancel_job(job_id) == PENDING:
+        # Never picked up, nothing to roll back
+        await asyncio.to_thread(_set_file_status, job["file_id"], "cancelled")
+    # A running job is rolled back by its worker once process_file returns
+    return _get_ingestion_job(job_id, user)
+
+
 class ProcessTextForm(BaseModel):
     name: str
     content: str
@@ -2419,8 +2904,8 @@ async def query_doc_handler(
             form_data.hybrid is None or form_data.hybrid
         ):
             collection_results = {}
-            collection_results[form_data.collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=form_data.collection_name
+            collection_results[form_data.collection_name] = (
+                await VECTOR_DB_CLIENT.aget(collection_name=form_data.collection_name)
             )
             return await query_doc_with_hybrid_search(
                 collection_name=form_data.collection_name,
@@ -2431,11 +2916,7 @@ async def query_doc_handler(
                 ),
                 k=form_data.k if form_data.k else request.app.state.config.TOP_K,
                 reranking_function=(
-                    (
-                        lambda query, documents: request.app.state.RERANKING_FUNCTION(
-                            query, documents, user=user
-                        )
-                    )
+                    functools.partial(request.app.state.RERANKING_FUNCTION, user=user)
                     if request.app.state.RERANKING_FUNCTION
                     else None
                 ),
@@ -2457,7 +2938,7 @@ async def query_doc_handler(
             query_embedding = await request.app.state.EMBEDDING_FUNCTION(
                 form_data.query, prefix=RAG_EMBEDDING_QUERY_PREFIX, user=user
             )
-            return query_doc(
+            return await aquery_doc(
                 collection_name=form_data.collection_name,
                 query_embedding=query_embedding,
                 k=form_data.k if form_data.k else request.app.state.config.TOP_K,
@@ -2500,11 +2981,7 @@ async def query_collection_handler(
                 ),
                 k=form_data.k if form_data.k else request.app.state.config.TOP_K,
                 reranking_function=(
-                    (
-                        lambda query, documents: request.app.state.RERANKING_FUNCTION(
-                            query, documents, user=user
-                        )
-                    )
+                    functools.partial(request.app.state.RERANKING_FUNCTION, user=user)
                     if request.app.state.RERANKING_FUNCTION
                     else None
                 ),
@@ -2525,6 +3002,7 @@ async def query_collection_handler(
                     if form_data.enable_enriched_texts is not None
                     else request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS
                 ),
+                model_params=get_model_cache_params(request.app.state.config),
             )
         else:
             return await query_collection(
@@ -2534,6 +3012,7 @@ async def query_collection_handler(
                     query, prefix=prefix, user=user
                 ),
                 k=form_data.k if form_data.k else request.app.state.config.TOP_K,
+                model_params=get_model_cache_params(request.app.state.config),
             )
 
     except Exception as e:
@@ -2576,6 +3055,7 @@ def delete_entries_from_collection(
                 collection_name=form_data.collection_name,
                 metadata={"hash": hash},
             )
+            BM25_INDEX.delete(form_data.collection_name, filter={"hash": hash})
             return {"status": True}
         else:
             return {"status": False}
@@ -2587,6 +3067,7 @@ def delete_entries_from_collection(
 @router.post("/reset/db")
 def reset_vector_db(user=Depends(get_admin_user), db: Session = Depends(get_session)):
     VECTOR_DB_CLIENT.reset()
+    BM25_INDEX.reset()
     Knowledges.delete_all_knowledge(db=db)
 
 
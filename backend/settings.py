@@ -56,6 +56,126 @@ RAG_RERANKING_MODEL_TRUST_REMOTE_CODE = (
     os.environ.get("RAG_RERANKING_MODEL_TRUST_REMOTE_CODE", "True").lower() == "true"
 )
 
+# Length-bucketed CrossEncoder batching (forward pass batch size in pairs)
+RAG_RERANKING_LENGTH_BUCKETING = (
+    os.environ.get("RAG_RERANKING_LENGTH_BUCKETING", "True").lower() == "true"
+)
+RAG_RERANKING_BATCH_SIZE = int(os.environ.get("RAG_RERANKING_BATCH_SIZE", "32"))
+
+# Micro-batching of concurrent local CrossEncoder calls (wait 0 disables)
+RAG_RERANKING_BATCH_WAIT_MS = float(os.environ.get("RAG_RERANKING_BATCH_WAIT_MS", "5"))
+RAG_RERANKING_BATCH_MAX_SIZE = int(os.environ.get("RAG_RERANKING_BATCH_MAX_SIZE", "64"))
+
+# Precomputed ColBERT document token embeddings, one subdirectory per model;
+# least recently used matrices are compacted away past the size (0 = unbounded)
+RAG_COLBERT_INDEX_DIR = os.environ.get(
+    "RAG_COLBERT_INDEX_DIR", f"{DATA_DIR}/colbert_index"
+)
+RAG_COLBERT_INDEX_SIZE_MB = int(os.environ.get("RAG_COLBERT_INDEX_SIZE_MB", "2048"))
+
+# External reranker keep-alive connection pool, timeouts in seconds
+RAG_EXTERNAL_RERANKER_POOL_SIZE = int(
+    os.environ.get("RAG_EXTERNAL_RERANKER_POOL_SIZE", "32")
+)
+RAG_EXTERNAL_RERANKER_CONNECT_TIMEOUT = os.environ.get(
+    "RAG_EXTERNAL_RERANKER_CONNECT_TIMEOUT", ""
+)
+RAG_EXTERNAL_RERANKER_CONNECT_TIMEOUT = (
+    float(RAG_EXTERNAL_RERANKER_CONNECT_TIMEOUT)
+    if RAG_EXTERNAL_RERANKER_CONNECT_TIMEOUT
+    else None
+)
+RAG_EXTERNAL_RERANKER_KEEPALIVE_TIMEOUT = float(
+    os.environ.get("RAG_EXTERNAL_RERANKER_KEEPALIVE_TIMEOUT", "30")
+)
+
+# Hybrid search
+RAG_BM25_INDEX_PATH = os.environ.get(
+    "RAG_BM25_INDEX_PATH", f"{DATA_DIR}/bm25_index.db"
+)
+RAG_BM25_K1 = float(os.environ.get("RAG_BM25_K1", "1.5"))
+RAG_BM25_B = float(os.environ.get("RAG_BM25_B", "0.75"))
+# Number of collection scoring matrices kept in memory
+RAG_BM25_MATRIX_CACHE_SIZE = int(os.environ.get("RAG_BM25_MATRIX_CACHE_SIZE", "32"))
+
+# Collection snapshot cache (0 disables), TTL in seconds (0 means no expiry)
+RAG_COLLECTION_SNAPSHOT_CACHE_SIZE_MB = int(
+    os.environ.get("RAG_COLLECTION_SNAPSHOT_CACHE_SIZE_MB", "256")
+)
+RAG_COLLECTION_SNAPSHOT_CACHE_TTL = int(
+    os.environ.get("RAG_COLLECTION_SNAPSHOT_CACHE_TTL", "300")
+)
+# Collection write versions shared by all server processes (cache invalidation)
+RAG_COLLECTION_VERSIONS_PATH = os.environ.get(
+    "RAG_COLLECTION_VERSIONS_PATH", f"{DATA_DIR}/collection_versions.db"
+)
+
+# Attached items (files, knowledge bases, ...) resolved and searched concurrently
+RAG_SOURCES_MAX_CONCURRENCY = int(os.environ.get("RAG_SOURCES_MAX_CONCURRENCY", "8"))
+
+# Rerank the candidates of all collections in one pooled pass per query
+RAG_HYBRID_POOLED_RERANK = (
+    os.environ.get("RAG_HYBRID_POOLED_RERANK", "False").lower() == "true"
+)
+# Pooled candidates sent to the reranker (0 means 2 * top_k)
+RAG_HYBRID_POOLED_RERANK_TOP_M = int(
+    os.environ.get("RAG_HYBRID_POOLED_RERANK_TOP_M", "0")
+)
+
+# Cascade reranking: only the top M candidates by vector similarity reach
+# the reranking model (0 disables)
+RAG_RERANK_PREFILTER_TOP_M = int(os.environ.get("RAG_RERANK_PREFILTER_TOP_M", "0"))
+
+# Adaptive rerank depth: candidates sent to the reranker are picked per query
+# from the fused score distribution, between min and max (0 means all)
+RAG_RERANK_ADAPTIVE_DEPTH = (
+    os.environ.get("RAG_RERANK_ADAPTIVE_DEPTH", "False").lower() == "true"
+)
+RAG_RERANK_ADAPTIVE_MIN_DEPTH = int(
+    os.environ.get("RAG_RERANK_ADAPTIVE_MIN_DEPTH", "5")
+)
+RAG_RERANK_ADAPTIVE_MAX_DEPTH = int(
+    os.environ.get("RAG_RERANK_ADAPTIVE_MAX_DEPTH", "0")
+)
+# Score drop (fraction of the fused score range) that ends the rerank depth
+RAG_RERANK_ADAPTIVE_GAP = float(os.environ.get("RAG_RERANK_ADAPTIVE_GAP", "0.25"))
+
+# Rerank score cache in (model, query, chunk) entries (0 disables), TTL in seconds
+RAG_RERANK_SCORE_CACHE_SIZE = int(os.environ.get("RAG_RERANK_SCORE_CACHE_SIZE", "50000"))
+RAG_RERANK_SCORE_CACHE_TTL = int(os.environ.get("RAG_RERANK_SCORE_CACHE_TTL", "3600"))
+
+# Query embedding cache in (engine, model, prefix, text) entries (0 disables), TTL in seconds
+RAG_QUERY_EMBEDDING_CACHE_SIZE = int(os.environ.get("RAG_QUERY_EMBEDDING_CACHE_SIZE", "1000"))
+RAG_QUERY_EMBEDDING_CACHE_TTL = int(os.environ.get("RAG_QUERY_EMBEDDING_CACHE_TTL", "3600"))
+
+# Persistent chunk embedding store for ingestion (0 disables)
+RAG_CHUNK_EMBEDDING_CACHE_SIZE_MB = int(
+    os.environ.get("RAG_CHUNK_EMBEDDING_CACHE_SIZE_MB", "1024")
+)
+RAG_CHUNK_EMBEDDING_CACHE_PATH = os.environ.get(
+    "RAG_CHUNK_EMBEDDING_CACHE_PATH", f"{DATA_DIR}/chunk_embeddings.db"
+)
+
+# Background jobs: checkpoint store, knowledge reindex file concurrency and
+# seconds without heartbeat before a running reindex is taken over
+RAG_JOBS_DB_PATH = os.environ.get("RAG_JOBS_DB_PATH", f"{DATA_DIR}/jobs.db")
+RAG_REINDEX_CONCURRENCY = int(os.environ.get("RAG_REINDEX_CONCURRENCY", "4"))
+RAG_REINDEX_STALE_SECONDS = int(os.environ.get("RAG_REINDEX_STALE_SECONDS", "600"))
+
+# Background ingestion queue (/process/file/queue): workers per process, idle
+# poll interval and seconds without heartbeat before a running job is reclaimed
+RAG_INGESTION_WORKERS = int(os.environ.get("RAG_INGESTION_WORKERS", "2"))
+RAG_INGESTION_POLL_INTERVAL = float(os.environ.get("RAG_INGESTION_POLL_INTERVAL", "2"))
+RAG_INGESTION_STALE_SECONDS = int(os.environ.get("RAG_INGESTION_STALE_SECONDS", "600"))
+
+# Query result cache for vector and hybrid retrieval: "memory", "disk" or empty to disable
+RAG_QUERY_RESULT_CACHE = os.environ.get("RAG_QUERY_RESULT_CACHE", "").lower()
+RAG_QUERY_RESULT_CACHE_SIZE = int(os.environ.get("RAG_QUERY_RESULT_CACHE_SIZE", "1000"))
+RAG_QUERY_RESULT_CACHE_TTL = int(os.environ.get("RAG_QUERY_RESULT_CACHE_TTL", "300"))
+RAG_QUERY_RESULT_CACHE_PATH = os.environ.get(
+    "RAG_QUERY_RESULT_CACHE_PATH", f"{DATA_DIR}/query_result_cache.db"
+)
+
 VECTOR_DB = os.environ.get("VECTOR_DB", "chroma")
 
 # Chroma
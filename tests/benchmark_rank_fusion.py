@@ -0,0 +1,144 @@
+"""
+Microbenchmark: native rank fusion vs the langchain retriever stack.
+
+Compares the per-query overhead of fusing BM25 and vector candidates and
+applying the rerank cut through EnsembleRetriever + RerankCompressor +
+ContextualCompressionRetriever against backend/retrieval/fusion.py feeding
+RerankCompressor.arerank. Both sides use static candidate lists and a
+constant-time reranker, so only the plumbing is measured.
+
+Usage: python3 tests/benchmark_rank_fusion.py [candidates] [iterations]
+"""
+
+import asyncio
+import importlib
+import os
+import sys
+import time
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if "rag_system" not in sys.modules:
+    rag_system = types.ModuleType("rag_system")
+    rag_system.__path__ = [str(ROOT)]
+    sys.modules["rag_system"] = rag_system
+    sys.modules["rag_system.backend"] = importlib.import_module("backend")
+
+from langchain_classic.retrievers import (  # noqa: E402
+    ContextualCompressionRetriever,
+    EnsembleRetriever,
+)
+from langchain_core.documents import Document  # noqa: E402
+from langchain_core.retrievers import BaseRetriever  # noqa: E402
+
+from rag_system.backend.retrieval.fusion import fuse_results  # noqa: E402
+from rag_system.backend.retrieval.vector.main import GetResult  # noqa: E402
+
+
+class StaticRetriever(BaseRetriever):
+    documents: list
+
+    def _get_relevant_documents(self, query, *, run_manager):
+        # Fresh copies, as real retrievers build new Documents per call
+        return [
+            Document(page_content=doc.page_content, metadata={**doc.metadata})
+            for doc in self.documents
+        ]
+
+
+def make_candidates(n: int, offset: int) -> GetResult:
+    ids = [f"chunk-{i + offset}" for i in range(n)]
+    return GetResult(
+        ids=[ids],
+        documents=[[f"text of {doc_id} " * 20 for doc_id in ids]],
+        metadatas=[
+            [
+                {"file_id": "f", "name": "report.pdf", "source": "report.pdf"}
+                for _ in ids
+            ]
+        ],
+    )
+
+
+def rerank(query, documents, user=None):
+    return [1.0 / (idx + 1) for idx in range(len(documents))]
+
+
+async def run_langchain(compressor_cls, bm25, vector, iterations, k):
+    def to_docs(result):
+        return [
+            Document(page_content=text, metadata=metadata)
+            for text, metadata in zip(result.documents[0], result.metadatas[0])
+        ]
+
+    ensemble = EnsembleRetriever(
+        retrievers=[
+            StaticRetriever(documents=to_docs(bm25)),
+            StaticRetriever(documents=to_docs(vector)),
+        ],
+        weights=[0.5, 0.5],
+    )
+    retriever = ContextualCompressionRetriever(
+        base_compressor=compressor_cls(
+            embedding_function=None, top_n=k, reranking_function=rerank, r_score=0.0
+        ),
+        base_retriever=ensemble,
+    )
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = await retriever.ainvoke("query")
+        [d.metadata.get("score") for d in result]
+        [d.page_content for d in result]
+        [d.metadata for d in result]
+    return time.perf_counter() - start
+
+
+async def run_native(compressor_cls, bm25, vector, iterations, k):
+    compressor = compressor_cls(
+        embedding_function=None, top_n=k, reranking_function=rerank, r_score=0.0
+    )
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        candidates = fuse_results([bm25, vector], [0.5, 0.5])
+        ranked = await compressor.arerank("query", candidates.documents[0])
+        [score for _, score in ranked]
+        [candidates.documents[0][idx] for idx, _ in ranked]
+        [{**candidates.metadatas[0][idx], "score": score} for idx, score in ranked]
+    return time.perf_counter() - start
+
+
+def main():
+    os.environ.setdefault("DATA_DIR", "/tmp/rag_benchmark")
+    os.makedirs(os.environ["DATA_DIR"], exist_ok=True)
+
+    # RerankCompressor lives next to the retrieval code, which needs a DB
+    from tests.support.app import app  # noqa: F401
+    from rag_system.backend.retrieval.utils import RerankCompressor
+
+    candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    k = 5
+
+    # Half of the vector hits overlap with the BM25 hits
+    bm25 = make_candidates(candidates, 0)
+    vector = make_candidates(candidates, candidates // 2)
+
+    print(f"--- Rank fusion: {candidates} candidates per list, {iterations} queries ---")
+    langchain = asyncio.run(
+        run_langchain(RerankCompressor, bm25, vector, iterations, k)
+    )
+    native = asyncio.run(run_native(RerankCompressor, bm25, vector, iterations, k))
+
+    print(f"langchain stack: {langchain / iterations * 1e6:9.1f} us/query")
+    print(f"native fusion:   {native / iterations * 1e6:9.1f} us/query")
+    print(f"speedup:         {langchain / native:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
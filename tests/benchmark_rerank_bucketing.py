@@ -0,0 +1,92 @@
+"""
+Microbenchmark: plain vs length-bucketed CrossEncoder reranking.
+
+Scores candidate lists with a realistic length skew (mostly short chunks,
+a tail of long ones) through CrossEncoder.predict directly and through
+backend/retrieval/models/bucketing.py, at typical k_reranker depths, and
+reports latency and the largest score difference between the two.
+
+Requires sentence-transformers and the reranking model.
+
+Usage: python3 tests/benchmark_rerank_bucketing.py [model] [iterations]
+"""
+
+import importlib
+import random
+import sys
+import time
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if "rag_system" not in sys.modules:
+    rag_system = types.ModuleType("rag_system")
+    rag_system.__path__ = [str(ROOT)]
+    sys.modules["rag_system"] = rag_system
+    sys.modules["rag_system.backend"] = importlib.import_module("backend")
+
+from rag_system.backend.retrieval.models.bucketing import (  # noqa: E402
+    LengthBucketedReranker,
+)
+
+WORDS = (
+    "retrieval augmented generation ranks candidate passages by relevance "
+    "to the question before the language model reads them quarterly report "
+    "revenue growth customer churn latency budget deployment region"
+).split()
+
+
+def make_pairs(k: int, seed: int = 0) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(k):
+        # ~80% short chunks, ~20% long ones past the model's max length
+        words = rng.randint(20, 120) if rng.random() < 0.8 else rng.randint(300, 900)
+        pairs.append(
+            (
+                "how did revenue growth affect customer churn",
+                " ".join(rng.choice(WORDS) for _ in range(words)),
+            )
+        )
+    return pairs
+
+
+def timed(predict, pairs, iterations):
+    predict(pairs)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        scores = predict(pairs)
+    return (time.perf_counter() - start) / iterations, scores
+
+
+def main():
+    from sentence_transformers import CrossEncoder
+
+    model_name = sys.argv[1] if len(sys.argv) > 1 else "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    model = CrossEncoder(model_name)
+    bucketed = LengthBucketedReranker(model, batch_size=32)
+
+    print(f"--- Rerank batching: {model_name}, {iterations} iterations ---")
+    print(f"{'k_reranker':>10} {'plain ms':>10} {'bucketed ms':>12} {'speedup':>8} {'max diff':>9}")
+    for k in (10, 25, 50, 100):
+        pairs = make_pairs(k)
+        plain, plain_scores = timed(
+            lambda p: model.predict(p, batch_size=32, show_progress_bar=False),
+            pairs,
+            iterations,
+        )
+        fast, fast_scores = timed(bucketed.predict, pairs, iterations)
+        diff = max(abs(float(a) - b) for a, b in zip(plain_scores, fast_scores))
+        print(
+            f"{k:>10} {plain * 1e3:>10.1f} {fast * 1e3:>12.1f} "
+            f"{plain / fast:>7.1f}x {diff:>9.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
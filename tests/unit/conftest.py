@@ -0,0 +1,36 @@
+import importlib
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Keep the module-level stores (BM25 index, caches, jobs) out of backend/data
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="rag-unit-"))
+
+if "rag_system" not in sys.modules:
+    rag_system = types.ModuleType("rag_system")
+    rag_system.__path__ = [str(ROOT)]
+    sys.modules["rag_system"] = rag_system
+    sys.modules["rag_system.backend"] = importlib.import_module("backend")
+
+
+class FakeClock:
+    """Clock advanced by hand, for stores and caches that take a clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
@@ -0,0 +1,30 @@
+import pytest
+
+from rag_system.backend.retrieval.fusion import get_adaptive_depth
+
+
+def test_adaptive_depth_stays_shallow_for_peaked_scores():
+    scores = [1.0, 0.95, 0.2, 0.2, 0.19, 0.19, 0.18, 0.18, 0.17, 0.17]
+    assert get_adaptive_depth(scores, min_depth=2, max_depth=10) == 2
+
+
+def test_adaptive_depth_goes_deep_for_flat_scores():
+    scores = [1.0 - 0.01 * idx for idx in range(10)]
+    depth = get_adaptive_depth(scores, min_depth=2, max_depth=10)
+    assert 2 < depth <= 10
+
+
+def test_adaptive_depth_reranks_all_without_signal():
+    assert get_adaptive_depth([0.5] * 6, min_depth=2, max_depth=5) == 5
+
+
+@pytest.mark.parametrize(
+    "scores, min_depth, max_depth, expected",
+    [
+        ([1.0, 0.5], 5, 0, 2),
+        ([1.0, 0.5, 0.2], 0, 1, 1),
+        ([], 3, 10, 0),
+    ],
+)
+def test_adaptive_depth_bounds(scores, min_depth, max_depth, expected):
+    assert get_adaptive_depth(scores, min_depth, max_depth) == expected
@@ -0,0 +1,85 @@
+import pytest
+
+from rag_system.backend.retrieval.result_cache import (
+    DiskResultCacheBackend,
+    MemoryResultCacheBackend,
+    QueryResultCache,
+)
+from rag_system.backend.retrieval.vector.cache import CollectionVersionStore
+
+
+RESULT = {"distances": [[0.9]], "documents": [["doc"]], "metadatas": [[{}]]}
+
+
+@pytest.fixture(params=["memory", "disk"])
+def result_cache_backend(request, tmp_path, clock):
+    if request.param == "memory":
+        return MemoryResultCacheBackend(max_entries=2)
+    return DiskResultCacheBackend(
+        str(tmp_path / "results.db"), max_entries=2, clock=clock
+    )
+
+
+def test_query_result_cache_hit_and_version_bump_miss(result_cache_backend, tmp_path):
+    cache = QueryResultCache(result_cache_backend)
+    versions = CollectionVersionStore(str(tmp_path / "versions.db"))
+
+    def get_key():
+        return cache.get_key("vector", ["q"], ["kb"], [versions.get("kb")], {"k": 3})
+
+    cache.set(get_key(), RESULT)
+    assert cache.get(get_key()) == RESULT
+
+    versions.bump("kb")
+    assert cache.get(get_key()) is None
+
+    cache.set(get_key(), RESULT)
+    versions.bump_all()
+    assert cache.get(get_key()) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_query_result_cache_keys_normalize_queries():
+    cache = QueryResultCache(MemoryResultCacheBackend(max_entries=10))
+    key = cache.get_key("vector", ["What is RAG?", "b"], ["kb"], [1], {"k": 3})
+
+    # Order and whitespace do not matter, case and parameters do
+    assert key == cache.get_key("vector", ["b", " What is  RAG?"], ["kb"], [1], {"k": 3})
+    assert key != cache.get_key("vector", ["b", "what is RAG?"], ["kb"], [1], {"k": 3})
+    assert key != cache.get_key("vector", ["b", "What is RAG?"], ["kb"], [1], {"k": 4})
+
+
+def test_query_result_cache_ttl_expiry(result_cache_backend, clock):
+    cache = QueryResultCache(result_cache_backend, ttl=60, clock=clock)
+
+    cache.set("key", RESULT)
+    clock.now += 59
+    assert cache.get("key") == RESULT
+
+    clock.now += 2
+    assert cache.get("key") is None
+    assert len(result_cache_backend) == 0
+
+
+def test_query_result_cache_lru_eviction(result_cache_backend, clock):
+    cache = QueryResultCache(result_cache_backend, clock=clock)
+
+    for key in ("a", "b"):
+        clock.now += 1
+        cache.set(key, RESULT)
+    clock.now += 1
+    assert cache.get("a") == RESULT
+
+    clock.now += 1
+    cache.set("c", RESULT)
+    assert cache.get("b") is None
+    assert cache.get("a") == RESULT
+    assert cache.get("c") == RESULT
+
+
+def test_disk_result_cache_is_shared(tmp_path):
+    path = str(tmp_path / "results.db")
+    QueryResultCache(DiskResultCacheBackend(path, max_entries=10)).set("key", RESULT)
+
+    # A second process (or a restart) opening the same file sees the entry
+    assert QueryResultCache(DiskResultCacheBackend(path, max_entries=10)).get("key") == RESULT
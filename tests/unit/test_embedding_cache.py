@@ -0,0 +1,109 @@
+import asyncio
+
+import numpy as np
+
+from rag_system.backend.retrieval.embedding_cache import (
+    ChunkEmbeddingStore,
+    QueryEmbeddingCache,
+    wrap_embedding_function,
+)
+
+
+class RecordingEmbedder:
+    """Async embedding function that records every batch it is asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, query, prefix=None, user=None):
+        self.calls.append(query)
+        if isinstance(query, str):
+            return self.embed(query)
+        return [self.embed(text) for text in query]
+
+    @staticmethod
+    def embed(text: str) -> list[float]:
+        return [float(len(text)), float(sum(map(ord, text)) % 97)]
+
+
+def test_query_embedding_cache_ttl_and_lru(clock):
+    cache = QueryEmbeddingCache(max_entries=2, ttl=60, clock=clock)
+
+    cache.set_many(["a", "b"], [[1.0], [2.0]])
+    assert cache.get_many(["a"]) == [[1.0]]
+
+    cache.set_many(["c"], [[3.0]])
+    assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+    clock.now += 61
+    assert cache.get_many(["a", "c"]) == [None, None]
+    assert cache.stats()["entries"] == 0
+
+
+def test_wrap_embedding_function_batches_partial_misses():
+    cache = QueryEmbeddingCache(max_entries=100)
+    embedder = RecordingEmbedder()
+    wrapped = wrap_embedding_function(
+        cache, lambda prefix, text: (prefix, text), embedder
+    )
+
+    first = asyncio.run(wrapped(["a", "bb", "a"], prefix="p"))
+    assert embedder.calls == [["a", "bb"]]
+    assert first == [embedder.embed(text) for text in ("a", "bb", "a")]
+
+    # Only the uncached text is embedded, in one batch, results stay in order
+    second = asyncio.run(wrapped(["bb", "ccc", "a"], prefix="p"))
+    assert embedder.calls[-1] == ["ccc"]
+    assert second == [embedder.embed(text) for text in ("bb", "ccc", "a")]
+
+    # Fully cached single texts never reach the backend
+    assert asyncio.run(wrapped("ccc", prefix="p")) == embedder.embed("ccc")
+    assert len(embedder.calls) == 2
+
+    # The prefix is part of the key
+    asyncio.run(wrapped("ccc", prefix="other"))
+    assert embedder.calls[-1] == "ccc"
+
+
+def test_wrap_embedding_function_does_not_cache_failures():
+    cache = QueryEmbeddingCache(max_entries=100)
+
+    async def failing(query, prefix=None, user=None):
+        return None
+
+    wrapped = wrap_embedding_function(cache, lambda prefix, text: text, failing)
+    assert asyncio.run(wrapped(["a", "b"])) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_chunk_embedding_store_roundtrip_is_exact(tmp_path):
+    store = ChunkEmbeddingStore(str(tmp_path / "chunks.db"), max_bytes=1 << 20)
+    vector = np.random.default_rng(0).standard_normal(8).astype(np.float32).tolist()
+
+    store.set_many(["k"], [vector])
+    assert store.get_many(["k", "missing"]) == [vector, None]
+
+    # Reopened from disk
+    reopened = ChunkEmbeddingStore(str(tmp_path / "chunks.db"), max_bytes=1 << 20)
+    assert reopened.get_many(["k"]) == [vector]
+
+
+def test_chunk_embedding_store_byte_eviction(tmp_path, clock):
+    # Four 4-dimensional float32 vectors fit, a fifth exceeds the budget
+    store = ChunkEmbeddingStore(
+        str(tmp_path / "chunks.db"), max_bytes=4 * 16, clock=clock
+    )
+
+    for idx in range(4):
+        clock.now += 1
+        store.set_many([f"k{idx}"], [[float(idx)] * 4])
+    clock.now += 1
+    store.get_many(["k0"])
+
+    clock.now += 1
+    store.set_many(["k4"], [[4.0] * 4])
+
+    stats = store.stats()
+    assert stats["bytes"] <= 0.9 * store.max_bytes
+    assert store.get_many(["k1"]) == [None]
+    assert store.get_many(["k0", "k4"]) == [[0.0] * 4, [4.0] * 4]
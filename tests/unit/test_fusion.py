@@ -0,0 +1,76 @@
+import pytest
+
+from rag_system.backend.retrieval.fusion import (
+    RRF_C,
+    fuse_results,
+    weighted_rrf,
+)
+from rag_system.backend.retrieval.vector.main import GetResult, SearchResult
+
+
+def _result(ids, vectors=None):
+    return GetResult(
+        ids=[ids],
+        documents=[[f"doc {doc_id}" for doc_id in ids]],
+        metadatas=[[{"id": doc_id} for doc_id in ids]],
+        vectors=[vectors] if vectors is not None else None,
+    )
+
+
+def test_weighted_rrf_sums_scores_of_shared_ids():
+    ids, scores, origins = weighted_rrf([["a", "b"], ["b", "c"]], [0.5, 0.5])
+
+    assert ids == ["b", "a", "c"]
+    assert scores[0] == pytest.approx(0.5 / (2 + RRF_C) + 0.5 / (1 + RRF_C))
+    assert scores[1] == pytest.approx(0.5 / (1 + RRF_C))
+    # Payload comes from where each id was first seen
+    assert origins == [(0, 1), (0, 0), (1, 1)]
+
+
+def test_weighted_rrf_applies_weights():
+    ids, _, _ = weighted_rrf([["a"], ["b"]], [0.2, 0.8])
+    assert ids == ["b", "a"]
+
+    ids, _, _ = weighted_rrf([["a"], ["b"]], [0.8, 0.2])
+    assert ids == ["a", "b"]
+
+
+def test_weighted_rrf_skips_zero_weight_rankings():
+    ids, _, origins = weighted_rrf([["a", "b"], ["c"]], [1.0, 0.0])
+    assert ids == ["a", "b"]
+    assert origins == [(0, 0), (0, 1)]
+
+
+def test_weighted_rrf_keeps_first_seen_order_on_ties():
+    ids, _, _ = weighted_rrf([["a"], ["b"]], [0.5, 0.5])
+    assert ids == ["a", "b"]
+
+
+def test_fuse_results_dedups_by_id():
+    fused = fuse_results(
+        [_result(["a", "b", "c"]), _result(["c", "a", "d"])], [0.5, 0.5]
+    )
+
+    assert isinstance(fused, SearchResult)
+    assert sorted(fused.ids[0]) == ["a", "b", "c", "d"]
+    assert fused.ids[0][:2] == ["a", "c"]
+    assert fused.documents[0] == [f"doc {doc_id}" for doc_id in fused.ids[0]]
+    assert fused.metadatas[0] == [{"id": doc_id} for doc_id in fused.ids[0]]
+    assert fused.distances[0] == sorted(fused.distances[0], reverse=True)
+    assert fused.vectors is None
+
+
+def test_fuse_results_limit_and_missing_inputs():
+    fused = fuse_results([None, _result(["a", "b", "c"])], [0.5, 0.5], limit=2)
+    assert fused.ids == [["a", "b"]]
+
+
+def test_fuse_results_carries_vectors():
+    fused = fuse_results(
+        [_result(["a"]), _result(["b", "a"], vectors=[[1.0], [2.0]])], [0.7, 0.3]
+    )
+
+    assert fused.ids == [["a", "b"]]
+    # "a" was first seen in the input without vectors
+    assert fused.vectors == [[None, [1.0]]]
+
@@ -0,0 +1,139 @@
+import pytest
+
+from rag_system.backend.retrieval.jobs import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    PENDING,
+    RUNNING,
+    JobStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    return JobStore(str(tmp_path / "jobs.db"), clock=clock)
+
+
+def create_job(store, clock, kind="ingest", items=(("item", {}),), params=None):
+    # Distinct creation times keep the claim order deterministic
+    clock.now += 1
+    return store.create_job(kind, list(items), params=params)
+
+
+def test_claim_oldest_pending_job_once(store, clock):
+    first = create_job(store, clock, params={"n": 1})
+    second = create_job(store, clock)
+    create_job(store, clock, kind="other")
+
+    job = store.claim_job("ingest")
+    assert (job["id"], job["status"], job["params"]) == (first, RUNNING, {"n": 1})
+    assert job["started_at"] == clock.now
+
+    assert store.claim_job("ingest")["id"] == second
+    assert store.claim_job("ingest") is None
+
+
+def test_claim_shared_between_store_instances(tmp_path, clock):
+    path = str(tmp_path / "jobs.db")
+    job_id = create_job(JobStore(path, clock=clock), clock)
+
+    # Two processes opening the same store never claim the same job
+    claims = [
+        JobStore(path, clock=clock).claim_job("ingest"),
+        JobStore(path, clock=clock).claim_job("ingest"),
+    ]
+    assert [job and job["id"] for job in claims] == [job_id, None]
+
+
+def test_stale_running_job_is_reclaimed(store, clock):
+    job_id = create_job(store, clock)
+    started_at = store.claim_job("ingest", stale_after=60)["started_at"]
+
+    clock.now += 59
+    assert store.claim_job("ingest", stale_after=60) is None
+
+    # A heartbeat keeps the job with its worker
+    store.heartbeat(job_id)
+    clock.now += 59
+    assert store.claim_job("ingest", stale_after=60) is None
+
+    clock.now += 2
+    job = store.claim_job("ingest", stale_after=60)
+    assert (job["id"], job["status"]) == (job_id, RUNNING)
+    assert job["started_at"] == started_at
+    assert job["updated_at"] == clock.now
+
+    # Without stale_after a running job is never taken over
+    clock.now += 1000
+    assert store.claim_job("ingest") is None
+
+
+def test_cancel_job(store, clock):
+    pending = create_job(store, clock, items=[("a", {}), ("b", {})])
+    assert store.cancel_job(pending) == PENDING
+    job = store.get_job(pending)
+    assert job["status"] == CANCELLED
+    assert job["finished_at"] == clock.now
+    assert job["counts"][CANCELLED] == 2
+
+    # Cancelled jobs are not claimed
+    assert store.claim_job("ingest") is None
+
+    running = create_job(store, clock, items=[("a", {}), ("b", {})])
+    store.claim_job("ingest")
+    store.set_item_status(running, "a", RUNNING)
+    assert store.cancel_job(running) == RUNNING
+    # The running item is left to its worker to roll back
+    assert [item["status"] for item in store.get_items(running)] == [
+        RUNNING,
+        CANCELLED,
+    ]
+
+    # The worker finishing afterwards does not overwrite the cancellation
+    assert not store.set_job_status(running, COMPLETED, only_from=RUNNING)
+    assert store.get_job(running)["status"] == CANCELLED
+
+
+def test_cancel_finished_job_is_noop(store, clock):
+    job_id = create_job(store, clock)
+    store.claim_job("ingest")
+    assert store.set_job_status(job_id, COMPLETED, only_from=RUNNING)
+
+    assert store.cancel_job(job_id) == COMPLETED
+    assert store.get_job(job_id)["status"] == COMPLETED
+    assert store.get_items(job_id)[0]["status"] == PENDING
+    assert store.cancel_job("missing") is None
+
+
+def test_interrupted_reindex_resumes_unfinished_items(store, clock):
+    items = [
+        (f"kb:{idx}", {"knowledge_id": "kb", "file_id": str(idx)}) for idx in range(4)
+    ]
+    job_id = create_job(store, clock, kind="reindex", items=items)
+
+    store.claim_job("reindex", stale_after=60)
+    store.set_item_status(job_id, "kb:0", COMPLETED)
+    store.set_item_status(job_id, "kb:1", FAILED, "boom")
+    store.set_item_status(job_id, "kb:2", RUNNING)
+    # The worker dies here, without heartbeats the job goes stale
+
+    clock.now += 61
+    job = store.claim_job("reindex", stale_after=60)
+    assert job["id"] == job_id
+    assert job["counts"] == {
+        PENDING: 1,
+        RUNNING: 1,
+        COMPLETED: 1,
+        FAILED: 1,
+        CANCELLED: 0,
+    }
+
+    # Only the unfinished items are processed again, in their original order
+    resumed = store.get_items(job_id, statuses=(PENDING, RUNNING))
+    assert [(item["item_id"], item["status"]) for item in resumed] == [
+        ("kb:2", RUNNING),
+        ("kb:3", PENDING),
+    ]
+    assert resumed[0]["payload"] == {"knowledge_id": "kb", "file_id": "2"}
+    assert store.get_items(job_id, statuses=(FAILED,))[0]["error"] == "boom"